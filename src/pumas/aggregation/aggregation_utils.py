@@ -1,6 +1,8 @@
 import logging
 import warnings
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from pumas.aggregation.exceptions import (
     AggregationNegativeValuesException,
@@ -238,3 +240,72 @@ def run_data_validation_pipeline(
     check_negative_weights(weights=weights)
     check_negative_values(values=values)
     return values, weights
+
+
+def run_batch_data_validation_pipeline(
+    values: np.ndarray, weights: Optional[Sequence[Any]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run the data validation pipeline on a matrix of values sharing their weights.
+
+    This is the batch counterpart of run_data_validation_pipeline for N rows of
+    K values. The checks are run once for the whole matrix, and instead of
+    filtering out the pairs with null or NaN values or weights, their weights
+    are set to zero in a per-row weights matrix, so that all the rows keep K
+    entries.
+
+    Args:
+        values (np.ndarray): The values to be aggregated, of shape (N, K);
+            None values become NaN.
+        weights (Optional[Sequence[Any]]): The K weights corresponding to the
+            columns of values. If None, weights will be filled with 1.0.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The float values with the null pairs
+        replaced by zero, and the (N, K) weights matrix with zero weights for
+        the null pairs.
+
+    Raises:
+        ValueError: If values is not a two-dimensional array.
+        AggregationValuesToWeightLengthMismatchException: If the number of columns of values and weights don't match.
+        AggregationNegativeWeightsException: If any weight is negative.
+        AggregationNegativeValuesException: If any value is negative.
+
+    Warnings:
+        AggregationNullValuesWarning: If null or NaN values are found in the input.
+        AggregationNullWeightsWarning: If null or NaN weights are found in the input.
+    """  # noqa: E501
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim != 2:
+        raise ValueError("Values must be a two-dimensional array.")
+    num_columns = values.shape[1]
+    if weights is None:
+        weights = [1.0] * num_columns
+    if len(weights) != num_columns:
+        raise AggregationValuesToWeightLengthMismatchException(
+            "The length of values and weights does not match."
+        )
+    weights = np.array([np.nan if w is None else w for w in weights], dtype=np.float64)
+
+    null_values = np.isnan(values)
+    null_weights = np.isnan(weights)
+    if null_values.any():
+        warn_and_log(
+            category=AggregationNullValuesWarning,
+            message="None or NaN values are not allowed.",
+        )
+    if null_weights.any():
+        warn_and_log(
+            category=AggregationNullWeightsWarning,
+            message="None or NaN weights are not allowed.",
+        )
+
+    if np.any(weights < 0):
+        raise AggregationNegativeWeightsException("All values must be positive.")
+    if np.any(values < 0):
+        raise AggregationNegativeValuesException("All values must be positive.")
+
+    null_pairs = null_values | null_weights
+    weights_matrix = np.where(null_pairs, 0.0, weights)
+    values = np.where(null_pairs, 0.0, values)
+    return values, weights_matrix
@@ -1,5 +1,7 @@
 from abc import abstractmethod
-from typing import List, Optional, Union
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
 
 from pumas.architecture.parametrized_strategy import AbstractParametrizedStrategy
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import UFloat
@@ -21,3 +23,20 @@ class Aggregation(AbstractParametrizedStrategy):
         weights: Optional[List[Union[float, None]]],
     ) -> UFloat:
         """Computes the aggregation of ufloat values with corresponding weights."""
+
+    def compute_numeric_batch(
+        self,
+        values: np.ndarray,
+        weights: Optional[Sequence[Union[float, None]]] = None,
+    ) -> np.ndarray:
+        """
+        Computes the aggregation of each row of a matrix of numeric values.
+
+        This default implementation calls compute_numeric on each row;
+        concrete aggregations override it with a vectorized computation.
+        """
+        rows = np.asarray(values, dtype=np.float64).tolist()
+        return np.array(
+            [self.compute_numeric(values=row, weights=weights) for row in rows],
+            dtype=np.float64,
+        )
@@ -1,8 +1,11 @@
-from typing import List, Optional, Union
+from typing import List, Optional, Sequence, Union
 
 import numpy as np
 
-from pumas.aggregation.aggregation_utils import run_data_validation_pipeline
+from pumas.aggregation.aggregation_utils import (
+    run_batch_data_validation_pipeline,
+    run_data_validation_pipeline,
+)
 from pumas.aggregation.base_models import Aggregation
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import UFloat
 
@@ -25,6 +28,45 @@ def compute_ufloat_weighted_arithmetic_mean(
     return result
 
 
+def compute_array_weighted_arithmetic_mean(
+    values: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Compute the weighted arithmetic mean of each row of a matrix of values.
+
+    Args:
+        values (np.ndarray): The values, of shape (N, K).
+        weights (np.ndarray): The weights, of shape (K,) or (N, K).
+
+    Returns:
+        np.ndarray: The N weighted arithmetic means.
+    """
+    weights = np.broadcast_to(weights, values.shape)
+    weighted_sum = np.einsum("ij,ij->i", values, weights)
+    total_weight = weights.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return weighted_sum / total_weight
+
+
+def compute_array_weighted_arithmetic_mean_gradient(
+    values: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Compute the partial derivatives of the row-wise weighted arithmetic means.
+
+    Args:
+        values (np.ndarray): The values, of shape (N, K).
+        weights (np.ndarray): The weights, of shape (K,) or (N, K).
+
+    Returns:
+        np.ndarray: The derivatives of each mean with respect to each value,
+            of shape (N, K).
+    """
+    weights = np.broadcast_to(weights, values.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return weights / weights.sum(axis=1, keepdims=True)
+
+
 class WeightedArithmeticMeanAggregation(Aggregation):
     """
     Computes the weighted arithmetic mean of a set of values with corresponding weights.
@@ -112,4 +154,30 @@ class WeightedArithmeticMeanAggregation(Aggregation):
             values=new_values, weights=new_weights
         )
 
+    def compute_numeric_batch(
+        self,
+        values: np.ndarray,
+        weights: Optional[Sequence[Union[float, None]]] = None,
+    ) -> np.ndarray:
+        """
+        Compute the weighted arithmetic mean of each row of a matrix of numeric values.
+
+        The rows share the weights; null or NaN values are masked in each row
+        as in compute_numeric.
+
+        Args:
+            values (np.ndarray): The numeric values to be aggregated, of shape (N, K).
+            weights (Optional[Sequence[float]]): The K weights corresponding to the columns.
+                If None, equal weights are assumed.
+
+        Returns:
+            np.ndarray: The N aggregated values.
+        """  # noqa: E501
+        new_values, new_weights = run_batch_data_validation_pipeline(
+            values=values, weights=weights
+        )
+        return compute_array_weighted_arithmetic_mean(
+            values=new_values, weights=new_weights
+        )
+
     __call__ = compute_numeric
@@ -112,6 +112,22 @@ class WeightedDeviationIndexAggregation(Aggregation):
         )
         self._validate_and_set_parameters(params)
 
+    def _on_parameters_update(self) -> None:
+        self._coefficients_ready = False
+
+    def _prepare_coefficients(self) -> None:
+        """
+        Read the ideal value once per parameter set, instead of on every call.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        if self._coefficients_ready:
+            return
+        self._check_parameters_values_none()
+        self._ideal_value: float = self.get_parameters_values()["ideal_value"]
+        self._coefficients_ready = True
+
     def compute_numeric(
         self,
         values: List[Union[float, None]],
@@ -132,9 +148,9 @@ class WeightedDeviationIndexAggregation(Aggregation):
         new_values, new_weights = run_data_validation_pipeline(
             values=values, weights=weights
         )
-        parameters = self.get_parameters_values()
+        self._prepare_coefficients()
         return compute_numeric_weighted_deviation_index(
-            values=new_values, weights=new_weights, **parameters
+            values=new_values, weights=new_weights, ideal_value=self._ideal_value
         )
 
     def compute_ufloat(
@@ -156,9 +172,9 @@ class WeightedDeviationIndexAggregation(Aggregation):
         new_values, new_weights = run_data_validation_pipeline(
             values=values, weights=weights
         )
-        parameters = self.get_parameters_values()
+        self._prepare_coefficients()
         return compute_ufloat_weighted_deviation_index(
-            values=new_values, weights=new_weights, **parameters
+            values=new_values, weights=new_weights, ideal_value=self._ideal_value
         )
 
     __call__ = compute_numeric
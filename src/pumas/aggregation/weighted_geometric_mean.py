@@ -1,8 +1,12 @@
-from typing import List, Optional, Union
+import math
+from typing import List, Optional, Sequence, Union
 
 import numpy as np
 
-from pumas.aggregation.aggregation_utils import run_data_validation_pipeline
+from pumas.aggregation.aggregation_utils import (
+    run_batch_data_validation_pipeline,
+    run_data_validation_pipeline,
+)
 from pumas.aggregation.base_models import Aggregation
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import UFloat
 
@@ -10,23 +14,90 @@ from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import UFl
 def compute_numeric_weighted_geometric_mean(
     values: List[float], weights: Optional[List[float]] = None
 ) -> float:
-    weights = np.array(weights)
-    values = np.array(values)
-    exponents = weights / np.sum(weights)
-    result = np.prod(values**exponents)
-    return float(result)
+    total_weight = sum(weights)  # type: ignore
+    if not total_weight:
+        # Empty or all-zero weights: keep the NumPy semantics of the product
+        exponents = np.array(weights) / np.sum(weights)
+        return float(np.prod(np.array(values) ** exponents))
+
+    # Exponential of the weighted mean of the logarithms, instead of a
+    # product of powers over small arrays
+    log_sum = 0.0
+    for value, weight in zip(values, weights):  # type: ignore
+        if weight == 0:
+            continue
+        if value == 0:
+            return 0.0
+        log_sum += weight * math.log(value)
+    return math.exp(log_sum / total_weight)
 
 
 def compute_ufloat_weighted_geometric_mean(
     values: List[UFloat], weights: Optional[List[float]] = None
 ) -> UFloat:
-    weights = np.array(weights)
-    values = np.array(values)
-    exponents = weights / np.sum(weights)
-    result = np.prod(values**exponents)
+    total_weight = sum(weights)  # type: ignore
+    if not total_weight:
+        # Empty or all-zero weights: keep the NumPy semantics of the product
+        exponents = np.array(weights) / np.sum(weights)
+        return np.prod(np.array(values) ** exponents)  # type: ignore
+
+    # A plain product of the powers, without building object arrays; each
+    # factor is a single UFloat power, so the propagated uncertainty is the
+    # same as with the logarithms, which are no faster on UFloats
+    result = 1.0
+    for value, weight in zip(values, weights):  # type: ignore
+        result = result * value ** (weight / total_weight)
     return result  # type: ignore
 
 
+def compute_array_weighted_geometric_mean(
+    values: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Compute the weighted geometric mean of each row of a matrix of values.
+
+    The products of powers are computed as exponentials of weighted sums of
+    logarithms.
+
+    Args:
+        values (np.ndarray): The values, of shape (N, K).
+        weights (np.ndarray): The weights, of shape (K,) or (N, K).
+
+    Returns:
+        np.ndarray: The N weighted geometric means.
+    """
+    weights = np.broadcast_to(weights, values.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Zero weights contribute a factor of one, even for zero values
+        log_values = np.where(weights == 0, 0.0, np.log(values))
+        result = np.einsum("ij,ij->i", log_values, weights) / weights.sum(axis=1)
+    return np.exp(result)
+
+
+def compute_array_weighted_geometric_mean_gradient(
+    values: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Compute the partial derivatives of the row-wise weighted geometric means.
+
+    The derivative of the mean G of a row with respect to its value x_i is
+    G * w_i / (x_i * sum(w)); it is not defined for zero values.
+
+    Args:
+        values (np.ndarray): The values, of shape (N, K).
+        weights (np.ndarray): The weights, of shape (K,) or (N, K).
+
+    Returns:
+        np.ndarray: The derivatives of each mean with respect to each value,
+            of shape (N, K).
+    """
+    weights = np.broadcast_to(weights, values.shape)
+    result = compute_array_weighted_geometric_mean(values=values, weights=weights)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exponents = weights / weights.sum(axis=1, keepdims=True)
+        return result[:, np.newaxis] * exponents / values
+
+
 class WeightedGeometricMeanAggregation(Aggregation):
     """
     Computes the weighted geometric mean of a set of values with corresponding weights.
@@ -116,4 +187,37 @@ class WeightedGeometricMeanAggregation(Aggregation):
             values=new_values, weights=new_weights
         )
 
+    def compute_numeric_batch(
+        self,
+        values: np.ndarray,
+        weights: Optional[Sequence[Union[float, None]]] = None,
+    ) -> np.ndarray:
+        """
+        Compute the weighted geometric mean of each row of a matrix of numeric values.
+
+        The rows share the weights; null or NaN values are masked in each row
+        as in compute_numeric.
+
+        Args:
+            values (np.ndarray): The numeric values to be aggregated, of shape (N, K).
+            weights (Optional[Sequence[float]]): The K weights corresponding to the columns.
+                If None, equal weights are assumed.
+
+        Returns:
+            np.ndarray: The N aggregated values.
+        """  # noqa: E501
+        new_values, new_weights = run_batch_data_validation_pipeline(
+            values=values, weights=weights
+        )
+        result = compute_array_weighted_geometric_mean(
+            values=new_values, weights=new_weights
+        )
+
+        # Rows without any non-null pair are an empty product, as in compute_numeric
+        null_pairs = np.isnan(np.asarray(values, dtype=np.float64))
+        if weights is not None:
+            null_pairs |= np.isnan(np.asarray(weights, dtype=np.float64))
+        result[null_pairs.all(axis=1)] = 1.0
+        return result
+
     __call__ = compute_numeric
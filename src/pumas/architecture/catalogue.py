@@ -162,9 +162,10 @@ class Catalogue:
         Raises:
             ValueError: If no item with the given name exists in the catalogue.
         """
-        if name not in self._items:
-            raise ValueError(f"Item '{name}' does not exist.")
-        return self._items.get(name)
+        try:
+            return self._items[name]
+        except KeyError:
+            raise ValueError(f"Item '{name}' does not exist.") from None
 
     def list_items(self) -> List[Any]:
         """
@@ -15,9 +15,24 @@ class AbstractParametrizedStrategy(ABC):
     def __init__(self, params: Optional[Dict[str, Any]] = None):
         self.parameter_manager: ParameterManager = ParameterManager()
         self._params = params
+        self._on_parameters_update()
 
         self._check_parameters_values_none()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Only the parameters are pickled: every other instance attribute is
+        # derived from them, and may hold closures or caches that cannot be
+        # pickled, so it is rebuilt on the first computation after unpickling
+        return {
+            name: self.__dict__[name]
+            for name in ("parameter_manager", "_params")
+            if name in self.__dict__
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._on_parameters_update()
+
     @property
     def parameters_map(self) -> Dict[str, Any]:
         return self.parameter_manager.parameters_map
@@ -26,6 +41,7 @@ class AbstractParametrizedStrategy(ABC):
         self, parameter_definitions: Dict[str, Dict[str, Any]]
     ) -> None:
         self.parameter_manager = ParameterManager(parameter_definitions)
+        self._on_parameters_update()
         if self._params:
             self._validate_and_set_parameters(self._params)
 
@@ -45,7 +61,10 @@ class AbstractParametrizedStrategy(ABC):
             )
             return
 
-        self.parameter_manager.set_parameters_values(values_dict=values_dict)
+        try:
+            self.parameter_manager.set_parameters_values(values_dict=values_dict)
+        finally:
+            self._on_parameters_update()
 
     def set_parameters_attributes(
         self, attributes_map: Dict[str, Dict[str, Any]]
@@ -70,13 +89,26 @@ class AbstractParametrizedStrategy(ABC):
                 "Not setting attributes for all parameters", ParameterSettingWarning
             )
 
-        for param_name, attributes in attributes_map.items():
-            try:
-                self.parameter_manager.set_parameter_attributes(param_name, attributes)
-            except Exception as e:
-                raise ParameterSettingError(
-                    f"Error setting attributes for parameter '{param_name}': {str(e)}"
-                )
+        try:
+            for param_name, attributes in attributes_map.items():
+                try:
+                    self.parameter_manager.set_parameter_attributes(
+                        param_name, attributes
+                    )
+                except Exception as e:
+                    raise ParameterSettingError(
+                        f"Error setting attributes for parameter "
+                        f"'{param_name}': {str(e)}"
+                    )
+        finally:
+            self._on_parameters_update()
+
+    def _on_parameters_update(self) -> None:
+        """Hook called every time the parameters values or attributes change.
+
+        Concrete strategies can override it to invalidate any quantity
+        derived from the coefficient parameters.
+        """
 
     def _get_parameter_value(self, name: str) -> Any:
         values = self.get_parameters_values()
@@ -88,6 +120,12 @@ class AbstractParametrizedStrategy(ABC):
     def _validate_compute_input(
         item: Any, expected_type: Union[Type[Any], Tuple[Type[Any], ...]]
     ) -> None:
+        # Exact type matches are the common case and skip the subclass checks
+        item_type = type(item)
+        if item_type is expected_type or (
+            type(expected_type) is tuple and item_type in expected_type
+        ):
+            return
         if not isinstance(item, expected_type):
             raise InvalidInputTypeError(
                 f"Expected {expected_type.__name__ if isinstance(expected_type, type) else expected_type}, "  # noqa: E501
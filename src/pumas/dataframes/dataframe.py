@@ -183,7 +183,19 @@ import warnings
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from functools import partial
-from typing import Any, Callable, Dict, Hashable, List, Literal, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+import numpy as np
 
 from pumas.dataframes.exceptions import (
     ColumnNotFoundError,
@@ -289,6 +301,63 @@ class DataFrame:
             column_metadata_map=column_metadata_map
         )
 
+        self._initialize_index_and_dtypes(index=index, dtypes_map=dtypes_map)
+
+    @classmethod
+    def from_columns(
+        cls,
+        column_data: Mapping[str, Sequence[Any]],
+        column_metadata_map: Dict[Hashable, Dict[Hashable, Any]] = None,
+        dtypes_map: Dict[str, type] = None,
+        index: List[Hashable] = None,
+    ) -> "DataFrame":
+        """
+        Build a DataFrame from column-oriented data.
+
+        The columns are stored as they are given, without building a dict per
+        row; NumPy arrays are converted to lists of Python scalars.
+
+        Args:
+            column_data (Mapping[str, Sequence[Any]]): The values of each column,
+                by column name.
+            column_metadata_map (Dict[Hashable, Dict[Hashable, Any]]):
+                The metadata of each column, by column name.
+            dtypes_map (Dict[str, type]): The dtypes to cast the columns to.
+            index (List[Hashable]): The index values; defaults to a range.
+
+        Returns:
+            DataFrame: The new DataFrame.
+
+        Raises:
+            ValueError: If the columns, or the index, have different lengths.
+        """
+        columns = {
+            column_name: (
+                values.tolist() if isinstance(values, np.ndarray) else list(values)
+            )
+            for column_name, values in column_data.items()
+        }
+        if len({len(values) for values in columns.values()}) > 1:
+            raise ValueError("All columns must have the same length.")
+
+        data_frame = cls.__new__(cls)
+        data_frame.column_map = {
+            column_name: Column(column_index, column_name)
+            for column_index, column_name in enumerate(columns)
+        }
+        data_frame.data = columns
+        data_frame.dtypes_map = data_frame._initialize_dtypes_map()
+        data_frame.column_metadata_map = data_frame._initialize_column_metadata_map(
+            column_metadata_map=column_metadata_map
+        )
+        data_frame._initialize_index_and_dtypes(index=index, dtypes_map=dtypes_map)
+        return data_frame
+
+    def _initialize_index_and_dtypes(
+        self,
+        index: Optional[List[Hashable]],
+        dtypes_map: Optional[Dict[str, type]],
+    ) -> None:
         if index:
             if len(index) != self.num_rows:
                 raise ValueError("Length of index does not match the number of rows.")
@@ -347,6 +416,34 @@ class DataFrame:
         self._check_column_exists(column_name=column_name)
         return self.column_data.get(column_name)
 
+    def to_column_arrays(
+        self, column_names: Optional[List[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Return numeric columns as contiguous float arrays, with None as NaN.
+
+        The arrays are copies of the columns, built on each call, so they
+        always reflect the current values.
+
+        Args:
+            column_names (Optional[List[str]]): The columns to convert.
+                Defaults to all the columns.
+
+        Returns:
+            Dict[str, np.ndarray]: One float64 array per column, by column name.
+
+        Raises:
+            ColumnNotFoundError: If a column does not exist.
+            ValueError: If a column holds values that are not numbers.
+        """
+        if column_names is None:
+            column_names = self.columns
+        arrays = {}
+        for column_name in column_names:
+            self._check_column_exists(column_name=column_name)
+            arrays[column_name] = np.array(self.data[column_name], dtype=np.float64)
+        return arrays
+
     def _check_column_exists(self, column_name: str) -> None:
         if column_name not in self.column_map:
             raise ColumnNotFoundError(f"Column '{column_name}' not found.")
@@ -497,12 +594,7 @@ class DataFrame:
             apply_func, column_values, num_jobs=num_jobs, method=method
         )
 
-        new_data_frame = DataFrame(
-            row_data=[
-                {new_column_name: new_column_values[i]}
-                for i in range(len(new_column_values))
-            ]
-        )
+        new_data_frame = DataFrame.from_columns({new_column_name: new_column_values})
         new_data_frame._index = self._index.copy()
 
         return new_data_frame
@@ -530,11 +622,7 @@ class DataFrame:
         )
 
         new_index, new_column_values = zip(*new_indexed_column_values)
-        new_data = [
-            {new_column_name: new_column_values[i]}
-            for i in range(len(new_column_values))
-        ]
-        new_data_frame = DataFrame(row_data=new_data)
+        new_data_frame = DataFrame.from_columns({new_column_name: new_column_values})
         new_data_frame._index = Index(list(new_index))
 
         return new_data_frame
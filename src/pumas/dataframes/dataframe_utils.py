@@ -76,15 +76,30 @@ def _concat_columns(dataframes: List[DataFrame], join: str) -> DataFrame:
     # Convert to sequence for sorting and further use
     common_indices_sequence = sorted(common_indices)
 
+    # Build the rows of each dataframe and the position of each index value once,
+    # rather than searching the index and converting the rows for every lookup
+    frames = [
+        (
+            df.row_data,
+            # reversed so that a repeated index value maps to its first row
+            {
+                value: position
+                for position, value in reversed(list(enumerate(df.index.values)))
+            },
+            dict.fromkeys(df.columns),
+        )
+        for df in dataframes
+    ]
+
     concatenated_row_data = []
     for idx in common_indices_sequence:
         concatenated_row = {}
-        for df in dataframes:
-            if idx in df.index.values:
-                row_idx = df.index.values.index(idx)
-                concatenated_row.update(df.row_data[row_idx])
+        for rows, positions, missing_row in frames:
+            row_idx = positions.get(idx)
+            if row_idx is None:
+                concatenated_row.update(missing_row)
             else:
-                concatenated_row.update({col: None for col in df.columns})
+                concatenated_row.update(rows[row_idx])
         concatenated_row_data.append(concatenated_row)
 
     concatenated_df = DataFrame(row_data=concatenated_row_data)
@@ -1,4 +1,7 @@
 from abc import abstractmethod
+from typing import Any, Tuple, Type, Union
+
+import numpy as np
 
 from pumas.architecture.parametrized_strategy import AbstractParametrizedStrategy
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import UFloat
@@ -7,6 +10,9 @@ from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import UFl
 class Desirability(AbstractParametrizedStrategy):
     """Abstract base class for desirability functions."""
 
+    # Types of the inputs accepted by compute_numeric
+    numeric_input_type: Union[Type[Any], Tuple[Type[Any], ...]] = (int, float)
+
     @abstractmethod
     def compute_numeric(self, x: float) -> float:
         """Computes the desirability score on numeric values."""
@@ -16,3 +22,17 @@ class Desirability(AbstractParametrizedStrategy):
     def compute_ufloat(self, x: UFloat) -> UFloat:
         """Computes the desirability score on UFloat values."""
         pass
+
+    def compute_numeric_batch(self, x: np.ndarray) -> np.ndarray:
+        """
+        Computes the desirability score on an array of numeric values.
+
+        This default implementation calls compute_numeric on each element;
+        concrete desirabilities override it with a vectorized computation.
+        """
+        x = np.asarray(x)
+        return np.fromiter(
+            (self.compute_numeric(xi) for xi in x.ravel().tolist()),
+            dtype=float,
+            count=x.size,
+        ).reshape(x.shape)
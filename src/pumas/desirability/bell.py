@@ -2,7 +2,9 @@ import math
 import sys
 from functools import partial
 from types import ModuleType
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
+
+import numpy as np
 
 from pumas.desirability.base_models import Desirability
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import (
@@ -46,6 +48,55 @@ compute_numeric_bell = partial(bell, math_module=math)
 compute_ufloat_bell = partial(bell, math_module=umath)
 
 
+def bell_array(
+    x: np.ndarray,
+    width: float,
+    slope: float,
+    center: float,
+    invert: bool = False,
+    shift: float = 0.0,
+) -> np.ndarray:
+    """
+    Compute the bell function over an array of numeric inputs.
+
+    Inputs far enough from the center for the power to overflow give shift,
+    as in the scalar bell function.
+
+    Args:
+        x (np.ndarray): The input values.
+        width (float): The width parameter of the bell curve.
+        slope (float): The slope parameter of the bell curve.
+        center (float): The center of the bell curve.
+        invert (bool, optional): Whether to invert the result. Defaults to False.
+        shift (float, optional): The vertical shift of the bell. Defaults to 0.0.
+
+    Returns:
+        np.ndarray: The results of the bell function, with the shape of x.
+    """
+    exponent = 2 * abs(slope)
+    base = np.abs(np.subtract(x, center, dtype=np.float64))
+    np.divide(base, width, out=base)
+
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        saturated = (base > 1) & (
+            exponent > math.log(sys.float_info.max) / np.log(base)
+        )
+        result = np.power(base, exponent, out=base)
+    np.add(result, 1, out=result)
+    np.reciprocal(result, out=result)
+
+    # invert if needed
+    if invert:
+        np.subtract(1, result, out=result)
+
+    # Apply the shift
+    np.multiply(result, 1 - shift, out=result)
+    np.add(result, shift, out=result)
+
+    result[saturated] = shift
+    return result
+
+
 def get_bell_inflection_points(
     center: float, width: float, slope: float
 ) -> tuple[float, float]:
@@ -189,6 +240,34 @@ class Bell(Desirability):
         )
         self._validate_and_set_parameters(params)
 
+    def _on_parameters_update(self) -> None:
+        self._coefficients_ready = False
+
+    def _prepare_coefficients(self) -> None:
+        """
+        Bind the parameters values into the bell functions.
+
+        The bound functions are built once, on the first computation after the
+        parameters change, so that no parameter dict is built or unpacked per call.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        if self._coefficients_ready:
+            return
+        self._check_parameters_values_none()
+        parameters = self.get_parameters_values()
+        self._compute_numeric: Callable[..., float] = partial(
+            compute_numeric_bell, **parameters
+        )
+        self._compute_ufloat: Callable[..., UFloat] = partial(
+            compute_ufloat_bell, **parameters
+        )
+        self._compute_array: Callable[..., np.ndarray] = partial(
+            bell_array, **parameters
+        )
+        self._coefficients_ready = True
+
     def compute_numeric(self, x: Union[int, float]) -> float:
         """
         Compute the bell desirability for a numeric input.
@@ -203,10 +282,9 @@ class Bell(Desirability):
             InvalidParameterTypeError: If the input is not a float.
             ParameterValueNotSet: If any required parameter is not set.
         """
-        self._validate_compute_input(item=x, expected_type=(int, float))
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_numeric_bell(x, **parameters)  # type: ignore
+        self._validate_compute_input(item=x, expected_type=self.numeric_input_type)
+        self._prepare_coefficients()
+        return self._compute_numeric(x)
 
     def compute_ufloat(self, x: UFloat) -> UFloat:
         """
@@ -223,8 +301,23 @@ class Bell(Desirability):
             ParameterValueNotSet: If any required parameter is not set.
         """
         self._validate_compute_input(x, UFloat)
-        # self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_ufloat_bell(x, **parameters)  # type: ignore
+        self._prepare_coefficients()
+        return self._compute_ufloat(x)  # type: ignore
+
+    def compute_numeric_batch(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the bell desirability for an array of numeric inputs.
+
+        Args:
+            x (np.ndarray): The numeric input values.
+
+        Returns:
+            np.ndarray: The computed desirability values, with the shape of x.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        self._prepare_coefficients()
+        return self._compute_array(x)
 
     __call__ = compute_numeric
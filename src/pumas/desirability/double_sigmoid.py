@@ -1,11 +1,18 @@
 import math
 from functools import partial
 from types import ModuleType
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
+
+import numpy as np
 
 from pumas.architecture.exceptions import InvalidBoundaryError
 from pumas.desirability.base_models import Desirability
-from pumas.desirability.sigmoid import hard_sigmoid, stable_sigmoid
+from pumas.desirability.sigmoid import (
+    as_array,
+    floating_dtype,
+    hard_sigmoid,
+    stable_sigmoid,
+)
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import (
     UFloat,
     umath,
@@ -80,6 +87,79 @@ def double_sigmoid(
     return result
 
 
+def double_sigmoid_array(
+    x: np.ndarray,
+    low: float,
+    high: float,
+    coef_div: float,
+    coef_si: float,
+    coef_se: float,
+    base: float = 10.0,
+    invert: bool = False,
+    shift: float = 0.0,
+) -> np.ndarray:
+    """
+    Compute the double sigmoid function over an array of numeric inputs.
+
+    Both sides are computed over the whole array and each input takes the
+    side selected by its position relative to the center, as in the scalar
+    double sigmoid function.
+
+    Args:
+        x (np.ndarray): The input values.
+        low (float): The lower bound of the sigmoid range.
+        high (float): The upper bound of the sigmoid range.
+        coef_div (float): The divisor coefficient for slope adjustment.
+        coef_si (float): The slope coefficient for the increasing part.
+        coef_se (float): The slope coefficient for the decreasing part.
+        base (float, opional): The base of the exponential function. Defaults to 10.0.
+        invert (bool, optional): Whether to invert the result. Defaults to False.
+        shift (float, optional): The vertical shift of the sigmoid. Defaults to 0.0.
+
+    Returns:
+        np.ndarray: The results of the double sigmoid function, with the shape of x.
+    """
+    if base <= 1:
+        raise InvalidBoundaryError("Base must be greater than 1")
+    if high < low:
+        raise InvalidBoundaryError("High must be greater than or equal to low")
+    x_center = (high - low) / 2 + low
+
+    x = as_array(x)
+    dtype = floating_dtype(x)
+    xl = np.subtract(x, low, dtype=dtype)
+    xr = np.subtract(x, high, dtype=dtype)
+
+    if coef_div == 0:
+        left = (coef_si * xl > 0).astype(dtype)
+        # 1 - (h > 0) rather than (h <= 0), so that NaN gives 1 as in the
+        # scalar hard sigmoid
+        right = 1 - (coef_se * xr > 0).astype(dtype)
+    else:
+        # logistic(h) = (1 + tanh(h / 2)) / 2, and 1 - logistic(h) = logistic(-h)
+        half_log_base = 0.5 * math.log(base) / coef_div
+        np.multiply(xl, coef_si * half_log_base, out=xl)
+        np.multiply(xr, -coef_se * half_log_base, out=xr)
+        left = np.tanh(xl, out=xl)
+        right = np.tanh(xr, out=xr)
+        np.add(left, 1.0, out=left)
+        np.add(right, 1.0, out=right)
+        np.multiply(left, 0.5, out=left)
+        np.multiply(right, 0.5, out=right)
+
+    result = np.where(x < x_center, left, right)
+
+    # invert if needed
+    if invert:
+        np.subtract(1.0, result, out=result)
+
+    # Apply the shift
+    np.multiply(result, 1 - shift, out=result)
+    np.add(result, shift, out=result)
+
+    return result
+
+
 compute_numeric_sigmoid = partial(double_sigmoid, math_module=math)
 
 compute_ufloat_sigmoid = partial(double_sigmoid, math_module=umath)
@@ -223,6 +303,34 @@ class DoubleSigmoid(Desirability):
         )
         self._validate_and_set_parameters(params)
 
+    def _on_parameters_update(self) -> None:
+        self._coefficients_ready = False
+
+    def _prepare_coefficients(self) -> None:
+        """
+        Bind the parameters values into the double sigmoid functions.
+
+        The bound functions are built once, on the first computation after the
+        parameters change, so that no parameter dict is built or unpacked per call.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        if self._coefficients_ready:
+            return
+        self._check_parameters_values_none()
+        parameters = self.get_parameters_values()
+        self._compute_numeric: Callable[..., float] = partial(
+            compute_numeric_sigmoid, **parameters
+        )
+        self._compute_ufloat: Callable[..., UFloat] = partial(
+            compute_ufloat_sigmoid, **parameters
+        )
+        self._compute_array: Callable[..., np.ndarray] = partial(
+            double_sigmoid_array, **parameters
+        )
+        self._coefficients_ready = True
+
     def compute_numeric(self, x: Union[int, float]) -> float:
         """
         Compute the double sigmoid desirability for a numeric input.
@@ -237,10 +345,9 @@ class DoubleSigmoid(Desirability):
             InvalidParameterTypeError: If the input is not a float.
             ParameterValueNotSet: If any required parameter is not set.
         """
-        self._validate_compute_input(item=x, expected_type=(int, float))
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_numeric_sigmoid(x=x, **parameters)  # type: ignore
+        self._validate_compute_input(item=x, expected_type=self.numeric_input_type)
+        self._prepare_coefficients()
+        return self._compute_numeric(x)
 
     def compute_ufloat(self, x: UFloat) -> UFloat:
         """
@@ -257,8 +364,23 @@ class DoubleSigmoid(Desirability):
             ParameterValueNotSet: If any required parameter is not set.
         """
         self._validate_compute_input(x, UFloat)
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_ufloat_sigmoid(x=x, **parameters)  # type: ignore
+        self._prepare_coefficients()
+        return self._compute_ufloat(x)  # type: ignore
+
+    def compute_numeric_batch(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the double sigmoid desirability for an array of numeric inputs.
+
+        Args:
+            x (np.ndarray): The numeric input values.
+
+        Returns:
+            np.ndarray: The computed desirability values, with the shape of x.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        self._prepare_coefficients()
+        return self._compute_array(x)
 
     __call__ = compute_numeric
@@ -1,7 +1,20 @@
 import math
-from collections import Counter
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
-
+from bisect import bisect_right
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 from pydantic import BaseModel, field_validator
 
 from pumas.desirability.base_models import Desirability
@@ -37,16 +50,16 @@ class Point(BaseModel):
     def __eq__(self, other):
         if not isinstance(other, Point):
             return NotImplemented
-        return math.isclose(self.x, other.x) and math.isclose(self.y, other.y)
+        return self.x == other.x and self.y == other.y
 
 
-def check_empty_input_coordinates(coordinates: List[Tuple[float, float]]) -> None:
+def check_empty_input_coordinates(coordinates: Sequence[Tuple[float, float]]) -> None:
     """Check if the input coordinates list is empty."""
     if not coordinates:
         raise ValueError("Coordinates list cannot be empty.")
 
 
-def check_single_input_coordinate(coordinates: List[Tuple[float, float]]) -> None:
+def check_single_input_coordinate(coordinates: Sequence[Tuple[float, float]]) -> None:
     """Check if there's only one input coordinate."""
     if len(coordinates) == 1:
         raise ValueError(
@@ -55,7 +68,7 @@ def check_single_input_coordinate(coordinates: List[Tuple[float, float]]) -> Non
 
 
 def build_points(
-    coordinates: List[Tuple[float, float]]
+    coordinates: Sequence[Tuple[float, float]]
 ) -> Tuple[Set[Point], List[Tuple[float, float]]]:
     """
     Convert input coordinates to Point objects.
@@ -79,21 +92,21 @@ def build_points(
 
 def check_duplicate_x_coordinates(points: Set[Point]) -> None:
     """Check for duplicate x-coordinates in the set of Points."""
-    x_coords = [point.x for point in points]
-    duplicate_x_coords = [x for x, count in Counter(x_coords).items() if count > 1]
-    if duplicate_x_coords:
+    if len({point.x for point in points}) != len(points):
         raise ValueError("Duplicate x-coordinates found.")
 
 
 def check_boundaries_y_coordinates(points: Set[Point]) -> None:
     """Check if all y-coordinates are within the [0, 1] range."""
 
-    out_of_bounds = [point for point in points if not 0 <= point.y <= 1]
-    if out_of_bounds:
+    points_list = list(points)
+    ys = np.fromiter((point.y for point in points_list), dtype=float)
+    out_of_bounds = np.flatnonzero((ys < 0) | (ys > 1))
+    if out_of_bounds.size:
         raise ValueError(
-            "Y-coordinate must be between 0 and 1."
+            "Y-coordinate must be between 0 and 1. "
             "Please review the following coordinates: "
-            ", ".join(str(coord) for coord in out_of_bounds)
+            f"{', '.join(repr(points_list[i]) for i in out_of_bounds)}"
         )
 
 
@@ -130,7 +143,7 @@ class CoordinateManager:
         points (List[Point]): A list of Point objects sorted by x-coordinate.
     """
 
-    def __init__(self, coordinates: List[Tuple[float, float]]):
+    def __init__(self, coordinates: Sequence[Tuple[float, float]]):
         check_empty_input_coordinates(coordinates=coordinates)
         check_single_input_coordinate(coordinates=coordinates)
 
@@ -145,63 +158,142 @@ class CoordinateManager:
         self.points = sort_points(points=points)
 
 
-def interpolate(x: Union[float, UFloat], p1: Point, p2: Point) -> Union[float, UFloat]:
+@lru_cache(maxsize=128)
+def _build_validated_points(
+    coordinates: Tuple[Tuple[float, float], ...]
+) -> Tuple[Point, ...]:
+    """Validate and sort hashable coordinates, memoizing the result."""
+    return tuple(CoordinateManager(coordinates=coordinates).points)
+
+
+def build_validated_points(
+    coordinates: Iterable[Tuple[float, float]]
+) -> Tuple[Point, ...]:
     """
-    Perform linear interpolation between two points.
+    Validate the coordinates and return the Points sorted by x-coordinate.
+
+    The result is memoized on the coordinates values, so that building
+    several multistep functions with the same coordinates validates them
+    only once. Unhashable coordinates are validated without memoization.
 
     Args:
-        x (Union[float, UFloat]): The x-value to interpolate.
-        p1 (Point): The first point.
-        p2 (Point): The second point.
+        coordinates (Iterable[Tuple[float, float]]): The input coordinates.
 
     Returns:
-        Union[float, UFloat]: The interpolated y-value.
+        Tuple[Point, ...]: The Points sorted by x-coordinate.
+
+    Raises:
+        ValueError: If the coordinates are not valid.
     """
-    t = (x - p1.x) / (p2.x - p1.x)
-    return p1.y + t * (p2.y - p1.y)  # type: ignore
+    if not isinstance(coordinates, (list, tuple)):
+        coordinates = list(coordinates)
+    try:
+        key = tuple(map(tuple, coordinates))
+        hash(key)
+    except TypeError:
+        return tuple(CoordinateManager(coordinates=coordinates).points)
+    return _build_validated_points(key)
 
 
-def multistep(
-    x: Union[float, UFloat],
+def build_multistep_kernel(
     coordinates: Iterable[Tuple[float, float]],
     shift: float = 0.0,
-) -> Union[float, UFloat]:
+) -> Callable[[Union[float, UFloat]], Union[float, UFloat]]:
     """
-    Compute the multistep desirability value for a given input.
+    Build the multistep function specialized for a fixed set of parameters.
+
+    The coordinates are validated and sorted, and the shift coefficients
+    derived, once; the returned function only locates the segment of x
+    and interpolates. A NaN input gives NaN, as with np.interp in the
+    vectorized kernel.
 
     Args:
-        x (Union[float, UFloat]): The input value.
         coordinates (Iterable[Tuple[float, float]]): The coordinates defining the multistep function.
         shift (float, optional): Vertical shift of the function. Defaults to 0.0.
 
     Returns:
-        Union[float, UFloat]: The computed desirability value.
+        Callable[[Union[float, UFloat]], Union[float, UFloat]]:
+            A function computing the multistep desirability value of x.
+    """  # noqa: E501
+    points = build_validated_points(coordinates=coordinates)
+    xs = [point.x for point in points]
+    x_first, x_last = xs[0], xs[-1]
+
+    # Fold the shift into the y-coordinates and the per-segment slopes,
+    # so that a computation is a single multiply-add without divisions
+    one_minus_shift = 1 - shift
+    ys_shifted = [point.y * one_minus_shift + shift for point in points]
+    slopes_shifted = [
+        (p2.y - p1.y) / (p2.x - p1.x) * one_minus_shift
+        for p1, p2 in zip(points[:-1], points[1:])
+    ]
+    y_first, y_last = ys_shifted[0], ys_shifted[-1]
+
+    def kernel(x: Union[float, UFloat]) -> Union[float, UFloat]:
+        # Plateaus before the first and after the last coordinate
+        if x <= x_first:  # type: ignore
+            return y_first
+        if x >= x_last:  # type: ignore
+            return y_last
+        # NaN fails both plateau checks and would bisect past the last segment
+        if x != x:
+            return float("nan")
+
+        i = bisect_right(xs, x) - 1  # type: ignore  # this might not work with ufloat # noqa: E501
+        return ys_shifted[i] + (x - xs[i]) * slopes_shifted[i]  # type: ignore
+
+    return kernel
+
+
+def build_multistep_array_kernel(
+    coordinates: Iterable[Tuple[float, float]],
+    shift: float = 0.0,
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build the vectorized multistep function for a fixed set of parameters.
 
-    Raises:
-        ValueError: If interpolation fails.
+    The returned function interpolates a whole array with np.interp over the
+    shifted coordinates, with the same plateaus as the scalar kernel.
+
+    Args:
+        coordinates (Iterable[Tuple[float, float]]): The coordinates defining the multistep function.
+        shift (float, optional): Vertical shift of the function. Defaults to 0.0.
+
+    Returns:
+        Callable[[np.ndarray], np.ndarray]:
+            A function computing the multistep desirability values of an array.
     """  # noqa: E501
+    points = build_validated_points(coordinates=coordinates)
+    xs = np.array([point.x for point in points], dtype=np.float64)
+    ys_shifted = np.array([point.y for point in points], dtype=np.float64)
+    ys_shifted *= 1 - shift
+    ys_shifted += shift
+
+    def kernel(x: np.ndarray) -> np.ndarray:
+        return np.interp(x, xs, ys_shifted)
+
+    return kernel
 
-    cm = CoordinateManager(coordinates=list(coordinates))
-    points = cm.points
 
-    result = None
-    if x <= points[0].x:  # type: ignore  # this might not work with ufloat
-        result = points[0].y
-    elif x >= points[-1].x:  # type: ignore  # this might not work with ufloat
-        result = points[-1].y
-    else:
-        for i in range(len(points) - 1):
-            if points[i].x <= x <= points[i + 1].x:  # type: ignore  # this might not work with ufloat # noqa: E501
-                result = interpolate(x, points[i], points[i + 1])  # type: ignore # review usage of type int in Point  # noqa: E501
-                break
+def multistep(
+    x: Union[float, UFloat],
+    coordinates: Iterable[Tuple[float, float]],
+    shift: float = 0.0,
+) -> Union[float, UFloat]:
+    """
+    Compute the multistep desirability value for a given input.
 
-    if result is None:
-        raise ValueError(f"Unable to interpolate for x={x}")
+    A NaN input gives a NaN desirability value.
 
-    # Apply the shift
-    result = result * (1 - shift) + shift
+    Args:
+        x (Union[float, UFloat]): The input value.
+        coordinates (Iterable[Tuple[float, float]]): The coordinates defining the multistep function.
+        shift (float, optional): Vertical shift of the function. Defaults to 0.0.
 
-    return result
+    Returns:
+        Union[float, UFloat]: The computed desirability value.
+    """  # noqa: E501
+    return build_multistep_kernel(coordinates=coordinates, shift=shift)(x)
 
 
 compute_numeric_multistep = multistep
@@ -314,6 +406,31 @@ class MultiStep(Desirability):
         )
         self._validate_and_set_parameters(params)
 
+    def _on_parameters_update(self) -> None:
+        self._kernel: Optional[
+            Callable[[Union[float, UFloat]], Union[float, UFloat]]
+        ] = None
+        self._array_kernel: Optional[Callable[[np.ndarray], np.ndarray]] = None
+
+    def _compile_kernel(
+        self,
+    ) -> Callable[[Union[float, UFloat]], Union[float, UFloat]]:
+        """
+        Return the multistep function specialized for the current parameters.
+
+        The function is built on the first computation after the parameters
+        change, so the coordinates are validated and sorted only once.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+            ValueError: If the coordinates are not valid.
+        """
+        if self._kernel is None:
+            self._check_parameters_values_none()
+            parameters = self.get_parameters_values()
+            self._kernel = build_multistep_kernel(**parameters)
+        return self._kernel
+
     def compute_numeric(self, x: Union[int, float]) -> float:
         """
         Compute the multistep desirability for a numeric input.
@@ -328,10 +445,8 @@ class MultiStep(Desirability):
             InvalidParameterTypeError: If the input is not a float.
             ParameterValueNotSet: If any required parameter is not set.
         """
-        self._validate_compute_input(item=x, expected_type=(int, float))
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_numeric_multistep(x=x, **parameters)  # type: ignore
+        self._validate_compute_input(item=x, expected_type=self.numeric_input_type)
+        return self._compile_kernel()(x)  # type: ignore
 
     def compute_ufloat(self, x: UFloat) -> UFloat:
         """
@@ -348,8 +463,26 @@ class MultiStep(Desirability):
             ParameterValueNotSet: If any required parameter is not set.
         """
         self._validate_compute_input(x, UFloat)
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_ufloat_multistep(x=x, **parameters)  # type: ignore
+        return self._compile_kernel()(x)  # type: ignore
+
+    def compute_numeric_batch(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the multistep desirability for an array of numeric inputs.
+
+        Args:
+            x (np.ndarray): The numeric input values.
+
+        Returns:
+            np.ndarray: The computed desirability values, with the shape of x.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+            ValueError: If the coordinates are not valid.
+        """
+        if self._array_kernel is None:
+            self._check_parameters_values_none()
+            parameters = self.get_parameters_values()
+            self._array_kernel = build_multistep_array_kernel(**parameters)
+        return self._array_kernel(x)
 
     __call__ = compute_numeric
@@ -0,0 +1,87 @@
+from typing import Dict, Mapping
+
+import numpy as np
+
+from pumas.dataframes.dataframe import DataFrame
+from pumas.desirability.base_models import Desirability
+
+
+class DesirabilityPipeline:
+    """
+    Apply a desirability function to each column of a columnar dataset.
+
+    Each column is scored as a whole through the compute_numeric_batch method
+    of its desirability, instead of calling compute_numeric once per row.
+
+    Args:
+        desirabilities (Mapping[str, Desirability]):
+            The desirability to apply to each column, by column name.
+
+    Usage Example:
+
+    >>> import numpy as np
+    >>> from pumas.desirability import desirability_catalogue
+    >>> from pumas.desirability.pipeline import DesirabilityPipeline
+
+    >>> sigmoid = desirability_catalogue.get("sigmoid")
+    >>> rightstep = desirability_catalogue.get("rightstep")
+    >>> pipeline = DesirabilityPipeline(
+    ...     {
+    ...         "logp": sigmoid(params={"low": 0.0, "high": 4.0, "k": -0.1}),
+    ...         "hbd": rightstep(params={"low": 0.0, "high": 2.0}),
+    ...     }
+    ... )
+    >>> scores = pipeline.apply(
+    ...     {"logp": np.array([0.0, 2.0, 4.0]), "hbd": np.array([1, 2, 3])}
+    ... )
+    >>> print(np.round(scores["logp"], 2))
+    [0.76 0.5  0.24]
+    >>> print(scores["hbd"])
+    [0. 1. 1.]
+    """
+
+    def __init__(self, desirabilities: Mapping[str, Desirability]):
+        self.desirabilities = dict(desirabilities)
+
+    def apply(self, columns: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Compute the desirability scores of the columns.
+
+        Args:
+            columns (Mapping[str, np.ndarray]): The input values, by column name.
+
+        Returns:
+            Dict[str, np.ndarray]: The desirability scores, by column name.
+
+        Raises:
+            KeyError: If a column with a desirability is missing from the input.
+        """
+        missing = [name for name in self.desirabilities if name not in columns]
+        if missing:
+            raise KeyError(f"Missing columns: {', '.join(missing)}")
+        return {
+            name: desirability.compute_numeric_batch(columns[name])
+            for name, desirability in self.desirabilities.items()
+        }
+
+    def apply_dataframe(self, dataframe: DataFrame) -> DataFrame:
+        """
+        Compute the desirability scores of the columns of a DataFrame.
+
+        Each column is converted once to a float array and scored as a whole;
+        missing values become NaN.
+
+        Args:
+            dataframe (DataFrame): The input values, one column per desirability.
+
+        Returns:
+            DataFrame: The desirability scores, one column per desirability,
+                with the index of the input.
+
+        Raises:
+            ColumnNotFoundError: If a column with a desirability is missing.
+        """
+        columns = dataframe.to_column_arrays(list(self.desirabilities))
+        return DataFrame.from_columns(
+            self.apply(columns), index=dataframe.index.to_list()
+        )
@@ -1,15 +1,20 @@
 import math
-from functools import partial
+from functools import lru_cache, partial
 from types import ModuleType
-from typing import Any, Callable, Dict, Optional, Union, cast
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from pumas.architecture.exceptions import InvalidBoundaryError
 from pumas.desirability.base_models import Desirability
+from pumas.parallelization.parallel_utils import parallelize_array
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import (
     UFloat,
     umath,
 )
 
+_LN10 = math.log(10.0)
+
 
 def hard_sigmoid(x: Union[float, UFloat], k: float) -> Union[float, UFloat]:
     """
@@ -41,16 +46,33 @@ def stable_sigmoid(
     Returns:
         Union[float, UFloat]: The result of the stable sigmoid function.
     """
-    if base == 10:
-        h = k * x * math_module.log(10)  # type: ignore
-    else:
-        h = k * x * math_module.log(base)  # type: ignore
+    log_base = _LN10 if base == 10 else math.log(base)
 
-    if h >= 0:
-        result = 1.0 / (1.0 + math_module.exp(-h))
-    else:
-        result = math_module.exp(h) / (1.0 + math_module.exp(h))
-    return result  # type: ignore
+    # Inlined logistic of h = k * x * log(base), with the float coefficients
+    # folded before touching x: 1 / (1 + e^-h) = (1 + tanh(h / 2)) / 2
+    return 0.5 * (1.0 + math_module.tanh((0.5 * k * log_base) * x))  # type: ignore
+
+
+def validate_sigmoid_parameters(low: float, high: float, base: float) -> None:
+    """
+    Validate the constraints between the sigmoid coefficient parameters.
+
+    Args:
+        low (float): The lower bound of the sigmoid range.
+        high (float): The upper bound of the sigmoid range.
+        base (float): The base of the exponential function.
+
+    Raises:
+        InvalidBoundaryError: If base is less than or equal to 1,
+            or if high is less than low.
+    """
+    # neet to implement in the parameter definition the le and ge conditions
+    if base <= 1:
+        raise InvalidBoundaryError("Base must be greater than 1")
+
+    # neet to implement in the parameter definition the constraints between parameters
+    if high < low:
+        raise InvalidBoundaryError("High must be greater than or equal to low")
 
 
 def sigmoid(
@@ -79,15 +101,30 @@ def sigmoid(
     Returns:
         Union[float, UFloat]: The result of the sigmoid function.
 
+    Raises:
+        InvalidBoundaryError: If base is less than or equal to 1,
+            or if high is less than low. The check is skipped under python -O;
+            use sigmoid_checked to always validate the parameters.
     """
-    # neet to implement in the parameter definition the le and ge conditions
-    if base <= 1:
-        raise InvalidBoundaryError("Base must be greater than 1")
+    if __debug__:
+        # Sigmoid validates its parameters once per parameter set; the free
+        # functions skip the per-call check under python -O
+        validate_sigmoid_parameters(low=low, high=high, base=base)
+
+    return _sigmoid_unchecked(
+        x=x, low=low, high=high, k=k, shift=shift, base=base, math_module=math_module
+    )
 
-    # neet to implement in the parameter definition the constraints between parameters
-    if high < low:
-        raise InvalidBoundaryError("High must be greater than or equal to low")
 
+def _sigmoid_unchecked(
+    x: Union[float, UFloat],
+    low: float,
+    high: float,
+    k: float,
+    shift: float,
+    base: float,
+    math_module: ModuleType,
+) -> Union[float, UFloat]:
     x_centered = x - (high + low) / 2
 
     if (high - low) == 0:
@@ -106,19 +143,255 @@ def sigmoid(
     return result
 
 
-compute_numeric_sigmoid: Callable[[float, float, float, float, float, float], float] = (
-    cast(
-        Callable[[float, float, float, float, float, float], float],
-        partial(sigmoid, math_module=math),
+def sigmoid_checked(
+    x: Union[float, UFloat],
+    low: float,
+    high: float,
+    k: float,
+    shift: float = 0.0,
+    base: float = 10.0,
+    math_module: ModuleType = math,
+) -> Union[float, UFloat]:
+    """
+    Compute the sigmoid function, always validating the parameters.
+
+    Same as sigmoid, but the parameters are validated even when running
+    under python -O.
+
+    Args:
+        x (Union[float, UFloat]): The input value.
+        low (float): The lower bound of the sigmoid range.
+        high (float): The upper bound of the sigmoid range.
+        k (float): The slope parameter.
+        shift (float, optional): The vertical shift of the sigmoid. Defaults to 0.0.
+        base (float, optional): The base of the exponential function. Defaults to 10.0.
+        math_module (ModuleType, optional): The math module to use.
+            It uses math for numerical computations and umath
+            for uncertain computations. Defaults to math.
+
+    Returns:
+        Union[float, UFloat]: The result of the sigmoid function.
+
+    Raises:
+        InvalidBoundaryError: If base is less than or equal to 1,
+            or if high is less than low.
+    """
+    validate_sigmoid_parameters(low=low, high=high, base=base)
+    return _sigmoid_unchecked(
+        x=x, low=low, high=high, k=k, shift=shift, base=base, math_module=math_module
     )
-)
 
-compute_ufloat_sigmoid: Callable[
-    [UFloat, float, float, float, float, float], UFloat
-] = cast(
-    Callable[[UFloat, float, float, float, float, float], UFloat],
-    partial(sigmoid, math_module=umath),
-)
+
+def as_array(x: Any) -> np.ndarray:
+    """
+    Return x as an array, without converting arrays that implement NumPy ufuncs.
+
+    Arrays of other libraries supporting the NumPy ufunc protocol, such as
+    device arrays of GPU libraries, are returned as they are, so that the
+    vectorized computations dispatch to their own kernels and the data is
+    not copied to host memory.
+
+    Args:
+        x (Any): The input values.
+
+    Returns:
+        np.ndarray: x itself if it supports NumPy ufuncs, else a NumPy array.
+    """
+    if getattr(type(x), "__array_ufunc__", None) is not None:
+        return x
+    return np.asarray(x)
+
+
+def floating_dtype(x: np.ndarray) -> np.dtype:
+    """
+    Return the floating point dtype used to compute over an array.
+
+    Single precision inputs are kept in single precision, which doubles the
+    number of elements processed per SIMD instruction by the NumPy ufuncs;
+    any other input is computed in double precision.
+
+    Args:
+        x (np.ndarray): The input values.
+
+    Returns:
+        np.dtype: float32 for float32 inputs, float64 otherwise.
+    """
+    if x.dtype == np.float32:
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def logistic_array(h: np.ndarray) -> np.ndarray:
+    """
+    Compute the numerically stable logistic function over an array, in place.
+
+    Args:
+        h (np.ndarray): The float exponents, already scaled by log(base).
+            The array is overwritten with the result.
+
+    Returns:
+        np.ndarray: The result of the logistic function, stored in h.
+    """
+    np.multiply(h, 0.5, out=h)
+    np.tanh(h, out=h)
+    np.add(h, 1.0, out=h)
+    np.multiply(h, 0.5, out=h)
+    return h
+
+
+def sigmoid_array(
+    x: np.ndarray,
+    low: float,
+    high: float,
+    k: float,
+    shift: float = 0.0,
+    base: float = 10.0,
+    num_jobs: int = 0,
+) -> np.ndarray:
+    """
+    Compute the sigmoid function over an array of numeric inputs.
+
+    The coefficients are derived once for the whole array, and each step
+    is a single vectorized operation writing into the same output array.
+
+    Args:
+        x (np.ndarray): The input values.
+        low (float): The lower bound of the sigmoid range.
+        high (float): The upper bound of the sigmoid range.
+        k (float): The slope parameter.
+        shift (float, optional): The vertical shift of the sigmoid. Defaults to 0.0.
+        base (float, optional): The base of the exponential function. Defaults to 10.0.
+        num_jobs (int, optional): The maximum number of threads computing chunks
+            of large NumPy arrays concurrently. Defaults to 0, no threads.
+
+    Returns:
+        np.ndarray: The results of the sigmoid function, with the shape of x.
+    """
+    if __debug__:
+        validate_sigmoid_parameters(low=low, high=high, base=base)
+
+    if num_jobs and isinstance(x, np.ndarray):
+        return parallelize_array(
+            partial(sigmoid_array, low=low, high=high, k=k, shift=shift, base=base),
+            array=x,
+            num_jobs=num_jobs,
+        )
+
+    x = as_array(x)
+    dtype = floating_dtype(x)
+    x_centered = np.subtract(x, (high + low) / 2, dtype=dtype)
+
+    if (high - low) == 0:
+        # Hard sigmoid case
+        result = (k * x_centered > 0).astype(dtype)
+    else:
+        # Stable sigmoid case
+        k_adjusted = 10.0 * k / (high - low)
+        np.multiply(x_centered, k_adjusted * math.log(base), out=x_centered)
+        result = logistic_array(h=x_centered)
+
+    # Apply the shift
+    np.multiply(result, 1 - shift, out=result)
+    np.add(result, shift, out=result)
+
+    return result
+
+
+def compute_numeric_sigmoid(
+    x: float,
+    low: float,
+    high: float,
+    k: float,
+    shift: float = 0.0,
+    base: float = 10.0,
+) -> float:
+    """
+    Compute the sigmoid function for a numeric input.
+
+    Same as sigmoid with math_module=math, with the math functions called
+    directly instead of through the math module argument.
+
+    Args:
+        x (float): The input value.
+        low (float): The lower bound of the sigmoid range.
+        high (float): The upper bound of the sigmoid range.
+        k (float): The slope parameter.
+        shift (float, optional): The vertical shift of the sigmoid. Defaults to 0.0.
+        base (float, optional): The base of the exponential function. Defaults to 10.0.
+
+    Returns:
+        float: The result of the sigmoid function.
+    """
+    if __debug__:
+        validate_sigmoid_parameters(low=low, high=high, base=base)
+
+    x_centered = x - (high + low) / 2
+    if (high - low) == 0:
+        result = 1.0 if k * x_centered > 0 else 0.0
+    else:
+        log_base = _LN10 if base == 10 else math.log(base)
+        result = 0.5 * (1.0 + math.tanh(5.0 * k / (high - low) * log_base * x_centered))
+    return result * (1 - shift) + shift
+
+
+def compute_ufloat_sigmoid(
+    x: UFloat,
+    low: float,
+    high: float,
+    k: float,
+    shift: float = 0.0,
+    base: float = 10.0,
+) -> UFloat:
+    """
+    Compute the sigmoid function for an uncertain float input.
+
+    Same as sigmoid with math_module=umath, with the umath functions called
+    directly instead of through the math module argument.
+
+    Args:
+        x (UFloat): The uncertain input value.
+        low (float): The lower bound of the sigmoid range.
+        high (float): The upper bound of the sigmoid range.
+        k (float): The slope parameter.
+        shift (float, optional): The vertical shift of the sigmoid. Defaults to 0.0.
+        base (float, optional): The base of the exponential function. Defaults to 10.0.
+
+    Returns:
+        UFloat: The result of the sigmoid function, with uncertainty.
+    """
+    if __debug__:
+        validate_sigmoid_parameters(low=low, high=high, base=base)
+
+    x_centered = x - (high + low) / 2
+    if (high - low) == 0:
+        result = hard_sigmoid(x=x_centered, k=k)
+    else:
+        log_base = _LN10 if base == 10 else math.log(base)
+        result = 0.5 * (
+            1.0 + umath.tanh(5.0 * k / (high - low) * log_base * x_centered)
+        )
+    return result * (1 - shift) + shift  # type: ignore
+
+
+@lru_cache(maxsize=4096)
+def _compute_numeric_hard_cached(
+    x: float, center: float, k: float, one_minus_shift: float, shift: float
+) -> float:
+    # Hard sigmoid on precomputed coefficients, memoized on x and the
+    # coefficients, so that desirabilities with the same parameters share it
+    return hard_sigmoid(x=x - center, k=k) * one_minus_shift + shift  # type: ignore
+
+
+@lru_cache(maxsize=4096)
+def _compute_numeric_stable_cached(
+    x: float,
+    center: float,
+    half_h_scale: float,
+    tanh_scale: float,
+    tanh_offset: float,
+) -> float:
+    # Stable sigmoid on precomputed coefficients, memoized like the hard one
+    return tanh_scale * math.tanh(half_h_scale * (x - center)) + tanh_offset
 
 
 class Sigmoid(Desirability):
@@ -151,7 +424,7 @@ class Sigmoid(Desirability):
 
     2. Stable Sigmoid: For all other cases, a numerically stable sigmoid implementation
        is used. This implementation avoids overflow errors for large positive or negative
-       inputs by using different formulas based on the sign of the intermediate calculation.
+       inputs by expressing the logistic function through the hyperbolic tangent.
 
     The choice between these implementations is made automatically based on the input
     parameters, ensuring accurate and stable results across a wide range of inputs.
@@ -227,6 +500,87 @@ class Sigmoid(Desirability):
         )
         self._validate_and_set_parameters(params)
 
+    def _on_parameters_update(self) -> None:
+        self._coefficients_ready = False
+
+    def _prepare_coefficients(self) -> None:
+        """
+        Derive the loop-invariant coefficients from the parameters values.
+
+        The coefficients are computed once, on the first computation after
+        the parameters change, instead of on every call.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+            InvalidBoundaryError: If base is less than or equal to 1,
+                or if high is less than low.
+        """
+        if self._coefficients_ready:
+            return
+        self._check_parameters_values_none()
+        parameters = self.get_parameters_values()
+        low, high, base = parameters["low"], parameters["high"], parameters["base"]
+        validate_sigmoid_parameters(low=low, high=high, base=base)
+
+        self._center: float = (high + low) / 2
+        self._is_hard: bool = (high - low) == 0
+        self._k: float = parameters["k"]
+        self._k_adjusted: float = (
+            0.0 if self._is_hard else 10.0 * self._k / (high - low)
+        )
+        self._log_base: float = math.log(base)
+        self._h_scale: float = self._k_adjusted * self._log_base
+        self._shift: float = parameters["shift"]
+        self._one_minus_shift: float = 1.0 - self._shift
+
+        # With the logistic written as (1 + tanh(h / 2)) / 2, the stable
+        # sigmoid reduces to tanh_scale * tanh(half_h_scale * (x - center))
+        # + tanh_offset, the halving and the shift being folded in
+        self._half_h_scale: float = 0.5 * self._h_scale
+        self._tanh_scale: float = 0.5 * self._one_minus_shift
+        self._tanh_offset: float = self._tanh_scale + self._shift
+
+        # Select the implementation once, so that computations do not branch
+        # on the degenerate hard sigmoid case. Numeric results are memoized
+        # on x, since scored properties often take recurring values; the
+        # cache is keyed on the coefficients, so that it never serves
+        # results for stale parameters values. UFloat inputs are not cached.
+        # The plain functions are stored rather than bound methods, so that
+        # the instance does not reference itself.
+        self._compute_numeric: Callable[[float], float]
+        if self._is_hard:
+            self._compute = Sigmoid._compute_hard
+            self._compute_numeric = partial(
+                _compute_numeric_hard_cached,
+                center=self._center,
+                k=self._k,
+                one_minus_shift=self._one_minus_shift,
+                shift=self._shift,
+            )
+        else:
+            self._compute = Sigmoid._compute_stable
+            self._compute_numeric = partial(
+                _compute_numeric_stable_cached,
+                center=self._center,
+                half_h_scale=self._half_h_scale,
+                tanh_scale=self._tanh_scale,
+                tanh_offset=self._tanh_offset,
+            )
+        self._coefficients_ready = True
+
+    def _compute_hard(
+        self, x: Union[float, UFloat], math_module: ModuleType = math
+    ) -> Union[float, UFloat]:
+        _ = math_module
+        result = hard_sigmoid(x=x - self._center, k=self._k)
+        return result * self._one_minus_shift + self._shift
+
+    def _compute_stable(
+        self, x: Union[float, UFloat], math_module: ModuleType = math
+    ) -> Union[float, UFloat]:
+        t = math_module.tanh(self._half_h_scale * (x - self._center))
+        return self._tanh_scale * t + self._tanh_offset  # type: ignore
+
     def compute_numeric(self, x: Union[int, float]) -> float:
         """
         Compute the sigmoid desirability for a numeric input.
@@ -241,10 +595,9 @@ class Sigmoid(Desirability):
             InvalidInputTypeError: If the input is not an int or float.
             ParameterValueNotSet: If any required parameter is not set.
         """
-        self._validate_compute_input(item=x, expected_type=(int, float))
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_numeric_sigmoid(x=x, **parameters)  # type: ignore
+        self._validate_compute_input(item=x, expected_type=self.numeric_input_type)
+        self._prepare_coefficients()
+        return self._compute_numeric(x)
 
     def compute_ufloat(self, x: UFloat) -> UFloat:
         """
@@ -261,8 +614,168 @@ class Sigmoid(Desirability):
             ParameterValueNotSet: If any required parameter is not set.
         """
         self._validate_compute_input(x, UFloat)
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_ufloat_sigmoid(x=x, **parameters)  # type: ignore
+        self._prepare_coefficients()
+        return self._compute(self, x, umath)  # type: ignore
+
+    def compute_numeric_batch(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the sigmoid desirability for an array of numeric inputs.
+
+        The whole array is processed by vectorized NumPy operations,
+        instead of calling compute_numeric once per element.
+
+        Args:
+            x (np.ndarray): The numeric input values.
+
+        Returns:
+            np.ndarray: The computed desirability values, with the shape of x.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        self._prepare_coefficients()
+        x = as_array(x)
+        dtype = floating_dtype(x)
+        x_centered = np.subtract(x, self._center, dtype=dtype)
+        if self._is_hard:
+            result = (self._k * x_centered > 0).astype(dtype)
+            np.multiply(result, self._one_minus_shift, out=result)
+            np.add(result, self._shift, out=result)
+            return result
+        result = x_centered
+        np.multiply(result, self._half_h_scale, out=result)
+        np.tanh(result, out=result)
+        np.multiply(result, self._tanh_scale, out=result)
+        np.add(result, self._tanh_offset, out=result)
+        return result
 
     __call__ = compute_numeric
+
+
+class SigmoidArray:
+    """
+    Evaluate many sigmoid desirabilities at once.
+
+    The coefficients of K sigmoid desirabilities are stored as contiguous
+    arrays, so that N inputs for each of the K objectives are scored with a
+    handful of broadcast NumPy operations instead of one call per objective.
+
+    The parameters are read when the SigmoidArray is created; later changes
+    to the sigmoid desirabilities are not reflected.
+
+    Args:
+        sigmoids (Sequence[Desirability]): The Sigmoid desirabilities to
+            evaluate, one per objective.
+
+    Raises:
+        ParameterValueNotSet: If any required parameter of a sigmoid is not set.
+        TypeError: If any of the desirabilities is not a sigmoid.
+
+    Usage Example:
+
+    >>> import numpy as np
+    >>> from pumas.desirability import desirability_catalogue
+
+    >>> sigmoid = desirability_catalogue.get("sigmoid")
+    >>> sigmoid_array = SigmoidArray(
+    ...     [
+    ...         sigmoid(params={"low": 0.0, "high": 4.0, "k": 0.5}),
+    ...         sigmoid(params={"low": 1.0, "high": 1.0, "k": -1.0, "shift": 0.5}),
+    ...     ]
+    ... )
+    >>> print(np.round(sigmoid_array.evaluate(np.array([[2.0, 0.0], [4.0, 3.0]])), 2))
+    [[0.5 1. ]
+     [1.  0.5]]
+    """
+
+    def __init__(self, sigmoids: Sequence[Desirability]):
+        coefficients = []
+        for sigmoid in sigmoids:
+            if not isinstance(sigmoid, Sigmoid):
+                raise TypeError(
+                    f"Expected a sigmoid desirability, got {type(sigmoid).__name__}."
+                )
+            sigmoid._prepare_coefficients()
+            coefficients.append(
+                (
+                    sigmoid._center,
+                    sigmoid._half_h_scale,
+                    sigmoid._tanh_scale,
+                    sigmoid._tanh_offset,
+                    sigmoid._k,
+                    sigmoid._shift,
+                    sigmoid._is_hard,
+                )
+            )
+
+        columns = np.array(coefficients, dtype=np.float64).reshape(-1, 7).T
+        (
+            self._centers,
+            self._half_h_scales,
+            self._tanh_scales,
+            self._tanh_offsets,
+            self._ks,
+            self._shifts,
+        ) = np.ascontiguousarray(columns[:6])
+        self._is_hard = columns[6].astype(bool)
+
+    def __len__(self) -> int:
+        return len(self._shifts)
+
+    @property
+    def has_hard_sigmoids(self) -> bool:
+        """Whether any sigmoid is a hard step, with equal low and high."""
+        return bool(self._is_hard.any())
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the sigmoid desirabilities for N inputs of each objective.
+
+        Args:
+            x (np.ndarray): The input values, of shape (N, K) with one column
+                per sigmoid, or of shape (N,) to score the same values with
+                every sigmoid.
+
+        Returns:
+            np.ndarray: The computed desirability values, of shape (N, K).
+        """
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim == 1:
+            x = x[:, np.newaxis]
+        x_centered = np.subtract(x, self._centers)
+        result = np.multiply(x_centered, self._half_h_scales)
+        np.tanh(result, out=result)
+        np.multiply(result, self._tanh_scales, out=result)
+        np.add(result, self._tanh_offsets, out=result)
+        if self._is_hard.any():
+            # Degenerate sigmoids, with equal low and high, are hard steps
+            hard = np.multiply(x_centered, self._ks) > 0
+            hard = np.multiply(hard, 1.0 - self._shifts)
+            np.add(hard, self._shifts, out=hard)
+            result = np.where(self._is_hard, hard, result)
+        return result
+
+    def evaluate_with_derivative(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the sigmoid desirabilities and their derivatives with respect to x.
+
+        The derivatives of the hard sigmoids are zero.
+
+        Args:
+            x (np.ndarray): The input values, of shape (N, K) with one column
+                per sigmoid, or of shape (N,) to score the same values with
+                every sigmoid.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The desirability values and their
+                derivatives, both of shape (N, K).
+        """
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim == 1:
+            x = x[:, np.newaxis]
+        t = np.tanh(np.subtract(x, self._centers) * self._half_h_scales)
+        # d/dx (a * tanh(b * (x - c)) + o) = a * b * (1 - tanh^2)
+        derivative = (1.0 - t * t) * (self._tanh_scales * self._half_h_scales)
+        if self._is_hard.any():
+            derivative[:, self._is_hard] = 0.0
+        return self.evaluate(x), derivative
@@ -1,17 +1,100 @@
 import math
 from functools import partial
 from types import ModuleType
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
 
 from pumas.architecture.exceptions import InvalidBoundaryError
 from pumas.desirability.base_models import Desirability
-from pumas.desirability.sigmoid import sigmoid
+from pumas.desirability.sigmoid import as_array
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import (
     UFloat,
     umath,
 )
 
 
+def validate_sigmoid_bell_parameters(
+    x1: float, x2: float, x3: float, x4: float, base: float
+) -> None:
+    """
+    Validate the constraints between the sigmoid bell coefficient parameters.
+
+    Args:
+        x1, x2, x3, x4 (float): Shape parameters defining the bell curve.
+        base (float): Base of the exponential function.
+
+    Raises:
+        InvalidBoundaryError: If shape parameters are invalid or base <= 1.
+    """
+    if x3 < x1 or x2 > x4 or x2 < x1 or x4 < x3:
+        raise InvalidBoundaryError(
+            "Invalid shape parameters. Ensure x1 < x2 < x3 < x4."
+        )
+    if base <= 1:
+        raise InvalidBoundaryError("'base' must be greater than 1")
+
+
+SigmoidTerm = Tuple[float, bool, float]
+
+
+def sigmoid_bell_coefficients(
+    x1: float,
+    x2: float,
+    x3: float,
+    x4: float,
+    k: float = 1.0,
+    base: float = 10.0,
+    invert: bool = False,
+    shift: float = 0.0,
+) -> Tuple[SigmoidTerm, SigmoidTerm, float, float]:
+    """
+    Derive the coefficients of the fused sigmoid bell kernel.
+
+    Each sigmoid is written as S(x) = (1 + T(x)) / 2, where T(x) is either
+    tanh(half_scale * (x - center)) or, for a hard sigmoid, the sign of
+    k * (x - center). The difference, the inversion and the shift then
+    reduce to the affine map scale * (T1(x) - T2(x)) + offset.
+
+    Args:
+        x1, x2, x3, x4 (float): Shape parameters defining the bell curve.
+        k (float): Slope coefficient. Default is 1.0.
+        base (float): Base of the exponential function. Default is 10.0.
+        invert (bool): Whether to invert the result. Default is False.
+        shift (float): Vertical shift of the curve. Default is 0.0.
+
+    The parameters are expected to be valid,
+    see validate_sigmoid_bell_parameters.
+
+    Returns:
+        Tuple[SigmoidTerm, SigmoidTerm, float, float]: The (center, is_hard,
+            half_scale) terms of both sigmoids, the scale and the offset.
+    """
+    log_base = math.log(base)
+    term1, term2 = (
+        (
+            (high + low) / 2,
+            (high - low) == 0,
+            0.0 if (high - low) == 0 else 5.0 * k / (high - low) * log_base,
+        )
+        for low, high in ((x1, x2), (x3, x4))
+    )
+    one_minus_shift = 1 - shift
+    scale = 0.5 * (-one_minus_shift if invert else one_minus_shift)
+    offset = shift + (one_minus_shift if invert else 0.0)
+    return term1, term2, scale, offset
+
+
+def _sigmoid_term(
+    x: Union[float, UFloat], term: SigmoidTerm, k: float, math_module: ModuleType
+) -> Union[float, UFloat]:
+    center, is_hard, half_scale = term
+    x_centered = x - center
+    if is_hard:
+        return 1.0 if k * x_centered > 0 else -1.0  # type: ignore
+    return math_module.tanh(half_scale * x_centered)
+
+
 def sigmoid_bell(
     x: Union[float, UFloat],
     x1: float,
@@ -43,33 +126,94 @@ def sigmoid_bell(
 
     Raises:
         InvalidBoundaryError: If shape parameters are invalid or base <= 1.
+            The check is skipped under python -O; use sigmoid_bell_checked
+            to always validate the parameters.
     """
-    if x3 < x1 or x2 > x4 or x2 < x1 or x4 < x3:
-        raise InvalidBoundaryError(
-            "Invalid shape parameters. Ensure x1 < x2 < x3 < x4."
-        )
-    if base <= 1:
-        raise InvalidBoundaryError("'base' must be greater than 1")
-
-    # Combine two sigmoid functions
-    sig1 = sigmoid(
-        x, low=x1, high=x2, k=k, shift=0.0, base=base, math_module=math_module
+    if __debug__:
+        # SigmoidBell validates its parameters once per parameter set; the
+        # free function skips the per-call check under python -O
+        validate_sigmoid_bell_parameters(x1=x1, x2=x2, x3=x3, x4=x4, base=base)
+
+    return _sigmoid_bell_unchecked(
+        x,
+        x1=x1,
+        x2=x2,
+        x3=x3,
+        x4=x4,
+        k=k,
+        base=base,
+        invert=invert,
+        shift=shift,
+        math_module=math_module,
     )
-    sig2 = sigmoid(
-        x, low=x3, high=x4, k=k, shift=0.0, base=base, math_module=math_module
+
+
+def _sigmoid_bell_unchecked(
+    x: Union[float, UFloat],
+    x1: float,
+    x2: float,
+    x3: float,
+    x4: float,
+    k: float,
+    base: float,
+    invert: bool,
+    shift: float,
+    math_module: ModuleType,
+) -> Union[float, UFloat]:
+    term1, term2, scale, offset = sigmoid_bell_coefficients(
+        x1=x1, x2=x2, x3=x3, x4=x4, k=k, base=base, invert=invert, shift=shift
     )
+    t1 = _sigmoid_term(x, term=term1, k=k, math_module=math_module)
+    t2 = _sigmoid_term(x, term=term2, k=k, math_module=math_module)
+    return scale * (t1 - t2) + offset  # type: ignore
+
+
+def sigmoid_bell_checked(
+    x: Union[float, UFloat],
+    x1: float,
+    x2: float,
+    x3: float,
+    x4: float,
+    k: float = 1.0,
+    base: float = 10.0,
+    invert: bool = False,
+    shift: float = 0.0,
+    math_module: ModuleType = math,
+) -> Union[float, UFloat]:
+    """
+    Calculate the sigmoid bell function value, always validating the parameters.
 
-    # Calculate the result
-    result = sig1 - sig2  # type: ignore
+    Same as sigmoid_bell, but the parameters are validated even when running
+    under python -O.
 
-    # invert if needed
-    if invert:
-        result = 1 - result  # type: ignore
+    Args:
+        x (Union[float, UFloat]): The input value.
+        x1, x2, x3, x4 (float): Shape parameters defining the bell curve.
+        k (float): Slope coefficient. Default is 1.0.
+        base (float): Base of the exponential function. Default is 10.0.
+        invert (bool): Whether to invert the result. Default is False.
+        shift (float): Vertical shift of the curve. Default is 0.0.
+        math_module (ModuleType): Math module to use. Default is math.
 
-    # Apply the shift
-    result = result * (1 - shift) + shift
+    Returns:
+        Union[float, UFloat]: The calculated sigmoid bell value.
 
-    return result
+    Raises:
+        InvalidBoundaryError: If shape parameters are invalid or base <= 1.
+    """
+    validate_sigmoid_bell_parameters(x1=x1, x2=x2, x3=x3, x4=x4, base=base)
+    return _sigmoid_bell_unchecked(
+        x,
+        x1=x1,
+        x2=x2,
+        x3=x3,
+        x4=x4,
+        k=k,
+        base=base,
+        invert=invert,
+        shift=shift,
+        math_module=math_module,
+    )
 
 
 compute_numeric_sigmoid_bell = partial(sigmoid_bell, math_module=math)
@@ -150,6 +294,8 @@ class SigmoidBell(Desirability):
     0.9999999+/-0.0000018
     """  # noqa: E501
 
+    numeric_input_type = float
+
     def __init__(self, params: Optional[Dict[str, Any]] = None):
         """
         Initialize the SigmoidBell desirability function.
@@ -193,6 +339,44 @@ class SigmoidBell(Desirability):
         )
         self._validate_and_set_parameters(params)
 
+    def _on_parameters_update(self) -> None:
+        self._coefficients_ready = False
+
+    def _prepare_coefficients(self) -> None:
+        """
+        Derive the loop-invariant coefficients from the parameters values.
+
+        The coefficients of the fused kernel are computed once, on the first
+        computation after the parameters change, instead of on every call.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+            InvalidBoundaryError: If shape parameters are invalid or base <= 1.
+        """
+        if self._coefficients_ready:
+            return
+        self._check_parameters_values_none()
+        parameters = self.get_parameters_values()
+        validate_sigmoid_bell_parameters(
+            x1=parameters["x1"],
+            x2=parameters["x2"],
+            x3=parameters["x3"],
+            x4=parameters["x4"],
+            base=parameters["base"],
+        )
+        self._k: float = parameters["k"]
+        self._term1, self._term2, self._scale, self._offset = (
+            sigmoid_bell_coefficients(**parameters)
+        )
+        self._coefficients_ready = True
+
+    def _compute(
+        self, x: Union[float, UFloat], math_module: ModuleType
+    ) -> Union[float, UFloat]:
+        t1 = _sigmoid_term(x, term=self._term1, k=self._k, math_module=math_module)
+        t2 = _sigmoid_term(x, term=self._term2, k=self._k, math_module=math_module)
+        return self._scale * (t1 - t2) + self._offset  # type: ignore
+
     def compute_numeric(self, x: float) -> float:
         """
         Compute the sigmoid bell desirability for a numeric input.
@@ -207,10 +391,9 @@ class SigmoidBell(Desirability):
             InvalidParameterTypeError: If the input is not a float.
             ParameterValueNotSet: If any required parameter is not set.
         """
-        self._validate_compute_input(x, float)
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_numeric_sigmoid_bell(x, **parameters)  # type: ignore
+        self._validate_compute_input(item=x, expected_type=self.numeric_input_type)
+        self._prepare_coefficients()
+        return self._compute(x=x, math_module=math)  # type: ignore
 
     def compute_ufloat(self, x: UFloat) -> UFloat:
         """
@@ -227,8 +410,35 @@ class SigmoidBell(Desirability):
             ParameterValueNotSet: If any required parameter is not set.
         """
         self._validate_compute_input(x, UFloat)
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_ufloat_sigmoid_bell(x, **parameters)  # type: ignore
+        self._prepare_coefficients()
+        return self._compute(x=x, math_module=umath)  # type: ignore
+
+    def compute_numeric_batch(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the sigmoid bell desirability for an array of numeric inputs.
+
+        Args:
+            x (np.ndarray): The numeric input values.
+
+        Returns:
+            np.ndarray: The computed desirability values, with the shape of x.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        self._prepare_coefficients()
+        x = as_array(x)
+        t1, t2 = (
+            (
+                np.where(self._k * (x - center) > 0, 1.0, -1.0)
+                if is_hard
+                else np.tanh(half_scale * (x - center))
+            )
+            for center, is_hard, half_scale in (self._term1, self._term2)
+        )
+        np.subtract(t1, t2, out=t1)
+        np.multiply(t1, self._scale, out=t1)
+        np.add(t1, self._offset, out=t1)
+        return t1
 
     __call__ = compute_numeric
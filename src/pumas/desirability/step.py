@@ -1,6 +1,10 @@
-from typing import Any, Dict, Optional, Union
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from pumas.desirability.base_models import Desirability
+from pumas.parallelization.parallel_utils import parallelize_array
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import (
     UFloat,
     ufloat,
@@ -23,12 +27,8 @@ def compute_numeric_right_step(
         float: The calculated right step value.
     """
     _ = low
-    result = 1.0 if x >= high else 0.0
-
-    # Apply the shift
-    result = result * (1 - shift) + shift
-
-    return result
+    # Branchless: the comparison is promoted to 0.0 or 1.0 and shifted
+    return (x >= high) * (1.0 - shift) + shift
 
 
 def compute_ufloat_right_step(
@@ -48,17 +48,14 @@ def compute_ufloat_right_step(
     """
     _ = low
     x_nominal_value, x_std_dev = x.nominal_value, x.std_dev  # type: ignore
-    result = (
-        ufloat(nominal_value=1.0, std_dev=x_std_dev)
-        if x_nominal_value >= high
-        else ufloat(nominal_value=0.0, std_dev=x_std_dev)
+    # Branchless: a single ufloat is built from the promoted comparison with
+    # the shift already applied, which scales the uncertainty by (1 - shift)
+    one_minus_shift = 1 - shift
+    return ufloat(  # type: ignore
+        nominal_value=(x_nominal_value >= high) * one_minus_shift + shift,
+        std_dev=x_std_dev * one_minus_shift,
     )
 
-    # Apply the shift
-    result = result * (1 - shift) + shift
-
-    return result  # type: ignore
-
 
 def compute_numeric_left_step(
     x: float, low: float, high: float, shift: float = 0.0
@@ -76,12 +73,8 @@ def compute_numeric_left_step(
         float: The calculated left step value.
     """
     _ = high
-    result = 1.0 if x <= low else 0.0
-
-    # Apply the shift
-    result = result * (1 - shift) + shift
-
-    return result
+    # Branchless: the comparison is promoted to 0.0 or 1.0 and shifted
+    return (x <= low) * (1.0 - shift) + shift
 
 
 def compute_ufloat_left_step(
@@ -101,17 +94,14 @@ def compute_ufloat_left_step(
     """
     _ = high
     x_nominal_value, x_std_dev = x.nominal_value, x.std_dev  # type: ignore
-    result = (
-        ufloat(nominal_value=1.0, std_dev=x_std_dev)
-        if x_nominal_value <= low
-        else ufloat(nominal_value=0.0, std_dev=x_std_dev)
+    # Branchless: a single ufloat is built from the promoted comparison with
+    # the shift already applied, which scales the uncertainty by (1 - shift)
+    one_minus_shift = 1 - shift
+    return ufloat(  # type: ignore
+        nominal_value=(x_nominal_value <= low) * one_minus_shift + shift,
+        std_dev=x_std_dev * one_minus_shift,
     )
 
-    # Apply the shift
-    result = result * (1 - shift) + shift
-
-    return result  # type: ignore
-
 
 def compute_numeric_step(
     x: float, low: float, high: float, invert: bool, shift: float = 0.0
@@ -129,16 +119,8 @@ def compute_numeric_step(
     Returns:
         float: The calculated step value.
     """
-    result = 1.0 if low <= x <= high else 0.0
-
-    # invert if needed
-    if invert:
-        result = 1 - result
-
-    # Apply the shift
-    result = result * (1 - shift) + shift
-
-    return result
+    # Branchless: inverting is an exclusive or with the inside test
+    return ((low <= x <= high) != invert) * (1.0 - shift) + shift
 
 
 def compute_ufloat_step(
@@ -158,20 +140,386 @@ def compute_ufloat_step(
         UFloat: The calculated step value with uncertainty.
     """
     x_nominal_value, x_std_dev = x.nominal_value, x.std_dev  # type: ignore
-    result = (
-        ufloat(nominal_value=1.0, std_dev=x_std_dev)
-        if low <= x_nominal_value <= high
-        else ufloat(nominal_value=0.0, std_dev=x_std_dev)
+    # Branchless: inverting is an exclusive or with the inside test, and a
+    # single ufloat is built with the shift already applied, which scales the
+    # uncertainty by (1 - shift)
+    is_on = (low <= x_nominal_value <= high) != invert
+    one_minus_shift = 1 - shift
+    return ufloat(  # type: ignore
+        nominal_value=is_on * one_minus_shift + shift,
+        std_dev=x_std_dev * one_minus_shift,
     )
 
-    # invert if needed
+
+def compute_mask_right_step(x: np.ndarray, low: float, high: float) -> np.ndarray:
+    """
+    Calculate the unshifted right step function values as a uint8 mask.
+
+    Args:
+        x (np.ndarray): The input values.
+        low (float): Lower bound (unused in this function).
+        high (float): Upper bound (step threshold).
+
+    Returns:
+        np.ndarray: 1 where x >= high and 0 elsewhere, with the shape of x.
+    """
+    _ = low
+    return np.greater_equal(x, high).view(np.uint8)
+
+
+def compute_mask_left_step(x: np.ndarray, low: float, high: float) -> np.ndarray:
+    """
+    Calculate the unshifted left step function values as a uint8 mask.
+
+    Args:
+        x (np.ndarray): The input values.
+        low (float): Lower bound (step threshold).
+        high (float): Upper bound (unused in this function).
+
+    Returns:
+        np.ndarray: 1 where x <= low and 0 elsewhere, with the shape of x.
+    """
+    _ = high
+    return np.less_equal(x, low).view(np.uint8)
+
+
+def compute_mask_step(
+    x: np.ndarray, low: float, high: float, invert: bool
+) -> np.ndarray:
+    """
+    Calculate the unshifted centered step function values as a uint8 mask.
+
+    Args:
+        x (np.ndarray): The input values.
+        low (float): Lower bound of the step.
+        high (float): Upper bound of the step.
+        invert (bool): Whether to invert the result.
+
+    Returns:
+        np.ndarray: 1 where the (possibly inverted) step is on and 0 elsewhere,
+            with the shape of x.
+    """
+    mask = np.greater_equal(x, low)
+    np.logical_and(mask, np.less_equal(x, high), out=mask)
     if invert:
-        result = 1 - result
+        np.logical_not(mask, out=mask)
+    return mask.view(np.uint8)
+
+
+def shift_step_mask(
+    mask: np.ndarray, shift: float = 0.0, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Expand a step mask into desirability values.
+
+    The step masks take one byte per element instead of eight; applying the
+    shift can be deferred until the float values are needed.
+
+    Args:
+        mask (np.ndarray): A step mask of zeros and ones.
+        shift (float): Vertical shift of the step. Default is 0.0.
+        out (Optional[np.ndarray]): A float array with the shape of mask to
+            write the values into; it may be the mask itself. Default is None,
+            which allocates a new array.
+
+    Returns:
+        np.ndarray: shift where the mask is 0 and 1.0 where it is 1.
+    """
+    result = np.multiply(mask, 1.0 - shift, out=out)
+    np.add(result, shift, out=result)
+    return result
+
+
+_BYTE_POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], np.uint8)
+
+
+def pack_step_mask(mask: np.ndarray) -> np.ndarray:
+    """
+    Pack a step mask into a bitmap of one bit per element.
+
+    The mask is flattened in C order; the last byte is padded with zeros.
 
-    # Apply the shift
-    result = result * (1 - shift) + shift
+    Args:
+        mask (np.ndarray): A step mask of zeros and ones.
 
-    return result  # type: ignore
+    Returns:
+        np.ndarray: A uint8 array of ceil(mask.size / 8) bytes.
+    """
+    return np.packbits(mask, axis=None)
+
+
+def expand_step_bitmap(bitmap: np.ndarray, size: int, shift: float = 0.0) -> np.ndarray:
+    """
+    Expand a step bitmap into desirability values.
+
+    Args:
+        bitmap (np.ndarray): A bitmap as returned by pack_step_mask.
+        size (int): The number of elements packed in the bitmap.
+        shift (float): Vertical shift of the step. Default is 0.0.
+
+    Returns:
+        np.ndarray: A flat float array of shift where the bit is 0 and 1.0
+            where it is 1.
+    """
+    mask = np.unpackbits(bitmap, count=size)
+    return shift_step_mask(mask=mask, shift=shift)
+
+
+def mean_step_bitmap(bitmap: np.ndarray, size: int, shift: float = 0.0) -> float:
+    """
+    Calculate the mean desirability of a step bitmap without expanding it.
+
+    The set bits are counted a byte at a time through a lookup table.
+
+    Args:
+        bitmap (np.ndarray): A bitmap as returned by pack_step_mask.
+        size (int): The number of elements packed in the bitmap.
+        shift (float): Vertical shift of the step. Default is 0.0.
+
+    Returns:
+        float: The mean of the expanded desirability values, NaN when size
+            is 0, as np.mean of an empty array.
+    """
+    if size == 0:
+        return float("nan")
+    count = int(_BYTE_POPCOUNT[bitmap].sum(dtype=np.int64))
+    return shift + (1.0 - shift) * count / size
+
+
+def _comparison_into_float(
+    comparison: np.ufunc, x: np.ndarray, threshold: float, out: Optional[np.ndarray]
+) -> np.ndarray:
+    # Write the comparison straight into the float result, without an
+    # intermediate boolean array
+    if out is None:
+        out = np.empty(np.shape(x), dtype=np.float64)
+    return comparison(x, threshold, out=out, casting="unsafe")
+
+
+def compute_array_right_step(
+    x: np.ndarray,
+    low: float,
+    high: float,
+    shift: float = 0.0,
+    out: Optional[np.ndarray] = None,
+    num_jobs: int = 0,
+) -> np.ndarray:
+    """
+    Calculate the right step function values for an array of numeric inputs.
+
+    The comparison and the shift are computed in a single float buffer.
+
+    Args:
+        x (np.ndarray): The input values.
+        low (float): Lower bound (unused in this function).
+        high (float): Upper bound (step threshold).
+        shift (float): Vertical shift of the step. Default is 0.0.
+        out (Optional[np.ndarray]): A float array with the shape of x to
+            write the values into. Default is None, which allocates it.
+        num_jobs (int): The maximum number of threads computing chunks of
+            large NumPy arrays concurrently. Default is 0, no threads.
+
+    Returns:
+        np.ndarray: The calculated right step values, with the shape of x.
+    """
+    if num_jobs and isinstance(x, np.ndarray):
+        result = parallelize_array(
+            partial(compute_array_right_step, low=low, high=high, shift=shift),
+            array=x,
+            num_jobs=num_jobs,
+        )
+        if out is None:
+            return result
+        np.copyto(out, result)
+        return out
+
+    _ = low
+    result = _comparison_into_float(np.greater_equal, x=x, threshold=high, out=out)
+    return shift_step_mask(mask=result, shift=shift, out=result)
+
+
+def compute_array_left_step(
+    x: np.ndarray,
+    low: float,
+    high: float,
+    shift: float = 0.0,
+    out: Optional[np.ndarray] = None,
+    num_jobs: int = 0,
+) -> np.ndarray:
+    """
+    Calculate the left step function values for an array of numeric inputs.
+
+    The comparison and the shift are computed in a single float buffer.
+
+    Args:
+        x (np.ndarray): The input values.
+        low (float): Lower bound (step threshold).
+        high (float): Upper bound (unused in this function).
+        shift (float): Vertical shift of the step. Default is 0.0.
+        out (Optional[np.ndarray]): A float array with the shape of x to
+            write the values into. Default is None, which allocates it.
+        num_jobs (int): The maximum number of threads computing chunks of
+            large NumPy arrays concurrently. Default is 0, no threads.
+
+    Returns:
+        np.ndarray: The calculated left step values, with the shape of x.
+    """
+    if num_jobs and isinstance(x, np.ndarray):
+        result = parallelize_array(
+            partial(compute_array_left_step, low=low, high=high, shift=shift),
+            array=x,
+            num_jobs=num_jobs,
+        )
+        if out is None:
+            return result
+        np.copyto(out, result)
+        return out
+
+    _ = high
+    result = _comparison_into_float(np.less_equal, x=x, threshold=low, out=out)
+    return shift_step_mask(mask=result, shift=shift, out=result)
+
+
+def compute_array_step(
+    x: np.ndarray,
+    low: float,
+    high: float,
+    invert: bool,
+    shift: float = 0.0,
+    out: Optional[np.ndarray] = None,
+    num_jobs: int = 0,
+) -> np.ndarray:
+    """
+    Calculate the centered step function values for an array of numeric inputs.
+
+    Args:
+        x (np.ndarray): The input values.
+        low (float): Lower bound of the step.
+        high (float): Upper bound of the step.
+        invert (bool): Whether to invert the result. Default is False.
+        shift (float): Vertical shift of the step. Default is 0.0.
+        out (Optional[np.ndarray]): A float array with the shape of x to
+            write the values into. Default is None, which allocates it.
+        num_jobs (int): The maximum number of threads computing chunks of
+            large NumPy arrays concurrently. Default is 0, no threads.
+
+    Returns:
+        np.ndarray: The calculated step values, with the shape of x.
+    """
+    if num_jobs and isinstance(x, np.ndarray):
+        result = parallelize_array(
+            partial(compute_array_step, low=low, high=high, invert=invert, shift=shift),
+            array=x,
+            num_jobs=num_jobs,
+        )
+        if out is None:
+            return result
+        np.copyto(out, result)
+        return out
+
+    mask = compute_mask_step(x=x, low=low, high=high, invert=invert)
+    return shift_step_mask(mask=mask, shift=shift, out=out)
+
+
+def _constant_one_step_kernel(x: float) -> float:
+    del x
+    return 1.0
+
+
+def _build_right_step_kernel(high: float, shift: float) -> Callable[[float], float]:
+    if shift == 1.0:
+        return _constant_one_step_kernel
+
+    if shift == 0.0:
+
+        def kernel(x: float) -> float:
+            return 1.0 if x >= high else 0.0
+
+        return kernel
+
+    scale = 1.0 - shift
+
+    def shifted_kernel(x: float) -> float:
+        return (x >= high) * scale + shift
+
+    return shifted_kernel
+
+
+def _build_left_step_kernel(low: float, shift: float) -> Callable[[float], float]:
+    if shift == 1.0:
+        return _constant_one_step_kernel
+
+    if shift == 0.0:
+
+        def kernel(x: float) -> float:
+            return 1.0 if x <= low else 0.0
+
+        return kernel
+
+    scale = 1.0 - shift
+
+    def shifted_kernel(x: float) -> float:
+        return (x <= low) * scale + shift
+
+    return shifted_kernel
+
+
+def _build_step_kernel(
+    low: float, high: float, invert: bool, shift: float
+) -> Callable[[float], float]:
+    if shift == 1.0:
+        return _constant_one_step_kernel
+
+    if shift == 0.0:
+        inside, outside = (0.0, 1.0) if invert else (1.0, 0.0)
+
+        def kernel(x: float) -> float:
+            return inside if low <= x <= high else outside
+
+        return kernel
+
+    scale = 1.0 - shift
+
+    def shifted_kernel(x: float) -> float:
+        return ((low <= x <= high) != invert) * scale + shift
+
+    return shifted_kernel
+
+
+@lru_cache(maxsize=128)
+def build_numeric_step_kernel(
+    kind: str, low: float, high: float, invert: bool = False, shift: float = 0.0
+) -> Callable[[float], float]:
+    """
+    Build the numeric step function specialized for a fixed set of parameters.
+
+    The parameters are bound in a closure, so that a computation is a single
+    comparison and multiply-add without any keyword argument unpacking.
+    With shift 1.0 the kernel is the constant 1.0, and with shift 0.0 the
+    shift arithmetic is dropped. Kernels are cached, so step desirabilities
+    with the same parameters share them.
+
+    Args:
+        kind (str): The kind of step, one of 'rightstep', 'leftstep' or 'step'.
+        low (float): Lower bound of the step.
+        high (float): Upper bound of the step.
+        invert (bool): Whether to invert the result; only used by 'step'.
+            Default is False.
+        shift (float): Vertical shift of the step. Default is 0.0.
+
+    Returns:
+        Callable[[float], float]: A function computing the step value of x.
+
+    Raises:
+        KeyError: If the kind of step is not known.
+    """
+    if kind == "rightstep":
+        return _build_right_step_kernel(high=high, shift=shift)
+    if kind == "leftstep":
+        return _build_left_step_kernel(low=low, shift=shift)
+    if kind == "step":
+        return _build_step_kernel(low=low, high=high, invert=invert, shift=shift)
+    raise KeyError(kind)
 
 
 class RightStep(Desirability):
@@ -257,6 +605,35 @@ class RightStep(Desirability):
         )
         self._validate_and_set_parameters(params)
 
+    _kind = "rightstep"
+
+    def _on_parameters_update(self) -> None:
+        self._coefficients_ready = False
+
+    def _prepare_coefficients(self) -> None:
+        """
+        Bind the parameters values into a tuple and a numeric step kernel.
+
+        Both are built once, on the first computation after the parameters
+        change, so that no parameter dict is built or unpacked per call.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        if self._coefficients_ready:
+            return
+        self._check_parameters_values_none()
+        parameters = self.get_parameters_values()
+        self._parameters: Tuple[float, float, float] = (
+            parameters["low"],
+            parameters["high"],
+            parameters["shift"],
+        )
+        self._kernel: Callable[[float], float] = build_numeric_step_kernel(
+            self._kind, **parameters
+        )
+        self._coefficients_ready = True
+
     def compute_numeric(self, x: Union[int, float]) -> float:
         """
         Compute the right step desirability for a numeric input.
@@ -271,10 +648,9 @@ class RightStep(Desirability):
             InvalidParameterTypeError: If the input is not a float.
             ParameterValueNotSet: If any required parameter is not set.
         """
-        self._validate_compute_input(item=x, expected_type=(int, float))
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_numeric_right_step(x=x, **parameters)
+        self._validate_compute_input(item=x, expected_type=self.numeric_input_type)
+        self._prepare_coefficients()
+        return self._kernel(x)
 
     def compute_ufloat(self, x: UFloat) -> UFloat:
         """
@@ -291,9 +667,49 @@ class RightStep(Desirability):
             ParameterValueNotSet: If any required parameter is not set.
         """
         self._validate_compute_input(x, UFloat)
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_ufloat_right_step(x=x, **parameters)
+        self._prepare_coefficients()
+        return compute_ufloat_right_step(x, *self._parameters)
+
+    def compute_numeric_batch(self, x: np.ndarray, num_jobs: int = 0) -> np.ndarray:
+        """
+        Compute the right step desirability for an array of numeric inputs.
+
+        Args:
+            x (np.ndarray): The numeric input values.
+            num_jobs (int): The maximum number of threads computing chunks of
+                large arrays concurrently. Default is 0, no threads.
+
+        Returns:
+            np.ndarray: The computed desirability values, with the shape of x.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        self._prepare_coefficients()
+        return compute_array_right_step(
+            np.asarray(x, dtype=np.float64), *self._parameters, num_jobs=num_jobs
+        )
+
+    def compute_numeric_bitmap(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the unshifted right step values for an array as a bitmap.
+
+        Each element takes a single bit; expand_step_bitmap and
+        mean_step_bitmap apply the shift when the values are consumed.
+
+        Args:
+            x (np.ndarray): The numeric input values, flattened in C order.
+
+        Returns:
+            np.ndarray: A uint8 array of ceil(x.size / 8) bytes.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        self._prepare_coefficients()
+        low, high, _ = self._parameters
+        mask = compute_mask_right_step(np.asarray(x, dtype=np.float64), low, high)
+        return pack_step_mask(mask=mask)
 
     __call__ = compute_numeric
 
@@ -380,6 +796,35 @@ class LeftStep(Desirability):
         )
         self._validate_and_set_parameters(params)
 
+    _kind = "leftstep"
+
+    def _on_parameters_update(self) -> None:
+        self._coefficients_ready = False
+
+    def _prepare_coefficients(self) -> None:
+        """
+        Bind the parameters values into a tuple and a numeric step kernel.
+
+        Both are built once, on the first computation after the parameters
+        change, so that no parameter dict is built or unpacked per call.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        if self._coefficients_ready:
+            return
+        self._check_parameters_values_none()
+        parameters = self.get_parameters_values()
+        self._parameters: Tuple[float, float, float] = (
+            parameters["low"],
+            parameters["high"],
+            parameters["shift"],
+        )
+        self._kernel: Callable[[float], float] = build_numeric_step_kernel(
+            self._kind, **parameters
+        )
+        self._coefficients_ready = True
+
     def compute_numeric(self, x: Union[int, float]) -> float:
         """
         Compute the left step desirability for a numeric input.
@@ -394,10 +839,9 @@ class LeftStep(Desirability):
             InvalidParameterTypeError: If the input is not a float.
             ParameterValueNotSet: If any required parameter is not set.
         """
-        self._validate_compute_input(item=x, expected_type=(int, float))
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_numeric_left_step(x=x, **parameters)
+        self._validate_compute_input(item=x, expected_type=self.numeric_input_type)
+        self._prepare_coefficients()
+        return self._kernel(x)
 
     def compute_ufloat(self, x: UFloat) -> UFloat:
         """
@@ -414,9 +858,49 @@ class LeftStep(Desirability):
             ParameterValueNotSet: If any required parameter is not set.
         """
         self._validate_compute_input(x, UFloat)
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_ufloat_left_step(x=x, **parameters)
+        self._prepare_coefficients()
+        return compute_ufloat_left_step(x, *self._parameters)
+
+    def compute_numeric_batch(self, x: np.ndarray, num_jobs: int = 0) -> np.ndarray:
+        """
+        Compute the left step desirability for an array of numeric inputs.
+
+        Args:
+            x (np.ndarray): The numeric input values.
+            num_jobs (int): The maximum number of threads computing chunks of
+                large arrays concurrently. Default is 0, no threads.
+
+        Returns:
+            np.ndarray: The computed desirability values, with the shape of x.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        self._prepare_coefficients()
+        return compute_array_left_step(
+            np.asarray(x, dtype=np.float64), *self._parameters, num_jobs=num_jobs
+        )
+
+    def compute_numeric_bitmap(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the unshifted left step values for an array as a bitmap.
+
+        Each element takes a single bit; expand_step_bitmap and
+        mean_step_bitmap apply the shift when the values are consumed.
+
+        Args:
+            x (np.ndarray): The numeric input values, flattened in C order.
+
+        Returns:
+            np.ndarray: A uint8 array of ceil(x.size / 8) bytes.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        self._prepare_coefficients()
+        low, high, _ = self._parameters
+        mask = compute_mask_left_step(np.asarray(x, dtype=np.float64), low, high)
+        return pack_step_mask(mask=mask)
 
     __call__ = compute_numeric
 
@@ -517,6 +1001,36 @@ class Step(Desirability):
         )
         self._validate_and_set_parameters(params)
 
+    _kind = "step"
+
+    def _on_parameters_update(self) -> None:
+        self._coefficients_ready = False
+
+    def _prepare_coefficients(self) -> None:
+        """
+        Bind the parameters values into a tuple and a numeric step kernel.
+
+        Both are built once, on the first computation after the parameters
+        change, so that no parameter dict is built or unpacked per call.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        if self._coefficients_ready:
+            return
+        self._check_parameters_values_none()
+        parameters = self.get_parameters_values()
+        self._parameters: Tuple[float, float, bool, float] = (
+            parameters["low"],
+            parameters["high"],
+            parameters["invert"],
+            parameters["shift"],
+        )
+        self._kernel: Callable[[float], float] = build_numeric_step_kernel(
+            self._kind, **parameters
+        )
+        self._coefficients_ready = True
+
     def compute_numeric(self, x: Union[int, float]) -> float:
         """
         Compute the centered step desirability for a numeric input.
@@ -531,10 +1045,9 @@ class Step(Desirability):
             InvalidParameterTypeError: If the input is not a float.
             ParameterValueNotSet: If any required parameter is not set.
         """
-        self._validate_compute_input(item=x, expected_type=(int, float))
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_numeric_step(x=x, **parameters)
+        self._validate_compute_input(item=x, expected_type=self.numeric_input_type)
+        self._prepare_coefficients()
+        return self._kernel(x)
 
     def compute_ufloat(self, x: UFloat) -> UFloat:
         """
@@ -551,8 +1064,141 @@ class Step(Desirability):
             ParameterValueNotSet: If any required parameter is not set.
         """
         self._validate_compute_input(x, UFloat)
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return compute_ufloat_step(x=x, **parameters)
+        self._prepare_coefficients()
+        return compute_ufloat_step(x, *self._parameters)
+
+    def compute_numeric_batch(self, x: np.ndarray, num_jobs: int = 0) -> np.ndarray:
+        """
+        Compute the centered step desirability for an array of numeric inputs.
+
+        Args:
+            x (np.ndarray): The numeric input values.
+            num_jobs (int): The maximum number of threads computing chunks of
+                large arrays concurrently. Default is 0, no threads.
+
+        Returns:
+            np.ndarray: The computed desirability values, with the shape of x.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        self._prepare_coefficients()
+        return compute_array_step(
+            np.asarray(x, dtype=np.float64), *self._parameters, num_jobs=num_jobs
+        )
+
+    def compute_numeric_bitmap(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the unshifted centered step values for an array as a bitmap.
+
+        Each element takes a single bit; expand_step_bitmap and
+        mean_step_bitmap apply the shift when the values are consumed.
+
+        Args:
+            x (np.ndarray): The numeric input values, flattened in C order.
+
+        Returns:
+            np.ndarray: A uint8 array of ceil(x.size / 8) bytes.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+        """
+        self._prepare_coefficients()
+        low, high, invert, _ = self._parameters
+        mask = compute_mask_step(np.asarray(x, dtype=np.float64), low, high, invert)
+        return pack_step_mask(mask=mask)
 
     __call__ = compute_numeric
+
+
+class StepArray:
+    """
+    Evaluate many step desirabilities at once.
+
+    The parameters of K step desirabilities, of any mix of the right step,
+    left step and centered step kinds, are stored as contiguous arrays, so
+    that N inputs for each of the K objectives are scored with a handful of
+    broadcast NumPy operations instead of N * K calls.
+
+    Every step is stored as an interval [lower, upper] with an invert flag:
+    a right step is [high, inf], a left step is [-inf, low] and a centered
+    step is [low, high].
+
+    The parameters are read when the StepArray is created; later changes to
+    the step desirabilities are not reflected.
+
+    Args:
+        steps (Sequence[Desirability]): The RightStep, LeftStep and Step
+            desirabilities to evaluate, one per objective.
+
+    Raises:
+        ParameterValueNotSet: If any required parameter of a step is not set.
+        TypeError: If any of the desirabilities is not a step.
+
+    Usage Example:
+
+    >>> import numpy as np
+    >>> from pumas.desirability import desirability_catalogue
+
+    >>> rightstep = desirability_catalogue.get("rightstep")
+    >>> leftstep = desirability_catalogue.get("leftstep")
+    >>> step_array = StepArray(
+    ...     [
+    ...         rightstep(params={"low": 0.0, "high": 2.0}),
+    ...         leftstep(params={"low": 1.0, "high": 2.0, "shift": 0.5}),
+    ...     ]
+    ... )
+    >>> print(step_array.evaluate(np.array([[1.0, 1.0], [3.0, 3.0]])))
+    [[0.  1. ]
+     [1.  0.5]]
+    """
+
+    def __init__(self, steps: Sequence[Desirability]):
+        lowers, uppers, inverts, shifts = [], [], [], []
+        for step in steps:
+            if not isinstance(step, (RightStep, LeftStep, Step)):
+                raise TypeError(
+                    f"Expected a step desirability, got {type(step).__name__}."
+                )
+            step._check_parameters_values_none()
+            parameters = step.get_parameters_values()
+            low, high = parameters["low"], parameters["high"]
+            if isinstance(step, RightStep):
+                low, high = high, float("inf")
+            elif isinstance(step, LeftStep):
+                low, high = float("-inf"), low
+            lowers.append(low)
+            uppers.append(high)
+            inverts.append(parameters.get("invert", False))
+            shifts.append(parameters["shift"])
+
+        self._lowers = np.array(lowers, dtype=np.float64)
+        self._uppers = np.array(uppers, dtype=np.float64)
+        self._inverts = np.array(inverts, dtype=bool)
+        self._shifts = np.array(shifts, dtype=np.float64)
+        self._scales = 1.0 - self._shifts
+
+    def __len__(self) -> int:
+        return len(self._shifts)
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        """
+        Compute the step desirabilities for N inputs of each objective.
+
+        Args:
+            x (np.ndarray): The input values, of shape (N, K) with one column
+                per step, or of shape (N,) to score the same values with
+                every step.
+
+        Returns:
+            np.ndarray: The computed desirability values, of shape (N, K).
+        """
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim == 1:
+            x = x[:, np.newaxis]
+        mask = np.greater_equal(x, self._lowers)
+        np.logical_and(mask, np.less_equal(x, self._uppers), out=mask)
+        np.not_equal(mask, self._inverts, out=mask)
+        result = np.multiply(mask, self._scales)
+        np.add(result, self._shifts, out=result)
+        return result
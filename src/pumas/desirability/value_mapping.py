@@ -1,15 +1,52 @@
-from typing import Any, Dict, Optional
+from itertools import repeat
+from typing import Any, Dict, Optional, Sequence, Union
 
+import numpy as np
+
+from pumas.architecture.exceptions import InvalidInputTypeError
 from pumas.desirability.base_models import Desirability
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import UFloat
 
+# Desirability of inputs missing from the mapping, unchanged by the shift
+_NAN = float("nan")
 
-def value_mapping(x: str, mapping: Dict[str, float], shift: float = 0.0) -> float:
+
+def validate_value_mapping(mapping: Dict[str, float]) -> None:
+    """
+    Validate that all the mapping values are desirabilities.
+
+    Args:
+        mapping (Dict[str, float]): The mapping of inputs to desirability values.
+
+    Raises:
+        ValueError: If any of the mapping values are not between 0 and 1.
+    """
     # none of the mappings values should be lower than 0 or higher than 1
     if not all(0 <= value <= 1 for value in mapping.values()):
         raise ValueError("Mapping values should be between 0 and 1")
 
-    result = mapping.get(x, float("nan"))
+
+def shift_value_mapping(
+    mapping: Dict[str, float], shift: float = 0.0
+) -> Dict[str, float]:
+    """
+    Apply the shift to every value of a mapping.
+
+    Args:
+        mapping (Dict[str, float]): The mapping of inputs to desirability values.
+        shift (float): Vertical shift of the function. Default is 0.0.
+
+    Returns:
+        Dict[str, float]: A new mapping with the shifted values.
+    """
+    one_minus_shift = 1 - shift
+    return {key: value * one_minus_shift + shift for key, value in mapping.items()}
+
+
+def value_mapping(x: str, mapping: Dict[str, float], shift: float = 0.0) -> float:
+    validate_value_mapping(mapping=mapping)
+
+    result = mapping.get(x, _NAN)
 
     # Apply the shift
     result = result * (1 - shift) + shift
@@ -77,6 +114,28 @@ class ValueMapping(Desirability):
         )
         self._validate_and_set_parameters(params)
 
+    def _on_parameters_update(self) -> None:
+        self._coefficients_ready = False
+
+    def _prepare_coefficients(self) -> None:
+        """
+        Validate the mapping and apply the shift to its values.
+
+        This is done once, on the first computation after the parameters
+        change, so that a computation is a single dictionary lookup.
+
+        Raises:
+            ParameterValueNotSet: If any required parameter is not set.
+            ValueError: If any of the mapping values are not between 0 and 1.
+        """
+        if self._coefficients_ready:
+            return
+        self._check_parameters_values_none()
+        parameters = self.get_parameters_values()
+        validate_value_mapping(mapping=parameters["mapping"])
+        self._shifted_mapping: Dict[str, float] = shift_value_mapping(**parameters)
+        self._coefficients_ready = True
+
     def compute_string(self, x: str) -> float:
         """
         Compute the value mapping desirability for a string input.
@@ -92,9 +151,40 @@ class ValueMapping(Desirability):
             ParameterValueNotSet: If any required parameter is not set.
         """
         self._validate_compute_input(x, str)
-        self._check_parameters_values_none()
-        parameters = self.get_parameters_values()
-        return value_mapping(x=x, **parameters)
+        self._prepare_coefficients()
+        return self._shifted_mapping.get(x, _NAN)
+
+    def compute_string_batch(self, x: Union[Sequence[str], np.ndarray]) -> np.ndarray:
+        """
+        Compute the value mapping desirability for an array of string inputs.
+
+        The lookups run in a single C-level pass over the inputs with the
+        precomputed shifted mapping.
+
+        Args:
+            x (Union[Sequence[str], np.ndarray]): The input values.
+
+        Returns:
+            np.ndarray: The computed desirability values, with the shape of x.
+
+        Raises:
+            InvalidInputTypeError: If any of the inputs is not a str.
+            ParameterValueNotSet: If any required parameter is not set.
+            ValueError: If any of the mapping values are not between 0 and 1.
+        """
+        self._prepare_coefficients()
+        # An object array keeps the inputs as they are, so that non-str
+        # inputs are rejected as by compute_string instead of converted
+        if not isinstance(x, np.ndarray):
+            x = np.asarray(x, dtype=object)
+        values = x.ravel().tolist()
+        for value_type in set(map(type, values)):
+            if not issubclass(value_type, str):
+                raise InvalidInputTypeError(
+                    f"Expected str, got {value_type.__name__} instead."
+                )
+        lookups = map(self._shifted_mapping.get, values, repeat(_NAN))
+        return np.fromiter(lookups, dtype=np.float64, count=x.size).reshape(x.shape)
 
     def compute_numeric(self, x: float) -> float:
         raise NotImplementedError
@@ -1,82 +1,168 @@
 import concurrent.futures
-from typing import Any, Callable, Iterable, List, Tuple
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 
-def parallelize(
-    func: Callable[[Any], Any],
-    data: Iterable[Any],
-    num_jobs: int = 0,
-    method: str = "threads",
-) -> List[Any]:
+
+def _validate(func: Callable[[Any], Any], num_jobs: int, method: str) -> None:
     if num_jobs < 0:
         raise ValueError("Number of jobs must be a non-negative integer")
-    if method not in ["threads", "processes"]:
+    if method not in ("threads", "processes"):
         raise ValueError("Method must be one of 'threads' or 'processes'")
-    if not isinstance(func, Callable):
+    if not callable(func):
         raise ValueError("The func argument must be callable")
 
-    if num_jobs == 0 or method not in ["threads", "processes"]:
-        return [func(item) for item in data]
 
-    executor_cls = (
-        concurrent.futures.ThreadPoolExecutor
-        if method == "threads"
-        else concurrent.futures.ProcessPoolExecutor
-    )
+def _map_chunksize(data: Sequence[Any], num_jobs: int, method: str) -> int:
+    """
+    Number of items sent to a worker at once by executor.map.
+
+    Threads share memory and take one item at a time. Processes receive
+    about four chunks each, so that items are pickled in batches rather than
+    one round-trip per item, while keeping some load balancing.
+    """
+    if method == "threads":
+        return 1
+    return max(1, len(data) // (num_jobs * 4))
+
 
+def _executor_map(
+    func: Callable[[Any], Any],
+    data: Sequence[Any],
+    num_jobs: int,
+    method: str,
+    initializer: Optional[Callable[..., Any]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> List[Any]:
+    chunksize = _map_chunksize(data, num_jobs, method)
     try:
-        with executor_cls(max_workers=num_jobs) as executor:
-            results = list(executor.map(func, data))
-        return results
+        if method == "threads":
+            # A pool per call: a task may itself map items in threads, which
+            # would deadlock on a pool shared with its caller
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=num_jobs
+            ) as executor:
+                return list(executor.map(func, data, chunksize=chunksize))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=num_jobs, initializer=initializer, initargs=initargs
+        ) as executor:
+            return list(executor.map(func, data, chunksize=chunksize))
     except Exception as e:
         raise RuntimeError(f"Parallel execution failed: {e}")
 
 
+def parallelize(
+    func: Callable[[Any], Any],
+    data: Iterable[Any],
+    num_jobs: int = 0,
+    method: str = "threads",
+    initializer: Optional[Callable[..., Any]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> List[Any]:
+    """
+    Apply a function to each item of data, in a pool of workers.
+
+    The initializer, if any, is called with initargs once in each worker
+    process, so that large shared state is pickled once per worker instead of
+    once per task. It is only supported with the "processes" method, and is
+    never called in the calling process: with an initializer, the items are
+    always mapped in worker processes, even for a single job.
+
+    Args:
+        func: The function applied to each item.
+        data: The items.
+        num_jobs: The number of workers; 0 or 1 computes serially.
+        method: Either "threads" or "processes".
+        initializer: A function preparing the state used by func in each
+            worker process.
+        initargs: The arguments of the initializer.
+
+    Returns:
+        The results of func, in the order of data.
+
+    Raises:
+        ValueError: If the arguments are invalid, or an initializer is given
+            with the "threads" method.
+    """
+    _validate(func, num_jobs, method)
+
+    if not isinstance(data, Sequence):
+        data = list(data)
+
+    if initializer is not None:
+        if method != "processes":
+            raise ValueError("An initializer requires the 'processes' method")
+        if not data:
+            return []
+        # The worker state must not leak into the calling process, so the
+        # items are mapped in processes even when a pool cannot speed them up
+        num_jobs = min(max(num_jobs, 1), len(data))
+        return _executor_map(func, data, num_jobs, method, initializer, initargs)
+
+    # A pool cannot speed up fewer than two items or a single worker
+    if num_jobs <= 1 or len(data) <= 1:
+        return [func(item) for item in data]
+
+    return _executor_map(func, data, num_jobs, method, initializer, initargs)
+
+
 def parallelize_with_indices(
     func: Callable[[Any], Any],
     data: List[Tuple[int, Any]],
     num_jobs: int = 0,
     method: str = "threads",
 ) -> List[Tuple[int, Any]]:
+    _validate(func, num_jobs, method)
+
+    if num_jobs <= 1 or len(data) <= 1:
+        return [(i, func(item)) for i, item in data]
+
+    # executor.map yields the results in the order of data
+    # func is bound once, so the items sent to the workers are the bare pairs
+    return _executor_map(partial(_apply_func_with_index, func), data, num_jobs, method)
+
+
+def parallelize_array(
+    func: Callable[[np.ndarray], np.ndarray],
+    array: np.ndarray,
+    num_jobs: int = 0,
+    min_chunk_size: int = 65536,
+) -> np.ndarray:
+    """
+    Apply an element-wise array function to contiguous chunks of an array in threads.
+
+    NumPy ufuncs release the GIL on large arrays, so the chunks are computed
+    concurrently by threads without copying the data to other processes.
+    Arrays too small to give each thread at least min_chunk_size elements
+    are computed with fewer threads, or with a single call to func.
+
+    Args:
+        func: An element-wise function returning an array with the shape of its input.
+        array: The input array.
+        num_jobs: The maximum number of threads; 0 computes in the calling thread.
+        min_chunk_size: The minimum number of elements computed by each thread.
+
+    Returns:
+        The result of func on the whole array.
+    """  # noqa: E501
     if num_jobs < 0:
         raise ValueError("Number of jobs must be a non-negative integer")
-    if method not in ["threads", "processes"]:
-        raise ValueError("Method must be one of 'threads' or 'processes'")
-    if not isinstance(func, Callable):
+    if not callable(func):
         raise ValueError("The func argument must be callable")
 
-    if num_jobs == 0 or method not in ["threads", "processes"]:
-        return [(i, func(item)) for i, item in data]
-
-    executor_cls = (
-        concurrent.futures.ThreadPoolExecutor
-        if method == "threads"
-        else concurrent.futures.ProcessPoolExecutor
-    )
+    array = np.asarray(array)
+    num_chunks = min(num_jobs, array.size // max(min_chunk_size, 1))
+    if num_chunks <= 1:
+        return func(array)
 
-    try:
-        with executor_cls(max_workers=num_jobs) as executor:
-            results = list(
-                executor.map(_apply_func_with_index, [(func, pair) for pair in data])
-            )
-
-        # want to return the results in the order of the original data
-        # this might be unnecessary if the order is guaranteed
-        # to be preserved by the executor
-        # we keep it here to be safe should we change the parallelization approach
-        # Create a dictionary to map indices to their results
-        result_dict = {index: result for index, result in results}
-
-        # Reconstruct the list in the original order provided by the data
-        ordered_results = [(index, result_dict[index]) for index, _ in data]
-
-        return ordered_results
-    except Exception as e:
-        raise RuntimeError(f"Parallel execution failed: {e}")
+    chunks = np.array_split(array.reshape(-1), num_chunks)
+    results = parallelize(func, chunks, num_jobs=num_chunks, method="threads")
+    return np.concatenate(results).reshape(array.shape)
 
 
 def _apply_func_with_index(
-    args: Tuple[Callable[[Any], Any], Tuple[int, Any]]
+    func: Callable[[Any], Any], pair: Tuple[int, Any]
 ) -> Tuple[int, Any]:
     """
     NOTE to the developer: the pickle module is used to serialize the function and its arguments
@@ -86,5 +172,5 @@ def _apply_func_with_index(
     For more information, see:
     https://stackoverflow.com/questions/72766345/attributeerror-cant-pickle-local-object-in-multiprocessing
     """  # noqa: E501
-    func, (index, value) = args
+    index, value = pair
     return index, func(value)
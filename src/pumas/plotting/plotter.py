@@ -1,5 +1,5 @@
 # type: ignore
-from typing import cast
+from typing import Dict, Optional, cast
 
 import numpy as np
 
@@ -14,6 +14,30 @@ except ImportError:
     Axes = None
 
 
+def _compute_curve(
+    desirability_class,
+    coefficient_parameters: dict,
+    x_values,
+    curve_cache: Optional[Dict[tuple, np.ndarray]] = None,
+) -> np.ndarray:
+    """Desirability values over x_values, reused across calls through curve_cache."""
+    try:
+        key = tuple(sorted(coefficient_parameters.items()))
+        hash(key)
+    except TypeError:
+        # Unhashable parameter values, such as mappings, are computed every time
+        key = None
+    if curve_cache is not None and key is not None and key in curve_cache:
+        return curve_cache[key]
+
+    y_values = desirability_class(params=coefficient_parameters).compute_numeric_batch(
+        x_values
+    )
+    if curve_cache is not None and key is not None:
+        curve_cache[key] = y_values
+    return y_values
+
+
 def plot_subplot(
     desirability_class,
     ax: Axes,
@@ -25,6 +49,7 @@ def plot_subplot(
     vertical_lines_x_values: list[float] = None,
     points: list[tuple[float, float]] = None,
     plot_reference: bool = True,
+    curve_cache: Optional[Dict[tuple, np.ndarray]] = None,
 ):
     ax.set_xlim([min(x_values), max(x_values)])
     ax.set_ylim([-0.1, 1.1])
@@ -34,13 +59,8 @@ def plot_subplot(
 
     # Plot reference
     if plot_reference:
-        y_values_ref = np.array(
-            [
-                desirability_class(
-                    params=reference_coefficient_parameters
-                ).compute_numeric(x=xi)
-                for xi in x_values
-            ]
+        y_values_ref = _compute_curve(
+            desirability_class, reference_coefficient_parameters, x_values, curve_cache
         )
         ref_def = f"Ref.: ({param_name}={reference_coefficient_parameters[param_name]})"
 
@@ -58,11 +78,8 @@ def plot_subplot(
         coefficient_parameters = reference_coefficient_parameters.copy()
         coefficient_parameters[param_name] = param_value
 
-        y_values = np.array(
-            [
-                desirability_class(params=coefficient_parameters).compute_numeric(x=xi)
-                for xi in x_values
-            ]
+        y_values = _compute_curve(
+            desirability_class, coefficient_parameters, x_values, curve_cache
         )
         ax.plot(x_values, y_values, label=f"{param_name}={param_value}", linewidth=4)
 
@@ -111,6 +128,10 @@ def plot_parameter_analysis(
     if nrows == 1 and ncols == 1:
         axs = np.array([axs])  # Make it 2D for consistent indexing
 
+    # The reference curve, and any case repeated across parameters,
+    # is computed once for all the subplots
+    curve_cache: Dict[tuple, np.ndarray] = {}
+
     for i, param in enumerate(parameters):
         row = i // 2
         col = i % 2
@@ -127,6 +148,7 @@ def plot_parameter_analysis(
             vertical_lines_x_values=vertical_lines_x_values,
             points=points,
             plot_reference=plot_reference,
+            curve_cache=curve_cache,
         )
 
     plt.tight_layout()
@@ -1,18 +1,78 @@
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
-from pumas.scoring_framework.models import InputData, ScoringResults
-from pumas.scoring_framework.scoring_function import ScoringFunction
+from pumas.parallelization.parallel_utils import parallelize
+from pumas.scoring_framework.models import (
+    InputData,
+    ObjectPropertiesMap,
+    ScoringResult,
+    ScoringResults,
+)
+from pumas.scoring_framework.scoring_function import ScoreComputer, ScoringFunction
 from pumas.scoring_framework.type_definitions import R, T
 from pumas.scoring_profile.scoring_profile import ScoringProfile
 
 
+def resolve_num_jobs(n_jobs: int) -> int:
+    """
+    Convert a number of jobs to a number of worker processes.
+
+    Negative values count back from the number of CPUs, so that -1 uses all
+    of them and -2 all but one.
+    """
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+# Score computer of a worker process, set once per worker by _init_score_worker
+_worker_score_computer: Optional[ScoreComputer[Any, Any]] = None
+
+
+def _init_score_worker(score_computer: ScoreComputer[Any, Any]) -> None:
+    global _worker_score_computer
+    _worker_score_computer = score_computer
+
+
+def _score_chunk(
+    chunk: List[Tuple[str, Mapping[str, Any]]],
+) -> List[Tuple[str, Any, Dict[str, Any]]]:
+    """
+    Score a chunk of objects in a worker process.
+
+    The score computer is received once per worker, by _init_score_worker,
+    rather than with every chunk. The scores are returned as plain tuples,
+    since the parametrized ScoringResult models cannot be pickled back to the
+    parent process.
+    """
+    score_computer = cast(ScoreComputer[Any, Any], _worker_score_computer)
+    return [
+        (uid, *score_computer.compute_scores(object_values))
+        for uid, object_values in chunk
+    ]
+
+
 class BaseScoringStrategy(Generic[T, R], ABC):
     def __init__(self, profile: ScoringProfile):
         self.profile = profile
         self.scoring_function: ScoringFunction[T, R] = self._create_scoring_function(
             profile
         )
+        self._required_objectives: FrozenSet[str] = frozenset(
+            obj.name for obj in profile.objectives
+        )
 
     @abstractmethod
     def _create_scoring_function(
@@ -25,14 +85,75 @@ class BaseScoringStrategy(Generic[T, R], ABC):
         self,
         input_data: InputData[T],
         chunk_size: int = 100,
-        n_jobs: int = -1,
+        n_jobs: int = 1,
+        validate: bool = True,
         **compute_options: Dict[str, Any],
     ) -> ScoringResults[R]:
         pass
 
+    @abstractmethod
+    def serial_process_with_uid(
+        self, data: Dict[str, ObjectPropertiesMap[T]]
+    ) -> Dict[str, ScoringResult[R]]:
+        pass
+
+    def process_with_uid(
+        self,
+        data: Dict[str, ObjectPropertiesMap[T]],
+        result_type: Type[ScoringResult[R]],
+        chunk_size: int = 100,
+        n_jobs: int = 1,
+    ) -> Dict[str, ScoringResult[R]]:
+        """
+        Score the objects, in chunks across worker processes when worthwhile.
+
+        Inputs of at most chunk_size objects, or a single job, are scored
+        serially, so that small inputs do not pay for starting processes.
+        Results computed in workers hold copies of the input values, so UFloat
+        scores keep their standard deviations but are not correlated with
+        the UFloat inputs of the calling process.
+
+        Args:
+            data (Dict[str, ObjectPropertiesMap[T]]): The objects to score, by uid.
+            result_type (Type[ScoringResult[R]]): The scoring result model.
+            chunk_size (int): The number of objects scored by each task.
+            n_jobs (int): The number of worker processes; negative values
+                count back from the number of CPUs. Defaults to 1, so that
+                processes are only started when the caller asks for them.
+
+        Returns:
+            Dict[str, ScoringResult[R]]: The scoring results, by uid.
+        """
+        num_jobs = resolve_num_jobs(n_jobs)
+        chunk_size = max(1, chunk_size)
+        if num_jobs <= 1 or len(data) <= chunk_size:
+            return self.serial_process_with_uid(data=data)
+
+        items = [(uid, object_data.data) for uid, object_data in data.items()]
+        chunks = [
+            items[start : start + chunk_size]
+            for start in range(0, len(items), chunk_size)
+        ]
+        scored_chunks = parallelize(
+            _score_chunk,
+            chunks,
+            num_jobs=min(num_jobs, len(chunks)),
+            method="processes",
+            initializer=_init_score_worker,
+            initargs=(self.scoring_function.score_computer,),
+        )
+        return {
+            uid: result_type(
+                aggregated_score=aggregated_score,
+                desirability_scores=desirability_scores,
+            )
+            for scored_chunk in scored_chunks
+            for uid, aggregated_score, desirability_scores in scored_chunk
+        }
+
     def _validate_input(self, data: InputData[T]) -> None:
-        required_objectives = [obj.name for obj in self.profile.objectives]
-        if not data.validate_objectives(required_objectives):
+        if not data.validate_objectives(self._required_objectives):
+            required_objectives = [obj.name for obj in self.profile.objectives]
             raise ValueError(
                 f"Input data missing required objectives: {required_objectives}"
             )
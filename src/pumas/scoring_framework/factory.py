@@ -52,7 +52,7 @@ class ScoringStrategyFactory:
         else:
             converted_data = data
 
-        return InputData[Any](data=converted_data)
+        return InputData[Any].from_trusted_dict(converted_data)
 
     @classmethod
     def create_strategy(
@@ -1,6 +1,16 @@
-from typing import Dict, Generic, List, Mapping, Optional
-
-from pydantic import BaseModel, Field
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from pydantic import BaseModel, ConfigDict, Field
 
 from pumas.scoring_framework.type_definitions import R, T
 
@@ -8,8 +18,7 @@ from pumas.scoring_framework.type_definitions import R, T
 class ObjectPropertiesMap(BaseModel, Generic[T]):
     data: Dict[str, Optional[T]] = Field(default_factory=dict)
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     def __init__(self, *args, **kwargs):
         if len(args) == 1 and isinstance(args[0], dict):
@@ -48,28 +57,89 @@ class ObjectPropertiesMap(BaseModel, Generic[T]):
         self.data.update(*args, **kwargs)
 
 
+def properties_to_soa(
+    data: Mapping[str, ObjectPropertiesMap[T]], objective_names: Sequence[str]
+) -> Tuple[List[str], List[List[Optional[T]]]]:
+    """
+    Gather the objects values into one column per objective.
+
+    Args:
+        data (Mapping[str, ObjectPropertiesMap[T]]): The objects, by uid.
+        objective_names (Sequence[str]): The objectives to gather.
+
+    Returns:
+        Tuple[List[str], List[List[Optional[T]]]]: The uids, and for each
+            objective the values of the objects in uid order, with None for
+            missing values.
+    """
+    rows = [object_data.data for object_data in data.values()]
+    columns = [[row.get(name) for row in rows] for name in objective_names]
+    return list(data), columns
+
+
 class InputData(BaseModel, Generic[T]):
     data: Dict[str, ObjectPropertiesMap[T]]
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @classmethod
+    def from_trusted_dict(
+        cls, data: Mapping[str, Mapping[str, Optional[T]]]
+    ) -> "InputData[T]":
+        """
+        Build the input data from a dict of objects values, skipping validation.
+
+        Each object's values are validated by building its ObjectPropertiesMap,
+        and the uids are checked to be strings; only the validation of the
+        InputData model itself is skipped.
+
+        Args:
+            data (Mapping[str, Mapping[str, Optional[T]]]): The objects values, by uid.
+
+        Returns:
+            InputData[T]: The input data.
+
+        Raises:
+            ValueError: If a uid is not a string, or the values of an object
+                are not a valid mapping.
+        """  # noqa: E501
+        # Parametrize once: the generic lookup costs more than the construction
+        properties_map = ObjectPropertiesMap[Any]
+        properties_maps = {}
+        for uid, values in data.items():
+            if not isinstance(uid, str):
+                raise ValueError(f"Object uids must be strings, got: {uid!r}")
+            if isinstance(values, ObjectPropertiesMap):
+                properties_maps[uid] = values
+            elif isinstance(values, Mapping):
+                properties_maps[uid] = properties_map(values)
+            else:
+                raise ValueError(
+                    f"The values of object {uid!r} must be a mapping, "
+                    f"got {type(values).__name__}"
+                )
+        return cls.model_construct(data=properties_maps)
 
     def items(self):
         return self.data.items()
 
-    def validate_objectives(self, required_objectives: List[str]) -> bool:
-        return all(
-            all(obj in obj_data.data for obj in required_objectives)
-            for obj_data in self.data.values()
-        )
+    def validate_objectives(self, required_objectives: Iterable[str]) -> bool:
+        # One C-level subset test of the keys per object
+        required = frozenset(required_objectives)
+        return all(obj_data.data.keys() >= required for obj_data in self.data.values())
+
+    def to_soa(
+        self, objective_names: Sequence[str]
+    ) -> Tuple[List[str], List[List[Optional[T]]]]:
+        """Return the uids and one column of values per objective."""
+        return properties_to_soa(self.data, objective_names)
 
 
 class ScoringResult(BaseModel, Generic[R]):
     aggregated_score: Optional[R]
     desirability_scores: Mapping[str, Optional[R]]
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class ScoringResults(BaseModel, Generic[R]):
@@ -1,14 +1,27 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+import numpy as np
 
 from pumas.aggregation.base_models import Aggregation
+from pumas.aggregation.weighted_arithmetic_mean import (
+    WeightedArithmeticMeanAggregation,
+    compute_array_weighted_arithmetic_mean_gradient,
+)
+from pumas.aggregation.weighted_geometric_mean import (
+    WeightedGeometricMeanAggregation,
+    compute_array_weighted_geometric_mean_gradient,
+)
 from pumas.desirability.base_models import Desirability
+from pumas.desirability.sigmoid import SigmoidArray
 from pumas.scoring_framework.base_models import BaseScoringStrategy
 from pumas.scoring_framework.models import (
     InputData,
     ObjectPropertiesMap,
     ScoringResult,
     ScoringResults,
+    properties_to_soa,
 )
+from pumas.scoring_framework.numeric_noerp import build_desirability_array
 from pumas.scoring_framework.scoring_function import (
     ScoringFunction,
     TypedAggregation,
@@ -17,8 +30,19 @@ from pumas.scoring_framework.scoring_function import (
 from pumas.scoring_profile.scoring_profile import ScoringProfile
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import UFloat
 
+# Closed-form gradients of the aggregations that the batch path propagates
+_AGGREGATION_GRADIENTS: Dict[
+    Type[Aggregation], Callable[[np.ndarray, np.ndarray], np.ndarray]
+] = {
+    WeightedArithmeticMeanAggregation: compute_array_weighted_arithmetic_mean_gradient,
+    WeightedGeometricMeanAggregation: compute_array_weighted_geometric_mean_gradient,
+}
+
 
 class NumericFOERPScoringStrategy(BaseScoringStrategy[UFloat, UFloat]):
+    # Smallest number of objects scored through the vectorized batch path
+    batch_threshold: int = 32
+
     @staticmethod
     def _desirability_wrapper(
         d: Desirability,
@@ -66,15 +90,119 @@ class NumericFOERPScoringStrategy(BaseScoringStrategy[UFloat, UFloat]):
         }
         return results
 
+    def batch_process_with_uid(
+        self, data: Dict[str, ObjectPropertiesMap[UFloat]]
+    ) -> Optional[Dict[str, ScoringResult[UFloat]]]:
+        """
+        Score all the objects by first-order propagation over arrays.
+
+        The nominal desirability and aggregated scores, and their derivatives
+        with respect to the inputs, are computed over (N, K) arrays. Each score
+        is then rebuilt as its nominal value plus its linear term in the input
+        deviations, so that it has the uncertainty, and the correlations with
+        the inputs, of the per-object computation.
+
+        This applies to profiles of smooth sigmoids, with weights, aggregated
+        by the arithmetic or geometric mean, and to inputs with a finite UFloat
+        value for every objective.
+
+        Args:
+            data (Dict[str, ObjectPropertiesMap[UFloat]]): The objects to score, by uid.
+
+        Returns:
+            Optional[Dict[str, ScoringResult[UFloat]]]: The scoring results by uid,
+                or None if the profile or the inputs are not supported.
+        """  # noqa: E501
+        objectives = self.profile.objectives
+        names = [obj.name for obj in objectives]
+        weights = [obj.weight for obj in objectives]
+        aggregation = self.scoring_function.aggregation_function.aggregation
+        aggregation_gradient = _AGGREGATION_GRADIENTS.get(type(aggregation))
+        if aggregation_gradient is None or None in weights:
+            return None
+
+        desirability_array = build_desirability_array(
+            [
+                self.scoring_function.desirability_functions[name].desirability
+                for name in names
+            ]
+        )
+        if (
+            not isinstance(desirability_array, SigmoidArray)
+            or desirability_array.has_hard_sigmoids
+        ):
+            return None
+
+        uids, values_columns = properties_to_soa(data, names)
+        values_rows = list(zip(*values_columns))
+        if not all(isinstance(value, UFloat) for row in values_rows for value in row):
+            return None
+        nominal_values = np.array(
+            [[value.nominal_value for value in row] for row in values_rows],
+            dtype=np.float64,
+        ).reshape(len(values_rows), len(names))
+        if not np.isfinite(nominal_values).all():
+            return None
+
+        scores, derivatives = desirability_array.evaluate_with_derivative(
+            nominal_values
+        )
+        weights_array = np.array(weights, dtype=np.float64)
+        gradients = aggregation_gradient(scores, weights_array)
+        if not np.isfinite(gradients).all():
+            return None
+        aggregated_scores = aggregation.compute_numeric_batch(scores, weights)
+        # Chain rule: derivatives of the aggregated scores w.r.t. the inputs
+        coefficients = gradients * derivatives
+
+        nominal_rows = nominal_values.tolist()
+        scores_rows = scores.tolist()
+        derivatives_rows = derivatives.tolist()
+        coefficients_rows = coefficients.tolist()
+        aggregated_rows = aggregated_scores.tolist()
+
+        results = {}
+        for i, uid in enumerate(uids):
+            deviations = [
+                value - nominal
+                for value, nominal in zip(values_rows[i], nominal_rows[i])
+            ]
+            desirability_scores = {
+                name: scores_rows[i][k] + derivatives_rows[i][k] * deviations[k]
+                for k, name in enumerate(names)
+            }
+            aggregated_score = aggregated_rows[i] + sum(
+                coefficient * deviation
+                for coefficient, deviation in zip(coefficients_rows[i], deviations)
+            )
+            results[uid] = ScoringResult[UFloat](
+                aggregated_score=aggregated_score,
+                desirability_scores=desirability_scores,
+            )
+        return results
+
     def compute(
         self,
         input_data: InputData[UFloat],
         chunk_size: int = 100,
-        n_jobs: int = -1,
+        n_jobs: int = 1,
+        validate: bool = True,
         **compute_options: Dict[str, Any],
     ) -> ScoringResults[UFloat]:
-        self._validate_input(input_data)
+        # Scores computed in worker processes are not correlated with the
+        # caller's UFloat inputs, so processes are only used on request
+        if validate:
+            self._validate_input(input_data)
 
-        results = self.serial_process_with_uid(data=input_data.data)
+        results = None
+        if len(input_data.data) >= self.batch_threshold:
+            results = self.batch_process_with_uid(data=input_data.data)
+        if results is None:
+            results = self.process_with_uid(
+                data=input_data.data,
+                result_type=ScoringResult[UFloat],
+                chunk_size=chunk_size,
+                n_jobs=n_jobs,
+            )
 
         return ScoringResults[UFloat](results=results)
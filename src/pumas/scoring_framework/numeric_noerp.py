@@ -1,13 +1,18 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
 
 from pumas.aggregation.base_models import Aggregation
 from pumas.desirability.base_models import Desirability
+from pumas.desirability.sigmoid import Sigmoid, SigmoidArray
+from pumas.desirability.step import LeftStep, RightStep, Step, StepArray
 from pumas.scoring_framework.base_models import BaseScoringStrategy
 from pumas.scoring_framework.models import (
     InputData,
     ObjectPropertiesMap,
     ScoringResult,
     ScoringResults,
+    properties_to_soa,
 )
 from pumas.scoring_framework.scoring_function import (
     ScoringFunction,
@@ -16,8 +21,51 @@ from pumas.scoring_framework.scoring_function import (
 )
 from pumas.scoring_profile.scoring_profile import ScoringProfile
 
+_NONE_TYPE = type(None)
+
+
+def _accepts_values(desirability: Desirability, values: Sequence[Any]) -> bool:
+    """
+    Whether compute_numeric of the desirability accepts all the values.
+
+    Missing values are accepted, as they are skipped by the scoring. The
+    check runs over the distinct types of the values, so that the batch path
+    accepts and rejects the same inputs as the per-object computation.
+    """
+    accepted_type = desirability.numeric_input_type
+    return all(
+        value_type is _NONE_TYPE or issubclass(value_type, accepted_type)
+        for value_type in set(map(type, values))
+    )
+
+
+def build_desirability_array(
+    desirabilities: Sequence[Desirability],
+) -> Optional[Union[SigmoidArray, StepArray]]:
+    """
+    Return a fused evaluator of the desirabilities, if they all share one.
+
+    Profiles made only of sigmoids, or only of steps, are scored over the
+    whole (N, K) matrix of values in a single broadcast pass.
+
+    Args:
+        desirabilities (Sequence[Desirability]): One desirability per objective.
+
+    Returns:
+        Optional[Union[SigmoidArray, StepArray]]: The fused evaluator, or None
+            if the desirabilities are of other or mixed families.
+    """
+    if all(isinstance(d, Sigmoid) for d in desirabilities):
+        return SigmoidArray(desirabilities)
+    if all(isinstance(d, (RightStep, LeftStep, Step)) for d in desirabilities):
+        return StepArray(desirabilities)
+    return None
+
 
 class NumericScoringStrategy(BaseScoringStrategy[float, float]):
+    # Smallest number of objects scored through the vectorized batch path
+    batch_threshold: int = 32
+
     @staticmethod
     def _desirability_wrapper(d: Desirability) -> TypedDesirability[float, float]:
         return TypedDesirability[float, float](
@@ -58,16 +106,91 @@ class NumericScoringStrategy(BaseScoringStrategy[float, float]):
         }
         return all_results
 
+    def batch_process_with_uid(
+        self, data: Dict[str, ObjectPropertiesMap[float]]
+    ) -> Optional[Dict[str, ScoringResult[float]]]:
+        """
+        Score all the objects with one vectorized call per objective.
+
+        The values of each objective are gathered into a float array, with
+        None as NaN, and scored by compute_numeric_batch of its desirability,
+        or all together when the desirabilities share a fused evaluator; the
+        matrix of desirability scores is then aggregated row by row by
+        compute_numeric_batch of the aggregation. Missing values get a None
+        desirability score, as in the per-object computation.
+
+        Args:
+            data (Dict[str, ObjectPropertiesMap[float]]): The objects to score, by uid.
+
+        Returns:
+            Optional[Dict[str, ScoringResult[float]]]: The scoring results by uid,
+                or None if some values are not accepted by the desirabilities.
+        """  # noqa: E501
+        objectives = self.profile.objectives
+        names = [obj.name for obj in objectives]
+        weights = [obj.weight for obj in objectives]
+        uids, values_columns = properties_to_soa(data, names)
+        desirabilities = [
+            self.scoring_function.desirability_functions[name].desirability
+            for name in names
+        ]
+        for desirability, values in zip(desirabilities, values_columns):
+            if not _accepts_values(desirability, values):
+                return None
+
+        desirability_array = build_desirability_array(desirabilities)
+        if desirability_array is not None:
+            values_matrix = np.array(values_columns, dtype=np.float64).T
+            scores_by_column = desirability_array.evaluate(values_matrix).T.tolist()
+        else:
+            scores_by_column = [
+                desirability.compute_numeric_batch(
+                    np.array(values, dtype=np.float64)
+                ).tolist()
+                for desirability, values in zip(desirabilities, values_columns)
+            ]
+
+        scores_columns = [
+            [None if value is None else score for value, score in zip(values, scores)]
+            for values, scores in zip(values_columns, scores_by_column)
+        ]
+
+        aggregation = self.scoring_function.aggregation_function.aggregation
+        scores_matrix = np.array(scores_columns, dtype=np.float64).T
+        aggregated_scores = aggregation.compute_numeric_batch(
+            scores_matrix, weights
+        ).tolist()
+        return {
+            uid: ScoringResult[float](
+                aggregated_score=aggregated_score,
+                desirability_scores=dict(zip(names, scores_row)),
+            )
+            for uid, aggregated_score, scores_row in zip(
+                uids, aggregated_scores, zip(*scores_columns)
+            )
+        }
+
     def compute(
         self,
         input_data: InputData[float],
         chunk_size: int = 100,
-        n_jobs: int = -1,
+        n_jobs: int = 1,
+        validate: bool = True,
         **compute_options: Dict[str, Any],
     ) -> ScoringResults[float]:
 
-        self._validate_input(input_data)
+        if validate:
+            self._validate_input(input_data)
 
-        results = self.serial_process_with_uid(data=input_data.data)
+        results = None
+        if len(input_data.data) >= self.batch_threshold:
+            results = self.batch_process_with_uid(data=input_data.data)
+        if results is None:
+            results = self.process_with_uid(
+                data=input_data.data,
+                result_type=ScoringResult[float],
+                chunk_size=chunk_size,
+                n_jobs=n_jobs,
+            )
 
         return ScoringResults[float](results=results)
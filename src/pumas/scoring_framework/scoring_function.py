@@ -1,4 +1,18 @@
-from typing import Callable, Dict, Generic, List, Optional, Sequence, Type, Union, cast
+from functools import partial
+from operator import itemgetter
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from pumas.aggregation import aggregation_catalogue
 from pumas.aggregation.base_models import Aggregation
@@ -14,6 +28,8 @@ from pumas.scoring_profile.scoring_profile import (
 
 
 class TypedDesirability(Generic[T, R]):
+    __slots__ = ("desirability", "compute_method", "compute")
+
     def __init__(
         self,
         desirability: Desirability,
@@ -21,12 +37,13 @@ class TypedDesirability(Generic[T, R]):
     ):
         self.desirability: Desirability = desirability
         self.compute_method: Callable[[Desirability, T], R] = compute_method
-
-    def compute(self, value: T) -> R:
-        return self.compute_method(self.desirability, value)
+        # Bound once, so that each call skips the compute method frame
+        self.compute: Callable[[T], R] = partial(compute_method, desirability)
 
 
 class TypedAggregation(Generic[R]):
+    __slots__ = ("aggregation", "compute_method", "compute")
+
     def __init__(
         self,
         aggregation: Aggregation,
@@ -38,11 +55,10 @@ class TypedAggregation(Generic[R]):
         self.compute_method: Callable[
             [Aggregation, List[Optional[R]], List[Optional[float]]], Optional[R]
         ] = compute_method
-
-    def compute(
-        self, values: List[Optional[R]], weights: List[Optional[float]]
-    ) -> Optional[R]:
-        return self.compute_method(self.aggregation, values, weights)
+        # Bound once, so that each call skips the compute method frame
+        self.compute: Callable[
+            [List[Optional[R]], List[Optional[float]]], Optional[R]
+        ] = partial(compute_method, aggregation)
 
 
 class DesirabilityFunctionFactory:
@@ -69,6 +85,18 @@ class AggregationFunctionFactory:
 
 
 class ScoreComputer(Generic[T, R]):
+    __slots__ = (
+        "desirability_functions",
+        "aggregation_function",
+        "objectives",
+        "_objective_names",
+        "_objective_weights",
+        "_desirability_items",
+        "_desirability_names",
+        "_values_getter",
+        "_names_aligned",
+    )
+
     def __init__(
         self,
         desirability_functions: Dict[str, TypedDesirability[T, R]],
@@ -79,22 +107,84 @@ class ScoreComputer(Generic[T, R]):
             desirability_functions
         )
         self.aggregation_function: TypedAggregation[R] = aggregation_function
-        self.objectives: Sequence[Objective] = objectives
+        self.objectives: Tuple[Objective, ...] = tuple(objectives)
+        # Snapshot of the objective attributes read for every scored object
+        self._objective_names: Tuple[str, ...] = tuple(obj.name for obj in objectives)
+        self._objective_weights: Tuple[float, ...] = tuple(
+            obj.weight for obj in objectives
+        )
+        self._desirability_items: Tuple[Tuple[str, TypedDesirability[T, R]], ...] = (
+            tuple(desirability_functions.items())
+        )
+        self._desirability_names: Tuple[str, ...] = tuple(desirability_functions)
+        # Reads all the values of an object in one C-level call; a single name
+        # would make itemgetter return a bare value instead of a tuple
+        self._values_getter: Optional[itemgetter] = (
+            itemgetter(*self._desirability_names)
+            if len(self._desirability_names) > 1
+            else None
+        )
+        # Whether the desirability scores come in the order of the objectives,
+        # so that they can be aggregated without a lookup by name
+        self._names_aligned: bool = self._desirability_names == self._objective_names
 
     def compute(self, data: ObjectPropertiesMap[T]) -> ScoringResult[R]:
-        desirability_scores = self._compute_desirability_scores(data)
-        aggregated_score = self._compute_aggregated_score(desirability_scores)
+        aggregated_score, desirability_scores = self.compute_scores(data)
         return ScoringResult[R](
             aggregated_score=aggregated_score, desirability_scores=desirability_scores
         )
 
+    def compute_scores(
+        self, data: Mapping[str, Optional[T]]
+    ) -> Tuple[Optional[R], Dict[str, Optional[R]]]:
+        """
+        Compute the aggregated and desirability scores of an object.
+
+        Args:
+            data (Mapping[str, Optional[T]]): The object values, by objective name.
+
+        Returns:
+            Tuple[Optional[R], Dict[str, Optional[R]]]: The aggregated score and
+                the desirability scores by objective name.
+        """
+        scores = self._compute_desirability_values(data)
+        desirability_scores = dict(zip(self._desirability_names, scores))
+        if self._names_aligned:
+            # The scores list is already in the order of the objectives
+            aggregated_score = self.aggregation_function.compute(
+                scores, list(self._objective_weights)
+            )
+        else:
+            aggregated_score = self._compute_aggregated_score(desirability_scores)
+        return aggregated_score, desirability_scores
+
     def _compute_desirability_scores(
-        self, data: ObjectPropertiesMap[T]
+        self, data: Mapping[str, Optional[T]]
     ) -> Dict[str, Optional[R]]:
-        return {
-            name: self._compute_single_desirability(name, data.get(name))
-            for name in self.desirability_functions
-        }
+        return dict(
+            zip(self._desirability_names, self._compute_desirability_values(data))
+        )
+
+    def _compute_desirability_values(
+        self, data: Mapping[str, Optional[T]]
+    ) -> List[Optional[R]]:
+        if isinstance(data, ObjectPropertiesMap):
+            data = data.data
+        return [
+            None if value is None else desirability_function.compute(value)
+            for (_, desirability_function), value in zip(
+                self._desirability_items, self._get_values(data)
+            )
+        ]
+
+    def _get_values(self, data: Mapping[str, Optional[T]]) -> Tuple[Optional[T], ...]:
+        if self._values_getter is not None:
+            try:
+                return self._values_getter(data)
+            except KeyError:
+                # Missing values are read as None
+                pass
+        return tuple(data.get(name) for name in self._desirability_names)
 
     def _compute_single_desirability(
         self, name: str, value: Optional[T]
@@ -106,12 +196,19 @@ class ScoreComputer(Generic[T, R]):
     def _compute_aggregated_score(
         self, desirability_scores: Dict[str, Optional[R]]
     ) -> Optional[R]:
-        values = [desirability_scores.get(obj.name) for obj in self.objectives]
-        weights = [obj.weight for obj in self.objectives]
+        values = [desirability_scores.get(name) for name in self._objective_names]
+        weights = list(self._objective_weights)
         return self.aggregation_function.compute(values, weights)
 
 
 class ScoringFunction(Generic[T, R]):
+    __slots__ = (
+        "profile",
+        "desirability_functions",
+        "aggregation_function",
+        "score_computer",
+    )
+
     def __init__(
         self,
         profile: ScoringProfile,
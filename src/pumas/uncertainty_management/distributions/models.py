@@ -1,17 +1,45 @@
-from typing import Dict, List, Union
+import copy
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 
 from pydantic import BaseModel
 
-from pumas.uncertainty_management.distributions.scipy_wrapper import stats
+if TYPE_CHECKING:
+    from scipy import stats
 
 
 class DistributionValue(BaseModel):
     distribution_name: str
     shape_parameters: Dict[str, Union[float, List[float]]]
 
-    @property
-    def distribution(self) -> stats.rv_continuous:
+    @cached_property
+    def _distribution_entry(self) -> Tuple[str, Dict[str, Any], Any]:
+        # Imported here, as scipy.stats is only loaded when first needed
+        from pumas.uncertainty_management.distributions.scipy_wrapper import stats
+
         continuous_distribution: stats.rv_continuous = getattr(
             stats, self.distribution_name
         )(**self.shape_parameters)
+        return (
+            self.distribution_name,
+            copy.deepcopy(self.shape_parameters),
+            continuous_distribution,
+        )
+
+    @property
+    def distribution(self) -> "stats.rv_continuous":
+        """
+        The frozen scipy distribution.
+
+        It is built on first access, and built again after the name or the
+        shape parameters change, by assignment, in place or in a copy: the
+        model is mutable, so the cached entry is checked on each access.
+        """
+        name, shape_parameters, continuous_distribution = self._distribution_entry
+        if (
+            name != self.distribution_name
+            or shape_parameters != self.shape_parameters
+        ):
+            del self.__dict__["_distribution_entry"]
+            continuous_distribution = self._distribution_entry[2]
         return continuous_distribution
@@ -1,15 +1,26 @@
+import importlib.util
+from typing import Any
+
 from pumas.reporting.exceptions import OptionalDependencyNotInstalled
 
-try:
-    from scipy import stats
+# scipy.stats is slow to import, so it is only imported on first access to
+# the stats attribute of this module (PEP 562)
+UNCERTAINTIES_AVAILABLE = importlib.util.find_spec("scipy") is not None
+
 
-    UNCERTAINTIES_AVAILABLE = True
-except ImportError:
-    from pumas.uncertainty_management.distributions.scipy_stubs import (
-        stats_stub as stats,
-    )
+def __getattr__(name: str) -> Any:
+    if name != "stats":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if UNCERTAINTIES_AVAILABLE:
+        from scipy import stats
+    else:
+        from pumas.uncertainty_management.distributions.scipy_stubs import (
+            stats_stub as stats,
+        )
 
-    UNCERTAINTIES_AVAILABLE = False
+    globals()["stats"] = stats
+    return stats
 
 
 def check_uncertainties_available() -> None:
@@ -19,4 +30,4 @@ def check_uncertainties_available() -> None:
         )
 
 
-__all__ = ["stats"]
+__all__ = ["stats"]  # noqa: F822 (stats is provided by __getattr__)
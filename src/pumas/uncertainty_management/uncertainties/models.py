@@ -1,6 +1,7 @@
-from typing import Dict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Tuple, Type
 
-from pydantic import BaseModel
+import numpy as np
 
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import (
     UFloat,
@@ -8,22 +9,82 @@ from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import (
 )
 
 
-class UncertainValue(BaseModel):
+@dataclass(frozen=True)
+class UncertainValue:
     """Internal model for values with uncertainty"""
 
+    __slots__ = ("nominal_value", "std_dev")
+
     nominal_value: float
     std_dev: float
 
+    def __reduce__(self) -> Tuple[Type["UncertainValue"], Tuple[float, float]]:
+        # Frozen slotted dataclasses cannot be unpickled by setting attributes
+        return self.__class__, (self.nominal_value, self.std_dev)
+
     def to_ufloat(self) -> UFloat:
         """Convert to uncertainties.ufloat"""
         uf: UFloat = ufloat(nominal_value=self.nominal_value, std_dev=self.std_dev)
         return uf
 
+    @classmethod
+    def validate(cls, nominal_value: Any, std_dev: Any) -> "UncertainValue":
+        """Create an UncertainValue, converting both values to float"""
+        try:
+            return cls(nominal_value=float(nominal_value), std_dev=float(std_dev))
+        except (TypeError, ValueError) as e:
+            raise ValueError(
+                f"Invalid uncertain value: nominal_value={nominal_value!r}, "
+                f"std_dev={std_dev!r}"
+            ) from e
+
     @classmethod
     def from_ufloat(cls, uf: UFloat) -> "UncertainValue":
         """Convert from uncertainties.ufloat"""
         return cls(nominal_value=uf.nominal_value, std_dev=uf.std_dev)
 
+    @classmethod
+    def to_ufloat_array(cls, noms: np.ndarray, stds: np.ndarray) -> np.ndarray:
+        """
+        Convert arrays of nominal values and standard deviations to ufloats.
+
+        Args:
+            noms (np.ndarray): The nominal values.
+            stds (np.ndarray): The standard deviations, with the shape of noms.
+
+        Returns:
+            np.ndarray: An object array of ufloat values, with the shape of noms.
+        """
+        noms = np.asarray(noms, dtype=np.float64)
+        stds = np.broadcast_to(np.asarray(stds, dtype=np.float64), noms.shape)
+
+        result = np.empty(noms.size, dtype=object)
+        result[:] = [
+            ufloat(nominal_value, std_dev)
+            for nominal_value, std_dev in zip(
+                noms.ravel().tolist(), stds.ravel().tolist()
+            )
+        ]
+        return result.reshape(noms.shape)
+
+    @classmethod
+    def from_ufloat_array(cls, ufs: Iterable[UFloat]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert ufloat values to arrays of nominal values and standard deviations.
+
+        Args:
+            ufs (Iterable[UFloat]): The ufloat values; arrays are flattened.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The nominal values and the standard
+            deviations.
+        """
+        ufs = np.asarray(ufs, dtype=object).ravel()
+        count = len(ufs)
+        noms = np.fromiter((uf.nominal_value for uf in ufs), np.float64, count)
+        stds = np.fromiter((uf.std_dev for uf in ufs), np.float64, count)
+        return noms, stds
+
     @classmethod
     def from_dict(cls, data: Dict[str, float]) -> "UncertainValue":
-        return cls(nominal_value=data["nominal_value"], std_dev=data["std"])
+        return cls.validate(data["nominal_value"], data["std"])
@@ -1,50 +1,109 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, FrozenSet, Tuple
+
+import numpy as np
 
 from pumas.architecture.catalogue import Catalogue
+from pumas.uncertainty_management.uncertainties.models import UncertainValue
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import (
     UFloat,
     ufloat,
 )
 
+# Structured array of (nominal value, standard deviation) pairs, the array
+# counterpart of UncertainValue
+UNCERTAIN_VALUE_DTYPE = np.dtype([("nominal_value", "f8"), ("std_dev", "f8")])
+
 
 class Converter(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def convert(self, value: float) -> UFloat:
         """Abstract method to convert a float value to a ufloat value"""
 
+    def std_dev(self, value: float) -> float:
+        """
+        Compute the standard deviation of a float value, without a ufloat.
+
+        This default implementation calls convert; concrete converters
+        override it with their formula.
+        """
+        return self.convert(value).std_dev
+
+    def std_devs_array(self, values: np.ndarray) -> np.ndarray:
+        """
+        Compute the standard deviations of an array of float values.
+
+        This default implementation calls convert on each value; concrete
+        converters override it with a vectorized expression.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        return np.array(
+            [self.convert(value).std_dev for value in values.ravel().tolist()],
+            dtype=np.float64,
+        ).reshape(values.shape)
+
 
 float_to_ufloat_conversion_catalogue = Catalogue(Converter)
 
 
 @float_to_ufloat_conversion_catalogue.register_decorator("zero_uncertainty")
 class ZeroUncertaintyConverter(Converter):
+    __slots__ = ()
+
     def convert(self, value):
         return ufloat(nominal_value=value, std_dev=0.0)
 
+    def std_dev(self, value):
+        return 0.0
+
+    def std_devs_array(self, values):
+        return np.zeros(np.shape(values))
+
 
 @float_to_ufloat_conversion_catalogue.register_decorator("fixed_value")
 class FixedValueUncertaintyConverter(Converter):
+    __slots__ = ("fixed_uncertainty",)
+
     def __init__(self, fixed_uncertainty):
         self.fixed_uncertainty = fixed_uncertainty
 
     def convert(self, value):
         return ufloat(value, self.fixed_uncertainty)
 
+    def std_dev(self, value):
+        return self.fixed_uncertainty
+
+    def std_devs_array(self, values):
+        return np.full(np.shape(values), self.fixed_uncertainty, dtype=np.float64)
+
 
 @float_to_ufloat_conversion_catalogue.register_decorator("percentage_of_value")
 class PercentageUncertaintyConverter(Converter):
+    __slots__ = ("percentage", "_scale")
+
     def __init__(self, percentage):
         if not 0.0 <= percentage <= 100.0:
             raise ValueError("Percentage must be between 0 and 100.")
         self.percentage = percentage
+        self._scale = percentage / 100.0
 
     def convert(self, value):
-        std_dev = (self.percentage / 100.0) * value
-        return ufloat(value, std_dev)
+        return ufloat(value, self._scale * value)
+
+    def std_dev(self, value):
+        return self._scale * value
+
+    def std_devs_array(self, values):
+        return self._scale * np.asarray(values, dtype=np.float64)
 
 
 @float_to_ufloat_conversion_catalogue.register_decorator("multiplier")
 class MultiplierUncertaintyConverter(Converter):
+    __slots__ = ("multiplier",)
+
     def __init__(self, multiplier):
         self.multiplier = multiplier
 
@@ -52,12 +111,119 @@ class MultiplierUncertaintyConverter(Converter):
         std_dev = self.multiplier * value
         return ufloat(value, std_dev)
 
+    def std_dev(self, value):
+        return self.multiplier * value
+
+    def std_devs_array(self, values):
+        return self.multiplier * np.asarray(values, dtype=np.float64)
+
 
 # Add new conversion classes here by using the Converter interface
 
 
-def ufloat_from_float(value: float, method: str, **kwargs) -> UFloat:
+@lru_cache(maxsize=128)
+def _get_cached_converter(
+    method: str, kwargs_items: FrozenSet[Tuple[str, Any]]
+) -> Converter:
     converter_class = float_to_ufloat_conversion_catalogue.get(method)
-    converter = converter_class(**kwargs)
-    result = converter.convert(value)
+    return converter_class(**dict(kwargs_items))
+
+
+def get_converter(method: str, **kwargs) -> Converter:
+    """
+    Return a converter of the given method and parameters.
+
+    Converters are memoized on the method and parameters, so that converting
+    many values looks the class up and validates the parameters only once.
+    Unhashable parameters build a new converter.
+    """
+    try:
+        return _get_cached_converter(method, frozenset(kwargs.items()))
+    except TypeError:
+        converter_class = float_to_ufloat_conversion_catalogue.get(method)
+        return converter_class(**kwargs)
+
+
+def ufloat_from_float(value: float, method: str, **kwargs) -> UFloat:
+    return get_converter(method, **kwargs).convert(value)
+
+
+def ufloat_from_floats(values: np.ndarray, method: str, **kwargs) -> np.ndarray:
+    """
+    Convert an array of float values to an array of ufloat values.
+
+    The standard deviations are computed for the whole array by one
+    vectorized expression of the converter, instead of one converter call
+    per value.
+
+    Args:
+        values (np.ndarray): The float values.
+        method (str): The name of the conversion method.
+        **kwargs: The parameters of the conversion method.
+
+    Returns:
+        np.ndarray: An object array of ufloat values, with the shape of values.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    std_devs = get_converter(method, **kwargs).std_devs_array(values)
+    return UncertainValue.to_ufloat_array(values, std_devs)
+
+
+def _check_std_devs(std_devs: np.ndarray) -> None:
+    # Same constraint as ufloat, which rejects negative standard deviations
+    if np.any(np.asarray(std_devs) < 0):
+        raise ValueError("The standard deviation cannot be negative")
+
+
+def ufloat_from_float_lite(value: float, method: str, **kwargs) -> UncertainValue:
+    """
+    Convert a float value to an UncertainValue, without building a ufloat.
+
+    This is for computations that only need the nominal value and standard
+    deviation pair, and skips the bookkeeping of the uncertainties package.
+
+    Args:
+        value (float): The float value.
+        method (str): The name of the conversion method.
+        **kwargs: The parameters of the conversion method.
+
+    Returns:
+        UncertainValue: The nominal value and standard deviation.
+
+    Raises:
+        ValueError: If the method is unknown, or the standard deviation negative.
+    """
+    std_dev = get_converter(method, **kwargs).std_dev(value)
+    _check_std_devs(std_dev)
+    return UncertainValue(nominal_value=value, std_dev=std_dev)
+
+
+def uncertain_values_from_floats(
+    values: np.ndarray, method: str, **kwargs
+) -> np.ndarray:
+    """
+    Convert an array of float values to (nominal value, std dev) pairs.
+
+    This is the array counterpart of ufloat_from_float_lite: the result is a
+    structured array of UNCERTAIN_VALUE_DTYPE, filled by two vectorized
+    assignments, without any ufloat.
+
+    Args:
+        values (np.ndarray): The float values.
+        method (str): The name of the conversion method.
+        **kwargs: The parameters of the conversion method.
+
+    Returns:
+        np.ndarray: The structured array of the pairs, with the shape of values.
+
+    Raises:
+        ValueError: If the method is unknown, or a standard deviation negative.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    std_devs = get_converter(method, **kwargs).std_devs_array(values)
+    _check_std_devs(std_devs)
+
+    result = np.empty(values.shape, dtype=UNCERTAIN_VALUE_DTYPE)
+    result["nominal_value"] = values
+    result["std_dev"] = std_devs
     return result
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from pumas.aggregation.aggregation_utils import (
@@ -11,6 +12,7 @@ from pumas.aggregation.aggregation_utils import (
     is_nan_none,
     report_null_values,
     report_null_weights,
+    run_batch_data_validation_pipeline,
     run_data_validation_pipeline,
 )
 from pumas.aggregation.exceptions import (
@@ -306,3 +308,30 @@ def test_data_validation_pipeline_negative_values_failure(dataset_7):
     values, weights = dataset_7
     with pytest.raises(AggregationNegativeValuesException):
         run_data_validation_pipeline(values, weights)
+
+
+def test_batch_data_validation_pipeline_masks_null_pairs():
+    """Test that null values and weights get zero weights in their rows."""
+    values = [[1.0, None, 3.0], [1.0, 2.0, float("nan")], [1.0, 2.0, 3.0]]
+    weights = [1.0, 2.0, None]
+    with pytest.warns(AggregationNullValuesWarning):
+        with pytest.warns(AggregationNullWeightsWarning):
+            new_values, new_weights = run_batch_data_validation_pipeline(
+                values, weights
+            )
+    assert new_values.tolist() == [[1.0, 0.0, 0.0], [1.0, 2.0, 0.0], [1.0, 2.0, 0.0]]
+    assert new_weights.tolist() == [[1.0, 0.0, 0.0], [1.0, 2.0, 0.0], [1.0, 2.0, 0.0]]
+
+
+@pytest.mark.parametrize(
+    "values, weights, error_type",
+    [
+        ([[1.0, 2.0]], [1.0], AggregationValuesToWeightLengthMismatchException),
+        ([[1.0, 2.0]], [1.0, -1.0], AggregationNegativeWeightsException),
+        ([[1.0, -2.0]], [1.0, 1.0], AggregationNegativeValuesException),
+        ([1.0, 2.0], [1.0, 1.0], ValueError),
+    ],
+)
+def test_batch_data_validation_pipeline_failures(values, weights, error_type):
+    with pytest.raises(error_type):
+        run_batch_data_validation_pipeline(np.array(values), weights)
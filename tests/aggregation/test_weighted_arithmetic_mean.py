@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from pumas.aggregation import aggregation_catalogue
@@ -101,3 +102,20 @@ def test_weighted_arithmetic_mean_numeric_masking_null_weights(
         result = aggregation.compute_numeric(values=values, weights=weights)
         assert isinstance(result, float)
         assert result == pytest.approx(expected_result_float_mask_null_weights)
+
+
+def test_weighted_arithmetic_mean_numeric_batch(aggregation):
+    """The batch computation matches compute_numeric row by row."""
+    rng = np.random.default_rng(seed=0)
+    values = rng.uniform(low=0.0, high=1.0, size=(20, 4))
+    values[3, 1] = np.nan
+    values[5, :] = 0.0
+    weights = [0.5, 1.0, 2.0, 0.0]
+    with pytest.warns(UserWarning):
+        result = aggregation.compute_numeric_batch(values=values, weights=weights)
+        expected = [
+            aggregation.compute_numeric(values=row, weights=weights)
+            for row in values.tolist()
+        ]
+    assert result.shape == (20,)
+    assert result == pytest.approx(expected)
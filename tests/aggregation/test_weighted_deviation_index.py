@@ -107,3 +107,21 @@ def test_weighted_deviation_index_numeric_masking_null_weights(
         result = aggregation.compute_numeric(values=values, weights=weights)
         assert isinstance(result, float)
         assert result == pytest.approx(expected_result_float_mask_null_weights)
+
+
+def test_weighted_deviation_index_follows_parameters_update():
+    """The ideal value is re-read after the parameters change."""
+    aggregation = WeightedDeviationIndexAggregation()
+    values, weights = [0.5, 1.0], [1.0, 1.0]
+    assert aggregation.compute_numeric(values=values, weights=weights) == (
+        pytest.approx(1.0 - (0.125**0.5))
+    )
+
+    aggregation.set_parameters_values({"ideal_value": 0.5})
+    assert aggregation.compute_numeric(values=values, weights=weights) == (
+        pytest.approx(1.0 - (0.125**0.5))
+    )
+    aggregation.set_parameters_values({"ideal_value": 0.0})
+    assert aggregation.compute_numeric(values=values, weights=weights) == (
+        pytest.approx(1.0 - (0.625**0.5))
+    )
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from scipy.stats import gmean
 
@@ -111,3 +112,36 @@ def test_weighted_geometric_mean_numeric_masking_null_weights(
         result = aggregation.compute_numeric(values=values, weights=weights)
         assert isinstance(result, float)
         assert result == pytest.approx(expected_result_float_mask_null_weights)
+
+
+@pytest.mark.parametrize(
+    "values, weights, expected",
+    [
+        ([0.0, 2.0, 3.0], [0.2, 0.3, 0.5], 0.0),
+        ([0.0, 2.0, 8.0], [0.0, 1.0, 1.0], 4.0),
+        ([2.0, 4.0], [0.0, 0.0], float("nan")),
+    ],
+)
+def test_weighted_geometric_mean_numeric_zeros(aggregation, values, weights, expected):
+    """Zero values and zero weights give the product of powers results."""
+    with np.errstate(invalid="ignore"):
+        result = aggregation.compute_numeric(values=values, weights=weights)
+    assert result == pytest.approx(expected, nan_ok=True)
+
+
+def test_weighted_geometric_mean_numeric_batch(aggregation):
+    """The batch computation matches compute_numeric row by row."""
+    rng = np.random.default_rng(seed=0)
+    values = rng.uniform(low=0.0, high=1.0, size=(20, 4))
+    values[3, 1] = np.nan
+    values[5, :] = 0.0
+    values[7, :] = np.nan
+    weights = [0.5, 1.0, 2.0, 0.0]
+    with pytest.warns(UserWarning):
+        result = aggregation.compute_numeric_batch(values=values, weights=weights)
+        expected = [
+            aggregation.compute_numeric(values=row, weights=weights)
+            for row in values.tolist()
+        ]
+    assert result.shape == (20,)
+    assert result == pytest.approx(expected)
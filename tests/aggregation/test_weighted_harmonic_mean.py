@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from scipy.stats import hmean
 
@@ -112,3 +113,15 @@ def test_weighted_harmonic_mean_numeric_masking_null_weights(
         result = aggregation.compute_numeric(values=values, weights=weights)
         assert isinstance(result, float)
         assert result == pytest.approx(expected_result_float_mask_null_weights)
+
+
+def test_weighted_harmonic_mean_numeric_batch(aggregation):
+    """The default batch computation calls compute_numeric row by row."""
+    values = np.array([[1.0, 2.0, 4.0], [0.5, 0.5, 0.5]])
+    weights = [1.0, 2.0, 1.0]
+    result = aggregation.compute_numeric_batch(values=values, weights=weights)
+    expected = [
+        aggregation.compute_numeric(values=row, weights=weights)
+        for row in values.tolist()
+    ]
+    assert result.tolist() == expected
@@ -294,3 +294,29 @@ def test_many_param_one_input_set_invalid_parameter_attributes(many_param_one_in
     invalid_attributes = {"unknown_param": {"min": 0.0}}
     with pytest.raises(ParameterSettingError):
         many_param_one_input.set_parameters_attributes(invalid_attributes)
+
+
+class FloatSubclass(float):
+    pass
+
+
+@pytest.mark.parametrize(
+    "item, expected_type",
+    [
+        (1.0, float),
+        (1, (int, float)),
+        (True, (int, float)),
+        (FloatSubclass(1.0), float),
+        (FloatSubclass(1.0), (int, float)),
+    ],
+)
+def test_validate_compute_input_accepts_instances(item, expected_type):
+    AbstractParametrizedStrategy._validate_compute_input(item, expected_type)
+
+
+@pytest.mark.parametrize(
+    "item, expected_type", [("1.0", float), (None, (int, float)), (1, float)]
+)
+def test_validate_compute_input_rejects_other_types(item, expected_type):
+    with pytest.raises(InvalidInputTypeError):
+        AbstractParametrizedStrategy._validate_compute_input(item, expected_type)
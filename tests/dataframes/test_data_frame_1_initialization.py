@@ -1,6 +1,8 @@
 # type: ignore
+import math
 from typing import Any, Dict, List
 
+import numpy as np
 import pytest
 
 from pumas.dataframes.dataframe import (
@@ -9,6 +11,7 @@ from pumas.dataframes.dataframe import (
     Index,
     UnspecifiedDataType,
 )
+from pumas.dataframes.exceptions import ColumnNotFoundError
 
 
 @pytest.fixture
@@ -113,3 +116,51 @@ def test_convert_to_column_oriented(
     df = DataFrame(row_data=data_with_inconsistent_keys)
     assert df.row_data == expected_normalized_data
     assert df.column_data == expected_column_oriented_data
+
+
+def test_to_column_arrays():
+    """Numeric columns become float arrays, with None as NaN."""
+    df = DataFrame(row_data=[{"A": 1, "B": 2.5}, {"A": None, "B": 3.5}])
+    arrays = df.to_column_arrays()
+    assert list(arrays) == ["A", "B"]
+    assert arrays["A"][0] == 1.0 and math.isnan(arrays["A"][1])
+    assert arrays["B"].tolist() == [2.5, 3.5]
+
+    df._apply_dtype_map({"B": int})
+    assert df.to_column_arrays(["B"])["B"].tolist() == [2.0, 3.0]
+
+
+def test_to_column_arrays_follows_in_place_edits():
+    df = DataFrame(row_data=[{"A": 1.0}, {"A": 2.0}])
+    assert df.to_column_arrays(["A"])["A"].tolist() == [1.0, 2.0]
+
+    df.data["A"][0] = 5.0
+    assert df.to_column_arrays(["A"])["A"].tolist() == [5.0, 2.0]
+    df.get_column_values("A")[1] = 6.0
+    assert df.to_column_arrays(["A"])["A"].tolist() == [5.0, 6.0]
+
+
+def test_to_column_arrays_missing_column():
+    df = DataFrame(row_data=[{"A": 1}])
+    with pytest.raises(ColumnNotFoundError):
+        df.to_column_arrays(["Z"])
+
+
+def test_from_columns_matches_row_construction(sample_data):
+    """Column-oriented construction gives the same frame as the row one."""
+    expected = DataFrame(row_data=sample_data, index=["a", "b", "c"])
+    column_data = {name: [row[name] for row in sample_data] for name in sample_data[0]}
+    df = DataFrame.from_columns(column_data, index=["a", "b", "c"])
+    assert df.row_data == expected.row_data
+    assert df.columns == expected.columns
+    assert df.dtypes_map == expected.dtypes_map
+    assert df.index.values == ["a", "b", "c"]
+
+
+def test_from_columns_converts_arrays_and_checks_lengths():
+    df = DataFrame.from_columns({"A": np.array([1.0, 2.0])})
+    assert df.get_column_values("A") == [1.0, 2.0]
+    assert df.dtypes_map["A"] is float
+    assert df.index.values == [0, 1]
+    with pytest.raises(ValueError):
+        DataFrame.from_columns({"A": [1, 2], "B": [1]})
@@ -1,4 +1,5 @@
 # type: ignore
+import numpy as np
 import pytest
 
 from pumas.desirability import desirability_catalogue
@@ -26,3 +27,15 @@ def test_bell_results_compute_uscore(desirability):
     )
     result = desirability.compute_ufloat(x=ufloat(nominal_value=5.0, std_dev=0.0))
     assert result == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("invert", [False, True])
+@pytest.mark.parametrize("slope", [0.0, 1.0, 400.0])
+def test_bell_compute_numeric_batch(desirability, invert, slope):
+    """The batch computation matches the scalar one element by element."""
+    desirability.set_parameters_values(
+        {"width": 1.0, "slope": slope, "center": 0.5, "invert": invert, "shift": 0.1}
+    )
+    x = np.linspace(-20.0, 20.0, 81)
+    expected = [desirability.compute_numeric(x=float(xi)) for xi in x]
+    assert desirability.compute_numeric_batch(x) == pytest.approx(expected)
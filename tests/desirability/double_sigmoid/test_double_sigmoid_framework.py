@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from pumas.desirability import desirability_catalogue
@@ -42,3 +43,25 @@ def test_double_sigmoid_results_compute_uscore(desirability_class):
     assert result.nominal_value == pytest.approx(expected=0.5)
     assert result.std_dev == pytest.approx(expected=0.0)
     assert str(result) == "0.5+/-0"
+
+
+@pytest.mark.parametrize("invert", [False, True])
+@pytest.mark.parametrize("coef_div", [0.0, 5.0])
+def test_double_sigmoid_compute_numeric_batch(desirability_class, invert, coef_div):
+    """The batch computation matches the scalar one element by element."""
+    params = {
+        "low": 20.0,
+        "high": 80.0,
+        "coef_div": coef_div,
+        "coef_si": 1.0,
+        "coef_se": 2.0,
+        "base": 10.0,
+        "invert": invert,
+        "shift": 0.1,
+    }
+    desirability = desirability_class(params=params)
+    x = np.append(np.linspace(0.0, 100.0, 201), np.nan)
+    expected = [desirability.compute_numeric(x=float(xi)) for xi in x]
+    assert desirability.compute_numeric_batch(x) == pytest.approx(
+        expected, nan_ok=True
+    )
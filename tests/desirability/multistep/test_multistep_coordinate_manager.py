@@ -2,7 +2,11 @@ from math import isclose
 
 import pytest
 
-from pumas.desirability.multistep import CoordinateManager, Point
+from pumas.desirability.multistep import (
+    CoordinateManager,
+    Point,
+    build_validated_points,
+)
 
 
 def test_point_init():
@@ -51,12 +55,13 @@ def test_point_eq_different_types():
 def test_point_eq_float_precision():
     """
     Test equality of Point objects with very close floating-point values.
-    This test ensures that small floating-point differences are handled correctly.
+    Equality is exact, so that equal points always have the same hash.
     """  # noqa E501
     p1 = Point(x=1.0, y=0.3333333333333333)
     p2 = Point(x=1.0, y=0.3333333333333334)
-    assert p1 == p2
+    assert p1 != p2
     assert isclose(p1.y, p2.y)
+    assert len({p1, p2}) == 2
 
 
 def test_point_hash():
@@ -184,3 +189,31 @@ def test_coordinate_manager_boundary_y_values():
     coordinates = [(1.0, 0.0), (2.0, 0.5), (3.0, 1.0)]
     manager = CoordinateManager(coordinates)
     assert len(manager.points) == 3
+
+
+def test_build_validated_points_is_memoized():
+    """
+    Test that the same coordinates are validated once and return sorted Points.
+    """  # noqa E501
+    coordinates = [(3.0, 0.4), (1.0, 1.0), (5.0, 0.0)]
+    points = build_validated_points(coordinates)
+    assert [p.x for p in points] == [1.0, 3.0, 5.0]
+    assert build_validated_points(list(coordinates)) is points
+
+
+def test_build_validated_points_invalid_coordinates():
+    """
+    Test that invalid coordinates still raise, with or without memoization.
+    """  # noqa E501
+    with pytest.raises(ValueError, match="Duplicate x-coordinates found."):
+        build_validated_points([(1.0, 0.2), (1.0, 0.3)])
+    with pytest.raises(ValueError, match="Error converting coordinates to Point: "):
+        build_validated_points([(1.0, 0.2), ([2.0], 0.3)])  # type: ignore
+
+
+def test_coordinate_manager_out_of_bounds_y_coordinates_message():
+    """
+    Test that the error message lists the out of bounds coordinates.
+    """  # noqa E501
+    with pytest.raises(ValueError, match=r"Point\(x=5.0, y=1.1\)"):
+        CoordinateManager([(1.0, 0.2), (3.0, 0.4), (5.0, 1.1)])
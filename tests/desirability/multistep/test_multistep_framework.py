@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from pumas.desirability import desirability_catalogue
@@ -23,3 +24,40 @@ def test_multistep_results_compute_uscore(desirability_class):
     result = desirability.compute_ufloat(x=ufloat(nominal_value=0.25, std_dev=0.0))
     assert result.std_dev == pytest.approx(expected=0.0)
     assert str(result) == "0.25+/-0"
+
+
+def test_multistep_results_follow_parameters_update(desirability_class):
+    params = {"coordinates": [(0.0, 0.0), (1.0, 1.0)], "shift": 0.0}
+    desirability = desirability_class(params=params)
+    assert desirability.compute_numeric(x=0.25) == pytest.approx(expected=0.25)
+
+    desirability.set_parameters_values(
+        {"coordinates": [(0.0, 1.0), (1.0, 0.0)], "shift": 0.5}
+    )
+    assert desirability.compute_numeric(x=0.25) == pytest.approx(expected=0.875)
+
+
+@pytest.mark.parametrize("shift", [0.0, 0.3])
+def test_multistep_compute_numeric_batch(desirability_class, shift):
+    """The batch computation matches the scalar one element by element."""
+    params = {
+        "coordinates": [(5.0, 0.2), (0.0, 1.0), (2.0, 0.0), (8.0, 0.9)],
+        "shift": shift,
+    }
+    desirability = desirability_class(params=params)
+    x = np.linspace(-2.0, 10.0, 49)
+    expected = [desirability.compute_numeric(x=float(xi)) for xi in x]
+    assert desirability.compute_numeric_batch(x) == pytest.approx(expected)
+
+    desirability.set_parameters_values({"coordinates": [(0.0, 1.0), (1.0, 0.0)]})
+    assert desirability.compute_numeric_batch(np.array([0.25])) == pytest.approx(
+        [0.75 * (1 - shift) + shift]
+    )
+
+
+def test_multistep_nan_input(desirability_class):
+    """A NaN input gives NaN, in the scalar and in the batch computation."""
+    params = {"coordinates": [(0.0, 0.0), (0.5, 0.5), (1.0, 1.0)], "shift": 0.2}
+    desirability = desirability_class(params=params)
+    assert np.isnan(desirability.compute_numeric(x=float("nan")))
+    assert np.isnan(desirability.compute_numeric_batch(np.array([np.nan]))).all()
@@ -118,6 +118,28 @@ def test_multistep_invalid_values(desirability_utility_function, x, coordinates)
         desirability_utility_function(x=x, **params)
 
 
+@pytest.mark.parametrize("shift", [0.0, 0.5])
+@pytest.mark.parametrize(
+    "coordinates",
+    [
+        [(1.0, 0.3), (2.0, 0.7)],
+        [(0.0, 1.0), (1.0, 0.0), (3.0, 0.6)],
+    ],
+)
+def test_multistep_nan_input(desirability_utility_function, coordinates, shift):
+    """
+    Test multistep with a NaN input.
+
+    Hypothesis:
+    A NaN input is neither on a plateau nor inside a segment, and the function
+    returns NaN for it, like np.interp does in the vectorized computation.
+    """
+    result = desirability_utility_function(
+        x=float("nan"), coordinates=coordinates, shift=shift
+    )
+    assert math.isnan(result)
+
+
 @pytest.mark.parametrize(
     "x, coordinates, expected",
     [
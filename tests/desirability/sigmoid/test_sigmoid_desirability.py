@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest
 
 from pumas.architecture.exceptions import (
@@ -123,3 +126,26 @@ def test_sigmoid_compute_numeric_input_type_fail(desirability_class, x, error_ty
         error_type,
     ):
         desirability.compute_numeric(x=x)
+
+
+@pytest.mark.parametrize("high", [1.0, 0.0])
+def test_sigmoid_compute_numeric_does_not_keep_instance_alive(desirability_class, high):
+    params = {"low": 0.0, "high": high, "k": 1.0, "shift": 0.1, "base": 10.0}
+    desirability = desirability_class(params=params)
+    desirability.compute_numeric(x=0.5)
+    reference = weakref.ref(desirability)
+    gc.disable()
+    try:
+        del desirability
+        assert reference() is None
+    finally:
+        gc.enable()
+
+
+def test_sigmoid_compute_numeric_follows_parameters_update(desirability_class):
+    params = {"low": 0.0, "high": 1.0, "k": 1.0, "shift": 0.0, "base": 10.0}
+    desirability = desirability_class(params=params)
+    before = desirability.compute_numeric(x=0.25)
+    desirability.set_parameters_values({"shift": 0.5})
+    after = desirability.compute_numeric(x=0.25)
+    assert after == pytest.approx(0.5 + 0.5 * before)
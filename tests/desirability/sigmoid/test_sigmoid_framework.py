@@ -1,6 +1,10 @@
+import pickle
+
+import numpy as np
 import pytest
 
 from pumas.desirability import desirability_catalogue
+from pumas.desirability.sigmoid import SigmoidArray
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import ufloat
 
 
@@ -29,3 +33,88 @@ def test_sigmoid_results_compute_ufloat(desirability_class):
     assert result.nominal_value == pytest.approx(expected=0.5)
     assert result.std_dev == pytest.approx(expected=0.0)
     assert str(result) == "0.5+/-0"
+
+
+def test_sigmoid_results_follow_parameters_update(desirability_class):
+    desirability = desirability_class(
+        params={"low": 0.0, "high": 1.0, "k": 1.0, "shift": 0.0, "base": 10.0}
+    )
+    assert desirability.compute_numeric(x=0.5) == pytest.approx(expected=0.5)
+
+    desirability.set_parameters_values({"low": 1.0, "high": 2.0, "shift": 0.2})
+    assert desirability.compute_numeric(x=1.5) == pytest.approx(expected=0.6)
+    assert desirability.compute_numeric(x=0.0) == pytest.approx(expected=0.2)
+
+
+def test_sigmoid_pickles_after_compute(desirability_class):
+    """Pickling keeps the parameters and drops the prepared coefficients."""
+    desirability = desirability_class(
+        params={"low": 1.0, "high": 2.0, "k": 1.0, "shift": 0.2, "base": 10.0}
+    )
+    expected = desirability.compute_numeric(x=1.5)
+
+    restored = pickle.loads(pickle.dumps(desirability))
+    assert restored.get_parameters_values() == desirability.get_parameters_values()
+    assert restored.compute_numeric(x=1.5) == pytest.approx(expected=expected)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"low": 0.0, "high": 1.0, "k": 0.5, "shift": 0.0, "base": 10.0},
+        {"low": -5.0, "high": 5.0, "k": -0.3, "shift": 0.1, "base": 2.0},
+        {"low": 1.0, "high": 1.0, "k": 1.0, "shift": 0.2, "base": 10.0},
+    ],
+)
+def test_sigmoid_compute_numeric_batch(desirability_class, params):
+    """The batch computation matches the scalar one element by element."""
+    desirability = desirability_class(params=params)
+    x = np.linspace(-10.0, 10.0, 41)
+    expected = [desirability.compute_numeric(x=float(xi)) for xi in x]
+    result = desirability.compute_numeric_batch(x)
+    assert result.shape == x.shape
+    assert result == pytest.approx(expected)
+
+
+class _TaggedArray(np.ndarray):
+    """Array type standing in for arrays of other ufunc-aware libraries."""
+
+
+@pytest.mark.parametrize("name", ["sigmoid", "sigmoid_bell"])
+def test_batch_keeps_ufunc_aware_arrays(name):
+    """Arrays supporting NumPy ufuncs are computed without conversion."""
+    params = {
+        "sigmoid": {"low": 0.0, "high": 1.0},
+        "sigmoid_bell": {"x1": 0.0, "x2": 1.0, "x3": 2.0, "x4": 3.0},
+    }[name]
+    desirability = desirability_catalogue.get(name)(params=params)
+    x = np.linspace(-1.0, 4.0, 11)
+    result = desirability.compute_numeric_batch(x.view(_TaggedArray))
+    assert isinstance(result, _TaggedArray)
+    assert np.asarray(result) == pytest.approx(desirability.compute_numeric_batch(x))
+
+
+def test_sigmoid_array_matches_sigmoids(desirability_class):
+    """Each column of the SigmoidArray evaluation matches its own sigmoid."""
+    sigmoids = [
+        desirability_class(params={"low": 0.0, "high": 4.0, "k": 0.5}),
+        desirability_class(params={"low": 1.0, "high": 1.0, "k": -1.0, "shift": 0.2}),
+        desirability_class(
+            params={"low": -2.0, "high": 3.0, "k": -0.3, "base": 2.0, "shift": 0.1}
+        ),
+    ]
+    sigmoid_array = SigmoidArray(sigmoids)
+    assert len(sigmoid_array) == 3
+
+    x = np.array([-np.inf, -3.0, 0.0, 1.0, 2.5, 5.0, np.inf, np.nan])
+    result = sigmoid_array.evaluate(x)
+    assert result.shape == (x.size, 3)
+    for k, sigmoid in enumerate(sigmoids):
+        expected = [sigmoid.compute_numeric(x=float(xi)) for xi in x]
+        assert result[:, k] == pytest.approx(expected, nan_ok=True)
+
+
+def test_sigmoid_array_rejects_other_desirabilities(desirability_class):
+    step = desirability_catalogue.get("rightstep")(params={"low": 0.0, "high": 1.0})
+    with pytest.raises(TypeError):
+        SigmoidArray([desirability_class(params={"low": 0.0, "high": 1.0}), step])
@@ -3,7 +3,19 @@ import math
 import numpy as np
 import pytest
 
-from pumas.desirability.sigmoid import sigmoid
+from pumas.architecture.exceptions import InvalidBoundaryError
+from pumas.desirability import sigmoid as sigmoid_module
+from pumas.desirability.sigmoid import (
+    compute_numeric_sigmoid,
+    compute_ufloat_sigmoid,
+    sigmoid,
+    sigmoid_array,
+    sigmoid_checked,
+)
+from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import (
+    ufloat,
+    umath,
+)
 
 
 @pytest.fixture
@@ -124,3 +136,112 @@ def test_sigmoid_extreme_values(desirability_utility_function, x):
     assert math.isclose(
         result, expected, abs_tol=1e-6
     ), f"Extreme value test failed for x={x}"
+
+
+@pytest.mark.parametrize(
+    "low, high, k, shift, base",
+    [
+        (0.0, 1.0, 1.0, 0.0, 10.0),
+        (-1000, 1000, 0.1, 0.3, 2.0),
+        (0, 1, 1e6, 0, 10),
+        (1.0, 1.0, -0.5, 0.1, 10.0),
+    ],
+)
+def test_sigmoid_array_matches_sigmoid(low, high, k, shift, base):
+    """
+    Test that the vectorized sigmoid matches the scalar one element by element.
+    """
+    x = np.array([-1e6, -100.0, -1.0, 0.0, 0.5, 1.0, 100.0, 1e6])
+    params = {"low": low, "high": high, "k": k, "shift": shift, "base": base}
+    result = sigmoid_array(x=x, **params)
+    expected = [sigmoid(x=float(xi), **params) for xi in x]
+    assert result == pytest.approx(expected)
+    assert np.all(np.isfinite(result))
+
+
+@pytest.mark.parametrize(
+    "dtype, expected_dtype",
+    [
+        (np.float32, np.float32),
+        (np.float64, np.float64),
+        (np.int64, np.float64),
+        (np.int8, np.float64),
+        (np.float16, np.float64),
+        (np.bool_, np.float64),
+    ],
+)
+def test_sigmoid_array_dtype(dtype, expected_dtype):
+    """
+    Test that only single precision inputs are computed in single precision.
+    """
+    x = np.array([-2, -1, 0, 1, 2], dtype=dtype)
+    result = sigmoid_array(x=x, low=-1.0, high=1.0, k=0.5)
+    assert result.dtype == expected_dtype
+    assert result == pytest.approx(
+        [sigmoid(x=float(xi), low=-1.0, high=1.0, k=0.5) for xi in x], abs=1e-6
+    )
+
+
+@pytest.mark.parametrize("x", [-3.0, 0.0, 0.4, 1.0, 7.5])
+@pytest.mark.parametrize(
+    "low, high, k, shift, base",
+    [
+        (0.0, 1.0, 1.0, 0.0, 10.0),
+        (-2.0, 5.0, -0.3, 0.2, 2.0),
+        (1.0, 1.0, 0.5, 0.1, 10.0),
+    ],
+)
+def test_compute_sigmoid_functions_match_sigmoid(x, low, high, k, shift, base):
+    """
+    Test that the direct numeric and ufloat functions match the generic sigmoid.
+    """
+    params = {"low": low, "high": high, "k": k, "shift": shift, "base": base}
+    assert compute_numeric_sigmoid(x, **params) == pytest.approx(
+        sigmoid(x=x, **params)
+    )
+    x_ufloat = ufloat(x, 0.1)
+    result = compute_ufloat_sigmoid(x_ufloat, **params)
+    expected = sigmoid(x=x_ufloat, math_module=umath, **params)
+    assert type(result) is type(expected)
+    difference = result - expected
+    assert getattr(difference, "nominal_value", difference) == pytest.approx(0.0)
+    assert getattr(difference, "std_dev", 0.0) == pytest.approx(0.0)
+
+
+def test_sigmoid_array_num_jobs():
+    """
+    Test that computing large arrays in threads gives the same results.
+    """
+    x = np.linspace(-5.0, 5.0, 300_000).reshape(3, -1)
+    params = {"low": -1.0, "high": 1.0, "k": 0.5, "shift": 0.1}
+    np.testing.assert_array_equal(
+        sigmoid_array(x=x, num_jobs=4, **params), sigmoid_array(x=x, **params)
+    )
+
+
+def test_sigmoid_checked():
+    """
+    Test that sigmoid_checked matches sigmoid and always validates the parameters.
+    """
+    assert sigmoid_checked(x=0.3, low=0.0, high=1.0, k=0.5) == sigmoid(
+        x=0.3, low=0.0, high=1.0, k=0.5
+    )
+    with pytest.raises(InvalidBoundaryError):
+        sigmoid_checked(x=0.3, low=1.0, high=0.0, k=0.5)
+    with pytest.raises(InvalidBoundaryError):
+        sigmoid_checked(x=0.3, low=0.0, high=1.0, k=0.5, base=1.0)
+
+
+def test_sigmoid_checked_validates_once(monkeypatch):
+    """
+    Test that sigmoid_checked validates the parameters a single time.
+    """
+    calls = []
+    validate = sigmoid_module.validate_sigmoid_parameters
+    monkeypatch.setattr(
+        sigmoid_module,
+        "validate_sigmoid_parameters",
+        lambda **kwargs: calls.append(kwargs) or validate(**kwargs),
+    )
+    sigmoid_checked(x=0.3, low=0.0, high=1.0, k=0.5)
+    assert len(calls) == 1
@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
 from pumas.desirability import desirability_catalogue
+from pumas.desirability.sigmoid_bell import sigmoid_bell
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import ufloat
 
 
@@ -41,3 +43,34 @@ def test_sigmoid_bell_results_compute_uscore(desirability_class):
     result = desirability.compute_ufloat(x=ufloat(nominal_value=50.0, std_dev=0.0))
     assert result.nominal_value == pytest.approx(expected=1.0)
     assert result.std_dev == pytest.approx(expected=0.0)
+
+
+@pytest.mark.parametrize("x", [0.0, 20.0, 30.0, 45.0, 52.5, 70.0, 80.0, 100.0])
+def test_sigmoid_bell_results_follow_parameters_update(desirability_class, x):
+    params = {"x1": 20.0, "x2": 45.0, "x3": 60.0, "x4": 80.0}
+    desirability = desirability_class(params=params)
+    assert desirability.compute_numeric(x=x) == pytest.approx(
+        expected=sigmoid_bell(x=x, **params)
+    )
+
+    new_params = {"x1": 10.0, "x2": 10.0, "invert": True, "shift": 0.2, "base": 2.0}
+    desirability.set_parameters_values(new_params)
+    assert desirability.compute_numeric(x=x) == pytest.approx(
+        expected=sigmoid_bell(x=x, **{**params, **new_params})
+    )
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"x1": 20.0, "x2": 45.0, "x3": 60.0, "x4": 80.0},
+        {"x1": 20.0, "x2": 20.0, "x3": 60.0, "x4": 60.0, "invert": True},
+        {"x1": -5.0, "x2": 0.0, "x3": 0.0, "x4": 5.0, "k": 3.0, "shift": 0.4},
+    ],
+)
+def test_sigmoid_bell_compute_numeric_batch(desirability_class, params):
+    """The batch computation matches the scalar one element by element."""
+    desirability = desirability_class(params=params)
+    x = np.linspace(-20.0, 120.0, 57)
+    expected = [desirability.compute_numeric(x=float(xi)) for xi in x]
+    assert desirability.compute_numeric_batch(x) == pytest.approx(expected)
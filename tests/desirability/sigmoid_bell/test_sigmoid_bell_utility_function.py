@@ -3,7 +3,9 @@ import math
 import numpy as np
 import pytest
 
-from pumas.desirability.sigmoid_bell import sigmoid_bell
+from pumas.architecture.exceptions import InvalidBoundaryError
+from pumas.desirability import sigmoid_bell as sigmoid_bell_module
+from pumas.desirability.sigmoid_bell import sigmoid_bell, sigmoid_bell_checked
 
 
 @pytest.fixture
@@ -232,3 +234,30 @@ def test_sigmoid_bell_monotonicity(desirability_utility_function, x1, x2, x3, x4
     assert all(
         y1 >= y2 for y1, y2 in zip(y_values, y_values[1:])
     ), "Not monotonically decreasing from center to x4"
+
+
+def test_sigmoid_bell_checked():
+    """
+    Test that sigmoid_bell_checked matches sigmoid_bell and always validates.
+    """
+    params = {"x1": 0.0, "x2": 1.0, "x3": 2.0, "x4": 3.0}
+    assert sigmoid_bell_checked(1.5, **params) == sigmoid_bell(1.5, **params)
+    with pytest.raises(InvalidBoundaryError):
+        sigmoid_bell_checked(1.5, **{**params, "x2": -1.0})
+    with pytest.raises(InvalidBoundaryError):
+        sigmoid_bell_checked(1.5, **params, base=0.5)
+
+
+def test_sigmoid_bell_checked_validates_once(monkeypatch):
+    """
+    Test that sigmoid_bell_checked validates the parameters a single time.
+    """
+    calls = []
+    validate = sigmoid_bell_module.validate_sigmoid_bell_parameters
+    monkeypatch.setattr(
+        sigmoid_bell_module,
+        "validate_sigmoid_bell_parameters",
+        lambda **kwargs: calls.append(kwargs) or validate(**kwargs),
+    )
+    sigmoid_bell_checked(1.5, x1=0.0, x2=1.0, x3=2.0, x4=3.0)
+    assert len(calls) == 1
@@ -1,6 +1,9 @@
+import numpy as np
 import pytest
 
+from pumas.architecture.exceptions import ParameterValueNotSet
 from pumas.desirability import desirability_catalogue
+from pumas.desirability.step import StepArray, expand_step_bitmap
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import ufloat
 
 
@@ -40,3 +43,100 @@ def test_step_results_compute_ufloat(name, high, low, shift, x, expected_y):
     desirability.set_parameters_values({"low": low, "high": high, "shift": shift})
     result = desirability.compute_ufloat(x=ufloat(nominal_value=x, std_dev=0.0))
     assert result.nominal_value == pytest.approx(expected=expected_y)
+
+
+@pytest.mark.parametrize(
+    "name, params, updated_params",
+    [
+        ("rightstep", {"low": 0.0, "high": 2.0}, {"high": 1.0}),
+        ("leftstep", {"low": 1.0, "high": 2.0}, {"low": 2.0}),
+        ("step", {"low": 0.0, "high": 1.0}, {"invert": True}),
+    ],
+)
+def test_step_results_follow_parameters_update(name, params, updated_params):
+    desirability = desirability_catalogue.get(name)(params=params)
+    assert desirability.compute_numeric(x=1.5) == 0.0
+
+    desirability.set_parameters_values(updated_params)
+    assert desirability.compute_numeric(x=1.5) == 1.0
+
+
+@pytest.mark.parametrize(
+    "name, params",
+    [
+        ("rightstep", {"low": 0.0, "high": 1.0, "shift": 0.2}),
+        ("leftstep", {"low": 1.0, "high": 2.0, "shift": 0.2}),
+        ("step", {"low": 0.0, "high": 1.0, "invert": True, "shift": 0.2}),
+    ],
+)
+def test_step_compute_numeric_batch(name, params):
+    """The batch computation matches the scalar one element by element."""
+    desirability = desirability_catalogue.get(name)(params=params)
+    x = [[-1.0, 0.0, 0.5], [1.0, 1.5, 3]]
+    expected = [[desirability.compute_numeric(x=xi) for xi in row] for row in x]
+    result = desirability.compute_numeric_batch(x)
+    assert result.shape == (2, 3)
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize("name", ["step", "leftstep", "rightstep"])
+def test_step_compute_numeric_batch_without_parameters(name):
+    desirability = desirability_catalogue.get(name)()
+    with pytest.raises(ParameterValueNotSet):
+        desirability.compute_numeric_batch([0.0, 1.0])
+
+
+@pytest.mark.parametrize(
+    "name, params",
+    [
+        ("rightstep", {"low": 0.0, "high": 1.0, "shift": 0.2}),
+        ("leftstep", {"low": 1.0, "high": 2.0, "shift": 0.2}),
+        ("step", {"low": 0.0, "high": 1.0, "invert": True, "shift": 0.2}),
+    ],
+)
+def test_step_compute_numeric_bitmap(name, params):
+    """The bitmap expands to the batch computation."""
+    desirability = desirability_catalogue.get(name)(params=params)
+    x = [[-1.0, 0.0, 0.5], [1.0, 1.5, 3]]
+    bitmap = desirability.compute_numeric_bitmap(x)
+    expected = desirability.compute_numeric_batch(x).ravel()
+    result = expand_step_bitmap(bitmap=bitmap, size=6, shift=params["shift"])
+    assert result.tolist() == expected.tolist()
+
+
+def test_step_array_matches_individual_steps():
+    """Each column of the StepArray evaluation matches its own step."""
+    steps = [
+        desirability_catalogue.get("rightstep")(params={"low": 0.0, "high": 1.0}),
+        desirability_catalogue.get("leftstep")(
+            params={"low": 1.0, "high": 2.0, "shift": 0.2}
+        ),
+        desirability_catalogue.get("step")(
+            params={"low": 0.0, "high": 1.0, "invert": True, "shift": 0.1}
+        ),
+    ]
+    step_array = StepArray(steps)
+    assert len(step_array) == 3
+
+    x = np.array([-np.inf, -1.0, 0.0, 0.5, 1.0, 1.5, 3.0, np.inf, np.nan])
+    result = step_array.evaluate(x)
+    assert result.shape == (x.size, 3)
+    for k, step in enumerate(steps):
+        assert result[:, k].tolist() == [step.compute_numeric(x=xi) for xi in x]
+
+    columns = np.stack([x, x[::-1], x], axis=1)
+    result = step_array.evaluate(columns)
+    assert result[:, 1].tolist() == [steps[1].compute_numeric(x=xi) for xi in x[::-1]]
+
+
+def test_step_array_rejects_other_desirabilities():
+    sigmoid = desirability_catalogue.get("sigmoid")(
+        params={"low": 0.0, "high": 1.0, "k": 1.0}
+    )
+    with pytest.raises(TypeError):
+        StepArray([sigmoid])
+
+
+def test_step_array_without_parameters():
+    with pytest.raises(ParameterValueNotSet):
+        StepArray([desirability_catalogue.get("step")()])
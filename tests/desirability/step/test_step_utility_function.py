@@ -1,10 +1,26 @@
+import numpy as np
 import pytest
 
 from pumas.desirability.step import (
+    build_numeric_step_kernel,
+    compute_array_left_step,
+    compute_array_right_step,
+    compute_array_step,
+    compute_mask_left_step,
+    compute_mask_right_step,
+    compute_mask_step,
     compute_numeric_left_step,
     compute_numeric_right_step,
     compute_numeric_step,
+    compute_ufloat_left_step,
+    compute_ufloat_right_step,
+    compute_ufloat_step,
+    expand_step_bitmap,
+    mean_step_bitmap,
+    pack_step_mask,
+    shift_step_mask,
 )
+from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import ufloat
 
 
 @pytest.fixture
@@ -209,3 +225,194 @@ def test_r_l_step_functions_shift_impact(
             ), f"Expected {shift_value}, got {shifted}"
         elif unshifted == 1:
             assert shifted == pytest.approx(1.0), f"Expected 1.0, got {shifted}"
+
+
+@pytest.mark.parametrize("shift", [0.0, 0.25, 1.0])
+@pytest.mark.parametrize(
+    "array_function, numeric_function, params",
+    [
+        (compute_array_right_step, compute_numeric_right_step, {}),
+        (compute_array_left_step, compute_numeric_left_step, {}),
+        (compute_array_step, compute_numeric_step, {"invert": False}),
+        (compute_array_step, compute_numeric_step, {"invert": True}),
+    ],
+)
+def test_step_array_functions_match_numeric(
+    array_function, numeric_function, params, shift
+):
+    """
+    Test that the array step functions match the numeric ones element by element.
+    """
+    x = np.array([-1.0, 0.0, 1.0, 1.5, 2.0, 3.0])
+    params = {"low": 1.0, "high": 2.0, "shift": shift, **params}
+    result = array_function(x=x, **params)
+    expected = [numeric_function(x=float(xi), **params) for xi in x]
+    assert result.dtype == np.float64
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "mask_function, params, expected",
+    [
+        (compute_mask_right_step, {}, [0, 0, 0, 0, 1, 1]),
+        (compute_mask_left_step, {}, [1, 1, 1, 0, 0, 0]),
+        (compute_mask_step, {"invert": False}, [0, 0, 1, 1, 1, 0]),
+        (compute_mask_step, {"invert": True}, [1, 1, 0, 0, 0, 1]),
+    ],
+)
+def test_step_mask_functions(mask_function, params, expected):
+    """
+    Test that the step masks are uint8 arrays that expand to the step values.
+    """
+    x = np.array([-1.0, 0.0, 1.0, 1.5, 2.0, 3.0])
+    mask = mask_function(x=x, low=1.0, high=2.0, **params)
+    assert mask.dtype == np.uint8
+    assert mask.tolist() == expected
+    assert shift_step_mask(mask=mask, shift=0.2) == pytest.approx(
+        [0.2 + 0.8 * m for m in expected]
+    )
+
+
+@pytest.mark.parametrize(
+    "kind, numeric_function, params",
+    [
+        ("rightstep", compute_numeric_right_step, {}),
+        ("leftstep", compute_numeric_left_step, {}),
+        ("step", compute_numeric_step, {"invert": False}),
+        ("step", compute_numeric_step, {"invert": True}),
+    ],
+)
+@pytest.mark.parametrize("shift", [0.0, 0.3, 1.0])
+def test_numeric_step_kernel(kind, numeric_function, params, shift):
+    """
+    Test that the step kernels match the numeric step functions.
+    """
+    params = {"low": 1.0, "high": 2.0, "shift": shift, **params}
+    kernel = build_numeric_step_kernel(kind, **params)
+    for x in [-1.0, 0.0, 1.0, 1.5, 2.0, 3.0, float("nan")]:
+        result = kernel(x)
+        assert isinstance(result, float)
+        assert result == numeric_function(x=x, **params)
+
+
+@pytest.mark.parametrize(
+    "ufloat_function, numeric_function, params",
+    [
+        (compute_ufloat_right_step, compute_numeric_right_step, {}),
+        (compute_ufloat_left_step, compute_numeric_left_step, {}),
+        (compute_ufloat_step, compute_numeric_step, {"invert": False}),
+        (compute_ufloat_step, compute_numeric_step, {"invert": True}),
+    ],
+)
+def test_ufloat_step_functions(ufloat_function, numeric_function, params):
+    """
+    Test that the ufloat step functions match the numeric ones and scale the
+    input uncertainty by the step height.
+    """
+    params = {"low": 1.0, "high": 2.0, "shift": 0.2, **params}
+    for x in [-1.0, 0.0, 1.0, 1.5, 2.0, 3.0]:
+        result = ufloat_function(x=ufloat(x, 0.1), **params)
+        assert result.nominal_value == pytest.approx(numeric_function(x=x, **params))
+        assert result.std_dev == pytest.approx(0.08)
+
+
+@pytest.mark.parametrize(
+    "array_function, params",
+    [
+        (compute_array_right_step, {}),
+        (compute_array_left_step, {}),
+        (compute_array_step, {"invert": True}),
+    ],
+)
+def test_array_step_functions_write_into_out(array_function, params):
+    """
+    Test that the array step functions fill and return a given output buffer.
+    """
+    x = np.array([-1.0, 0.0, 1.0, 1.5, 2.0, 3.0], dtype=np.float32)
+    params = {"low": 1.0, "high": 2.0, "shift": 0.2, **params}
+    out = np.full(x.shape, np.nan)
+    result = array_function(x=x, out=out, **params)
+    assert result is out
+    assert result.tolist() == array_function(x=x, **params).tolist()
+
+
+@pytest.mark.parametrize("size", [1, 8, 13, 1000])
+def test_step_bitmap_functions(size):
+    """
+    Test that a packed step mask expands and averages like the mask itself.
+    """
+    rng = np.random.default_rng(seed=size)
+    x = rng.uniform(low=0.0, high=3.0, size=size)
+    mask = compute_mask_step(x=x, low=1.0, high=2.0, invert=False)
+    bitmap = pack_step_mask(mask=mask)
+    assert bitmap.dtype == np.uint8
+    assert bitmap.size == (size + 7) // 8
+
+    expected = shift_step_mask(mask=mask, shift=0.3)
+    assert expand_step_bitmap(bitmap=bitmap, size=size, shift=0.3).tolist() == (
+        expected.tolist()
+    )
+    assert mean_step_bitmap(bitmap=bitmap, size=size, shift=0.3) == pytest.approx(
+        expected.mean()
+    )
+
+
+def test_mean_step_bitmap_empty():
+    """
+    Test that an empty bitmap has a NaN mean, as an empty array does.
+    """
+    bitmap = pack_step_mask(mask=np.zeros(0, dtype=bool))
+    assert np.isnan(mean_step_bitmap(bitmap=bitmap, size=0, shift=0.3))
+
+
+@pytest.mark.parametrize("shift", [0.0, 0.2])
+def test_ufloat_step_functions_without_uncertainty(shift):
+    """
+    Test that exact inputs give exact results, which are not shared.
+    """
+    params = {"low": 1.0, "high": 2.0, "shift": shift}
+    first = compute_ufloat_right_step(x=ufloat(3.0, 0.0), **params)
+    second = compute_ufloat_right_step(x=ufloat(2.5, 0.0), **params)
+    assert first is not second
+    assert (first.nominal_value, first.std_dev) == (1.0, 0.0)
+
+    # Modifying a result does not change the results of later calls
+    first.std_dev = 0.3
+    result = compute_ufloat_right_step(x=ufloat(3.0, 0.0), **params)
+    assert (result.nominal_value, result.std_dev) == (1.0, 0.0)
+
+    result = compute_ufloat_left_step(x=ufloat(3.0, 0.0), **params)
+    assert (result.nominal_value, result.std_dev) == (shift, 0.0)
+
+
+def test_numeric_step_kernel_is_shared():
+    """
+    Test that identical step configurations share a kernel.
+    """
+    kernel = build_numeric_step_kernel("step", low=1.0, high=2.0, shift=0.3)
+    assert build_numeric_step_kernel("step", low=1.0, high=2.0, shift=0.3) is kernel
+    assert build_numeric_step_kernel("step", low=1.0, high=2.5, shift=0.3) is not (
+        kernel
+    )
+
+
+@pytest.mark.parametrize(
+    "array_function, params",
+    [
+        (compute_array_right_step, {}),
+        (compute_array_left_step, {}),
+        (compute_array_step, {"invert": True}),
+    ],
+)
+def test_array_step_functions_num_jobs(array_function, params):
+    """
+    Test that computing large arrays in threads gives the same results.
+    """
+    x = np.linspace(-5.0, 5.0, 300_000).reshape(3, -1)
+    params = {"low": -1.0, "high": 1.0, "shift": 0.1, **params}
+    expected = array_function(x=x, **params)
+    np.testing.assert_array_equal(array_function(x=x, num_jobs=4, **params), expected)
+
+    out = np.empty_like(x)
+    assert array_function(x=x, out=out, num_jobs=4, **params) is out
+    np.testing.assert_array_equal(out, expected)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from pumas.dataframes.dataframe import DataFrame
+from pumas.dataframes.exceptions import ColumnNotFoundError
+from pumas.desirability import desirability_catalogue
+from pumas.desirability.pipeline import DesirabilityPipeline
+
+
+@pytest.fixture
+def pipeline():
+    return DesirabilityPipeline(
+        {
+            "a": desirability_catalogue.get("sigmoid")(
+                params={"low": 0.0, "high": 1.0, "k": 0.5}
+            ),
+            "b": desirability_catalogue.get("multistep")(
+                params={"coordinates": [(0.0, 0.0), (1.0, 1.0)]}
+            ),
+        }
+    )
+
+
+def test_desirability_pipeline_apply(pipeline):
+    columns = {
+        "a": np.array([0.0, 0.5, 1.0]),
+        "b": np.array([[-1.0, 0.25], [2.0, 0.5]]),
+    }
+    result = pipeline.apply(columns)
+    assert set(result) == {"a", "b"}
+    for name, desirability in pipeline.desirabilities.items():
+        assert result[name].shape == columns[name].shape
+        expected = [desirability.compute_numeric(x=x) for x in columns[name].ravel()]
+        assert result[name].ravel() == pytest.approx(expected)
+
+
+def test_desirability_pipeline_missing_column(pipeline):
+    with pytest.raises(KeyError, match="Missing columns: b"):
+        pipeline.apply({"a": np.array([0.0])})
+
+
+def test_desirability_pipeline_apply_dataframe(pipeline):
+    dataframe = DataFrame(
+        row_data=[{"a": 0.0, "b": -1.0, "c": "x"}, {"a": 1.0, "b": 0.5, "c": "y"}],
+        index=["m1", "m2"],
+    )
+    result = pipeline.apply_dataframe(dataframe)
+    assert result.columns == ["a", "b"]
+    assert result.index.values == ["m1", "m2"]
+    for name, desirability in pipeline.desirabilities.items():
+        expected = [
+            desirability.compute_numeric(x=x)
+            for x in dataframe.get_column_values(name)
+        ]
+        assert result.get_column_values(name) == pytest.approx(expected)
+
+
+def test_desirability_pipeline_apply_dataframe_missing_column(pipeline):
+    dataframe = DataFrame(row_data=[{"a": 0.0}])
+    with pytest.raises(ColumnNotFoundError):
+        pipeline.apply_dataframe(dataframe)
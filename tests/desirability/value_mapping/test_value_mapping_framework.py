@@ -1,5 +1,9 @@
+import math
+
+import numpy as np
 import pytest
 
+from pumas.architecture.exceptions import InvalidInputTypeError
 from pumas.desirability import desirability_catalogue
 
 
@@ -28,3 +32,44 @@ def test_value_mapping_results_compute_uscore(desirability_class):
     desirability = desirability_class(params=params)
     with pytest.raises(NotImplementedError):
         _ = desirability.compute_numeric(x="Low")
+
+
+def test_value_mapping_results_follow_parameters_update(desirability_class):
+    params = {"mapping": {"Low": 0.2, "High": 0.8}, "shift": 0.0}
+    desirability = desirability_class(params=params)
+    assert desirability.compute_string(x="Low") == pytest.approx(expected=0.2)
+
+    desirability.set_parameters_values({"mapping": {"Low": 0.0}, "shift": 0.5})
+    assert desirability.compute_string(x="Low") == pytest.approx(expected=0.5)
+    assert math.isnan(desirability.compute_string(x="High"))
+
+
+def test_value_mapping_invalid_mapping_raises_on_compute(desirability_class):
+    params = {"mapping": {"Low": 0.2, "High": 1.1}, "shift": 0.0}
+    desirability = desirability_class(params=params)
+    with pytest.raises(ValueError, match="Mapping values should be between 0 and 1"):
+        desirability.compute_string(x="Low")
+
+
+def test_value_mapping_compute_string_batch(desirability_class):
+    """The batch computation matches the scalar one element by element."""
+    params = {"mapping": {"Low": 0.2, "Medium": 0.5, "High": 0.8}, "shift": 0.1}
+    desirability = desirability_class(params=params)
+    x = [["Low", "High"], ["Unknown", "Medium"]]
+    result = desirability.compute_string_batch(x)
+    assert result.shape == (2, 2)
+    assert result[0].tolist() == [desirability.compute_string(x=xi) for xi in x[0]]
+    assert math.isnan(result[1, 0])
+    assert result[1, 1] == desirability.compute_string(x="Medium")
+
+
+@pytest.mark.parametrize(
+    "x",
+    [["Low", 1], ["Low", None], np.array([1, 2]), np.array(["Low", 2.0], dtype=object)],
+)
+def test_value_mapping_compute_string_batch_rejects_non_str(desirability_class, x):
+    """The batch computation rejects the inputs rejected by compute_string."""
+    params = {"mapping": {"Low": 0.2, "Medium": 0.5, "High": 0.8}, "shift": 0.1}
+    desirability = desirability_class(params=params)
+    with pytest.raises(InvalidInputTypeError):
+        desirability.compute_string_batch(x)
@@ -0,0 +1,42 @@
+# type: ignore
+import pytest
+
+from pumas.uncertainty_management.distributions.models import DistributionValue
+
+
+@pytest.fixture
+def distribution_value():
+    return DistributionValue(
+        distribution_name="norm", shape_parameters={"loc": 0.0, "scale": 1.0}
+    )
+
+
+def test_distribution_is_cached(distribution_value):
+    distribution = distribution_value.distribution
+    assert distribution.mean() == pytest.approx(0.0)
+    assert distribution_value.distribution is distribution
+    assert distribution_value == DistributionValue(
+        distribution_name="norm", shape_parameters={"loc": 0.0, "scale": 1.0}
+    )
+
+
+def test_distribution_follows_changes(distribution_value):
+    assert distribution_value.distribution.mean() == pytest.approx(0.0)
+
+    distribution_value.shape_parameters = {"loc": 5.0, "scale": 1.0}
+    assert distribution_value.distribution.mean() == pytest.approx(5.0)
+
+    distribution_value.shape_parameters["loc"] = 2.0
+    assert distribution_value.distribution.mean() == pytest.approx(2.0)
+
+    distribution_value.distribution_name = "uniform"
+    assert distribution_value.distribution.mean() == pytest.approx(2.5)
+
+
+def test_distribution_of_copy(distribution_value):
+    assert distribution_value.distribution.mean() == pytest.approx(0.0)
+    copied = distribution_value.model_copy(
+        update={"shape_parameters": {"loc": 3.0, "scale": 1.0}}
+    )
+    assert copied.distribution.mean() == pytest.approx(3.0)
+    assert distribution_value.distribution.mean() == pytest.approx(0.0)
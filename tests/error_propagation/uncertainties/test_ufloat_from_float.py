@@ -1,9 +1,14 @@
 # type: ignore
+import numpy as np
 import pytest
 
 from pumas.uncertainty_management.uncertainties.ufloat_converters import (
     float_to_ufloat_conversion_catalogue,
+    get_converter,
     ufloat_from_float,
+    ufloat_from_float_lite,
+    ufloat_from_floats,
+    uncertain_values_from_floats,
 )
 from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import (
     UFloat,
@@ -100,3 +105,71 @@ def test_ufloat_from_float():
 def test_ufloat_from_float_invalid_method():
     with pytest.raises(ValueError):
         ufloat_from_float(value=5.0, method="invalid_method")
+
+
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("zero_uncertainty", {}),
+        ("fixed_value", {"fixed_uncertainty": 0.5}),
+        ("percentage_of_value", {"percentage": 10}),
+        ("multiplier", {"multiplier": 0.2}),
+    ],
+)
+def test_ufloat_from_floats(method, kwargs):
+    values = np.array([[1.0, 2.5], [4.0, 0.0]])
+    result = ufloat_from_floats(values, method, **kwargs)
+    assert result.shape == values.shape
+    for value, converted in zip(values.ravel(), result.ravel()):
+        expected = ufloat_from_float(value, method, **kwargs)
+        assert isinstance(converted, UFloat)
+        assert converted.nominal_value == pytest.approx(expected.nominal_value)
+        assert converted.std_dev == pytest.approx(expected.std_dev)
+
+
+def test_get_converter_is_memoized():
+    converter = get_converter("fixed_value", fixed_uncertainty=0.5)
+    assert get_converter("fixed_value", fixed_uncertainty=0.5) is converter
+    assert get_converter("fixed_value", fixed_uncertainty=0.2) is not converter
+
+    # Unhashable parameters build a new converter
+    unhashable = get_converter("fixed_value", fixed_uncertainty=[0.5])
+    assert unhashable.fixed_uncertainty == [0.5]
+
+
+def test_get_converter_invalid_parameters():
+    with pytest.raises(ValueError):
+        get_converter("percentage_of_value", percentage=150)
+    with pytest.raises(ValueError):
+        ufloat_from_float(value=5.0, method="percentage_of_value", percentage=150)
+
+
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("zero_uncertainty", {}),
+        ("fixed_value", {"fixed_uncertainty": 0.5}),
+        ("percentage_of_value", {"percentage": 10}),
+        ("multiplier", {"multiplier": 0.2}),
+    ],
+)
+def test_lite_conversions_match_ufloat(method, kwargs):
+    values = np.array([1.0, 2.5, 4.0, 0.0])
+    pairs = uncertain_values_from_floats(values, method, **kwargs)
+    assert pairs.shape == values.shape
+    for value, pair in zip(values, pairs):
+        expected = ufloat_from_float(value, method, **kwargs)
+        lite = ufloat_from_float_lite(value, method, **kwargs)
+        assert lite.nominal_value == pytest.approx(expected.nominal_value)
+        assert lite.std_dev == pytest.approx(expected.std_dev)
+        assert pair["nominal_value"] == pytest.approx(expected.nominal_value)
+        assert pair["std_dev"] == pytest.approx(expected.std_dev)
+
+
+def test_lite_conversions_negative_std_dev():
+    with pytest.raises(ValueError):
+        ufloat_from_float_lite(-5.0, "multiplier", multiplier=0.2)
+    with pytest.raises(ValueError):
+        uncertain_values_from_floats(
+            np.array([1.0, -5.0]), "percentage_of_value", percentage=10
+        )
@@ -0,0 +1,51 @@
+# type: ignore
+import pickle
+
+import numpy as np
+import pytest
+
+from pumas.uncertainty_management.uncertainties.models import UncertainValue
+from pumas.uncertainty_management.uncertainties.uncertainties_wrapper import ufloat
+
+
+def test_uncertain_value_from_dict():
+    value = UncertainValue.from_dict({"nominal_value": 1, "std": "0.5"})
+    assert value == UncertainValue(nominal_value=1.0, std_dev=0.5)
+    assert isinstance(value.nominal_value, float)
+    assert isinstance(value.std_dev, float)
+
+    with pytest.raises(ValueError):
+        UncertainValue.from_dict({"nominal_value": "a", "std": 0.5})
+
+
+def test_uncertain_value_ufloat_round_trip():
+    value = UncertainValue.from_ufloat(ufloat(2.0, 0.1))
+    assert value == UncertainValue(nominal_value=2.0, std_dev=0.1)
+    uf = value.to_ufloat()
+    assert uf.nominal_value == 2.0
+    assert uf.std_dev == 0.1
+
+
+def test_uncertain_value_is_frozen_and_picklable():
+    value = UncertainValue(nominal_value=2.0, std_dev=0.1)
+    with pytest.raises(AttributeError):
+        value.std_dev = 0.2
+    assert not hasattr(value, "__dict__")
+    assert pickle.loads(pickle.dumps(value)) == value
+
+
+def test_uncertain_value_ufloat_array_round_trip():
+    noms = np.array([[1.0, 2.5], [4.0, 0.0]])
+    stds = np.array([[0.1, 0.2], [0.0, 0.3]])
+    ufs = UncertainValue.to_ufloat_array(noms, stds)
+    assert ufs.shape == noms.shape
+    for uf, nom, std in zip(ufs.ravel(), noms.ravel(), stds.ravel()):
+        assert uf.nominal_value == nom
+        assert uf.std_dev == std
+
+    round_trip_noms, round_trip_stds = UncertainValue.from_ufloat_array(ufs)
+    np.testing.assert_array_equal(round_trip_noms, noms.ravel())
+    np.testing.assert_array_equal(round_trip_stds, stds.ravel())
+
+    empty_noms, empty_stds = UncertainValue.from_ufloat_array([])
+    assert empty_noms.shape == empty_stds.shape == (0,)
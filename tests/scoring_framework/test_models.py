@@ -1,3 +1,5 @@
+import pytest
+
 from pumas.scoring_framework.models import (
     InputData,
     ObjectPropertiesMap,
@@ -55,6 +57,53 @@ def test_input_data_validate_objective_data():
     assert input_data.validate_objectives(["obj1", "obj3"]) is False
 
 
+def test_input_data_from_trusted_dict():
+    """
+    Test that from_trusted_dict wraps each object in an ObjectPropertiesMap.
+    """
+    opm = ObjectPropertiesMap.model_validate({"obj1": 5, "obj2": 6})
+    input_data = InputData.from_trusted_dict(
+        {"item1": {"obj1": 1, "obj2": None}, "item2": opm}
+    )
+
+    assert input_data.data["item1"].data == {"obj1": 1, "obj2": None}
+    assert isinstance(input_data.data["item1"], ObjectPropertiesMap)
+    assert input_data.data["item2"] is opm
+    assert input_data.validate_objectives(["obj1", "obj2"]) is True
+
+
+def test_input_data_from_trusted_dict_invalid_data():
+    """
+    Test that from_trusted_dict rejects what the validating constructor rejects.
+    """
+    with pytest.raises(ValueError):
+        InputData(data={1: {"obj1": 1}})
+    with pytest.raises(ValueError):
+        InputData.from_trusted_dict({1: {"obj1": 1}})
+    with pytest.raises(ValueError):
+        InputData.from_trusted_dict({"item1": {2: 1}})
+    for values in (None, [1, 2], 5):
+        with pytest.raises(ValueError):
+            InputData(data={"item1": values})
+        with pytest.raises(ValueError):
+            InputData.from_trusted_dict({"item1": values})
+
+
+def test_input_data_to_soa():
+    """
+    Test the to_soa method of InputData.
+    """
+    opm1 = ObjectPropertiesMap.model_validate({"obj1": 1, "obj2": 2})
+    opm2 = ObjectPropertiesMap.model_validate({"obj1": 3, "obj2": None})
+    opm3 = ObjectPropertiesMap.model_validate({"obj2": 6})
+    input_data = InputData(data={"item1": opm1, "item2": opm2, "item3": opm3})
+
+    uids, columns = input_data.to_soa(["obj2", "obj1"])
+
+    assert uids == ["item1", "item2", "item3"]
+    assert columns == [[2, None, 6], [1, 3, None]]
+
+
 def test_scoring_result():
     """
     Test the creation and attribute access of ScoringResult.
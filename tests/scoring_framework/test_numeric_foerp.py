@@ -0,0 +1,91 @@
+from typing import Any
+
+import pytest
+from uncertainties import covariance_matrix, ufloat
+
+from pumas.scoring_framework.factory import ScoringStrategyFactory, StrategyType
+from pumas.scoring_framework.models import InputData
+from pumas.scoring_profile.scoring_profile import ScoringProfile
+
+
+@pytest.fixture
+def uncertain_data():
+    return {
+        f"compound{i}": {
+            "quality": {"nominal_value": 0.5 * i, "std_dev": 0.1},
+            "efficiency": {"nominal_value": 0.05 * i, "std_dev": 0.02},
+            "cost": {"nominal_value": 3.0 * i, "std_dev": 0.5 + 0.1 * i},
+        }
+        for i in range(40)
+    }
+
+
+def _create(sample_profile, uncertain_data, aggregation_name):
+    profile_data = sample_profile.model_dump()
+    profile_data["aggregation_function"] = {"name": aggregation_name, "parameters": {}}
+    profile = ScoringProfile.model_validate(profile_data)
+    strategy = ScoringStrategyFactory.create_strategy(StrategyType.FOERP, profile)
+    input_data = ScoringStrategyFactory.create_input_data(
+        StrategyType.FOERP, uncertain_data
+    )
+    return strategy, input_data
+
+
+@pytest.mark.parametrize("aggregation_name", ["arithmetic_mean", "geometric_mean"])
+def test_foerp_batch_matches_serial(sample_profile, uncertain_data, aggregation_name):
+    """The linearized batch path propagates the uncertainty of the serial path."""
+    strategy, input_data = _create(sample_profile, uncertain_data, aggregation_name)
+
+    expected = strategy.serial_process_with_uid(data=input_data.data)
+    results = strategy.batch_process_with_uid(data=input_data.data)
+
+    assert results is not None
+    assert list(results) == list(expected)
+    for uid, result in results.items():
+        expected_scores = expected[uid].desirability_scores
+        for name, score in result.desirability_scores.items():
+            assert score.n == pytest.approx(expected_scores[name].n)
+            assert score.s == pytest.approx(expected_scores[name].s)
+        aggregated_score = result.aggregated_score
+        expected_score = expected[uid].aggregated_score
+        assert aggregated_score.n == pytest.approx(expected_score.n)
+        assert aggregated_score.s == pytest.approx(expected_score.s)
+
+        # The scores stay correlated with the inputs
+        inputs = list(input_data.data[uid].values())
+        assert covariance_matrix([aggregated_score, *inputs])[0] == pytest.approx(
+            covariance_matrix([expected_score, *inputs])[0]
+        )
+
+
+def test_foerp_batch_skips_unsupported_aggregations(sample_profile, uncertain_data):
+    strategy, input_data = _create(sample_profile, uncertain_data, "harmonic_mean")
+
+    assert strategy.batch_process_with_uid(data=input_data.data) is None
+    results = strategy.compute(input_data)
+    assert len(results.results) == len(uncertain_data)
+
+
+def test_foerp_compute_keeps_correlation_with_shared_input(sample_profile):
+    """By default, results stay correlated with the inputs of the caller."""
+    shared_cost = ufloat(30.0, 2.0)
+    data = {
+        f"compound{i}": {
+            "quality": ufloat(0.01 * i, 0.1),
+            "efficiency": ufloat(0.001 * i, 0.02),
+            "cost": shared_cost,
+        }
+        for i in range(250)
+    }
+    strategy, _ = _create(sample_profile, {}, "harmonic_mean")
+    input_data = InputData[Any].from_trusted_dict(data)
+
+    results = strategy.compute(input_data, chunk_size=50)
+    expected = strategy.serial_process_with_uid(data=input_data.data)
+    for uid, result in results.results.items():
+        covariance = covariance_matrix([result.aggregated_score, shared_cost])[0][1]
+        expected_score = expected[uid].aggregated_score
+        assert covariance != 0.0
+        assert covariance == pytest.approx(
+            covariance_matrix([expected_score, shared_cost])[0][1]
+        )
@@ -0,0 +1,191 @@
+import os
+
+import numpy as np
+import pytest
+
+from pumas.architecture.exceptions import InvalidInputTypeError
+from pumas.scoring_framework import base_models
+from pumas.scoring_framework.base_models import resolve_num_jobs
+from pumas.scoring_framework.factory import ScoringStrategyFactory, StrategyType
+from pumas.scoring_framework.models import ScoringResult
+from pumas.scoring_profile.scoring_profile import ScoringProfile
+
+
+@pytest.fixture
+def numeric_data():
+    data = {
+        f"compound{i}": {"quality": 0.5 * i, "efficiency": 0.05 * i, "cost": 3 * i}
+        for i in range(40)
+    }
+    data["compound3"]["efficiency"] = None
+    data["compound7"] = {"quality": None, "efficiency": None, "cost": None}
+    return data
+
+
+@pytest.mark.parametrize(
+    "aggregation_name",
+    ["arithmetic_mean", "geometric_mean", "harmonic_mean", "summation", "product"],
+)
+def test_numeric_batch_matches_serial(sample_profile, numeric_data, aggregation_name):
+    """The vectorized path gives the results of the per-object path."""
+    profile_data = sample_profile.model_dump()
+    profile_data["aggregation_function"] = {"name": aggregation_name, "parameters": {}}
+    profile = ScoringProfile.model_validate(profile_data)
+    strategy = ScoringStrategyFactory.create_strategy(StrategyType.NUMERIC, profile)
+    input_data = ScoringStrategyFactory.create_input_data(
+        StrategyType.NUMERIC, numeric_data
+    )
+
+    with pytest.warns(UserWarning):
+        expected = strategy.serial_process_with_uid(data=input_data.data)
+        results = strategy.batch_process_with_uid(data=input_data.data)
+
+    assert list(results) == list(expected)
+    for uid, result in results.items():
+        assert result.desirability_scores == pytest.approx(
+            dict(expected[uid].desirability_scores)
+        )
+        assert result.aggregated_score == pytest.approx(
+            expected[uid].aggregated_score, nan_ok=True
+        )
+    assert results["compound3"].desirability_scores["efficiency"] is None
+
+
+def test_numeric_compute_uses_serial_path_for_small_inputs(
+    sample_profile, sample_numeric_data
+):
+    strategy = ScoringStrategyFactory.create_strategy(
+        StrategyType.NUMERIC, sample_profile
+    )
+    input_data = ScoringStrategyFactory.create_input_data(
+        StrategyType.NUMERIC, sample_numeric_data
+    )
+    results = strategy.compute(input_data)
+    expected = strategy.serial_process_with_uid(data=input_data.data)
+    assert {uid: r.aggregated_score for uid, r in results.items()} == {
+        uid: r.aggregated_score for uid, r in expected.items()
+    }
+
+
+def test_numeric_process_with_uid_in_chunks_matches_serial(
+    sample_profile, numeric_data
+):
+    """Scoring chunks in worker processes gives the serial results."""
+    strategy = ScoringStrategyFactory.create_strategy(
+        StrategyType.NUMERIC, sample_profile
+    )
+    input_data = ScoringStrategyFactory.create_input_data(
+        StrategyType.NUMERIC, numeric_data
+    )
+
+    with pytest.warns(UserWarning):
+        expected = strategy.serial_process_with_uid(data=input_data.data)
+    results = strategy.process_with_uid(
+        data=input_data.data,
+        result_type=ScoringResult[float],
+        chunk_size=15,
+        n_jobs=2,
+    )
+
+    assert list(results) == list(expected)
+    for uid, result in results.items():
+        assert result.desirability_scores == pytest.approx(
+            dict(expected[uid].desirability_scores)
+        )
+        assert result.aggregated_score == pytest.approx(
+            expected[uid].aggregated_score, nan_ok=True
+        )
+
+
+@pytest.mark.parametrize("n_jobs, expected", [(1, 1), (3, 3), (0, 0)])
+def test_resolve_num_jobs(n_jobs, expected):
+    assert resolve_num_jobs(n_jobs) == expected
+
+
+def test_resolve_num_jobs_counts_back_from_cpus():
+    assert resolve_num_jobs(-1) == (os.cpu_count() or 1)
+    assert resolve_num_jobs(-1000) == 1
+
+
+def test_numeric_compute_skips_validation(sample_profile):
+    strategy = ScoringStrategyFactory.create_strategy(
+        StrategyType.NUMERIC, sample_profile
+    )
+    input_data = ScoringStrategyFactory.create_input_data(
+        StrategyType.NUMERIC, {"compound0": {"quality": 2.5, "efficiency": 0.5}}
+    )
+
+    with pytest.raises(ValueError, match="missing required objectives"):
+        strategy.compute(input_data)
+
+    with pytest.warns(UserWarning):
+        results = strategy.compute(input_data, validate=False)
+    assert results["compound0"].desirability_scores["cost"] is None
+
+
+def test_numeric_batch_accepts_numpy_floats(sample_profile):
+    strategy = ScoringStrategyFactory.create_strategy(
+        StrategyType.NUMERIC, sample_profile
+    )
+    input_data = ScoringStrategyFactory.create_input_data(
+        StrategyType.NUMERIC,
+        {
+            f"compound{i}": {
+                "quality": np.float64(0.5 * i),
+                "efficiency": np.float64(0.05 * i),
+                "cost": np.float64(3.0 * i),
+            }
+            for i in range(40)
+        },
+    )
+
+    expected = strategy.serial_process_with_uid(data=input_data.data)
+    results = strategy.batch_process_with_uid(data=input_data.data)
+
+    assert results is not None
+    for uid, result in results.items():
+        assert result.aggregated_score == pytest.approx(
+            expected[uid].aggregated_score
+        )
+
+
+def test_numeric_batch_rejects_inputs_rejected_by_desirabilities(
+    sample_profile, numeric_data
+):
+    """Inputs rejected per object are also rejected by the batch path."""
+    profile_data = sample_profile.model_dump()
+    profile_data["objectives"][2]["desirability_function"] = {
+        "name": "sigmoid_bell",
+        "parameters": {"x1": 0.0, "x2": 20.0, "x3": 60.0, "x4": 100.0},
+    }
+    profile = ScoringProfile.model_validate(profile_data)
+    strategy = ScoringStrategyFactory.create_strategy(StrategyType.NUMERIC, profile)
+    # The cost values are ints, which SigmoidBell.compute_numeric rejects
+    input_data = ScoringStrategyFactory.create_input_data(
+        StrategyType.NUMERIC, numeric_data
+    )
+
+    assert strategy.batch_process_with_uid(data=input_data.data) is None
+    with pytest.raises(InvalidInputTypeError):
+        strategy.compute(input_data)
+
+
+def test_numeric_compute_is_serial_by_default(sample_profile, monkeypatch):
+    """Worker processes are only started when the caller asks for them."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("worker processes were started")
+
+    monkeypatch.setattr(base_models, "parallelize", fail)
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    strategy = ScoringStrategyFactory.create_strategy(
+        StrategyType.NUMERIC, sample_profile
+    )
+    # Strings make the batch path decline, as do any unsupported values
+    data = {
+        f"compound{i}": {"quality": 1.0, "efficiency": 0.5, "cost": "x"}
+        for i in range(250)
+    }
+    input_data = ScoringStrategyFactory.create_input_data(StrategyType.NUMERIC, data)
+    with pytest.raises(InvalidInputTypeError):
+        strategy.compute(input_data)
@@ -29,3 +29,21 @@ def test_input_data_creation(strategy_type, data_fixture, request):
     input_data = ScoringStrategyFactory.create_input_data(strategy_type, data)
     assert input_data is not None
     assert len(input_data.data) == 10
+
+
+@pytest.mark.parametrize("num_objectives", [1, 3])
+def test_score_computer_reads_missing_values_as_none(sample_profile, num_objectives):
+    profile = sample_profile.model_copy(
+        update={"objectives": sample_profile.objectives[:num_objectives]}
+    )
+    strategy = ScoringStrategyFactory.create_strategy(StrategyType.NUMERIC, profile)
+    score_computer = strategy.scoring_function.score_computer
+
+    _, complete_scores = score_computer.compute_scores(
+        {"quality": 2.5, "efficiency": 0.5, "cost": 30.0}
+    )
+    _, missing_scores = score_computer.compute_scores({"efficiency": 0.5})
+
+    assert list(complete_scores) == list(missing_scores)
+    assert missing_scores["quality"] is None
+    assert complete_scores["quality"] is not None
@@ -1,13 +1,33 @@
 # type: ignore
+import multiprocessing
+import threading
+
+import numpy as np
 import pytest
 
-from pumas.parallelization.parallel_utils import parallelize, parallelize_with_indices
+from pumas.parallelization.parallel_utils import (
+    parallelize,
+    parallelize_array,
+    parallelize_with_indices,
+)
 
 
 def square(x):
     return x**2
 
 
+_offset = 0
+
+
+def set_offset(offset):
+    global _offset
+    _offset = offset
+
+
+def add_offset(x):
+    return x + _offset
+
+
 def test_parallelize_serial():
     data = [1, 2, 3, 4, 5]
     result = parallelize(func=square, data=data, num_jobs=0)
@@ -128,3 +148,104 @@ def test_parallelize_with_indices_processes_on_scrambled_data(scrambled_data):
     )
     expected_result = [(10, 1), (3, 4), (15, 9), (8, 16), (6, 25)]
     assert result == expected_result
+
+
+@pytest.mark.parametrize("num_jobs", [0, 1, 3])
+@pytest.mark.parametrize("shape", [(10,), (7, 5), (0,)])
+def test_parallelize_array(num_jobs, shape):
+    array = np.arange(np.prod(shape), dtype=float).reshape(shape)
+    result = parallelize_array(np.square, array, num_jobs=num_jobs, min_chunk_size=4)
+    assert result.shape == shape
+    np.testing.assert_array_equal(result, np.square(array))
+
+
+def test_parallelize_array_invalid_num_jobs():
+    with pytest.raises(ValueError):
+        parallelize_array(np.square, np.arange(10), num_jobs=-1)
+
+
+def test_parallelize_processes_on_generator():
+    """Iterables without a length are materialized before chunking."""
+    data = (x for x in range(50))
+    result = parallelize(func=square, data=data, num_jobs=2, method="processes")
+    assert result == [x**2 for x in range(50)]
+
+
+@pytest.mark.parametrize("num_jobs, data", [(1, [1, 2, 3]), (4, [3]), (4, [])])
+def test_parallelize_runs_trivial_inputs_in_process(num_jobs, data):
+    """A single worker or item is computed without pickling the function."""
+    result = parallelize(
+        func=lambda x: x**2, data=data, num_jobs=num_jobs, method="processes"
+    )
+    assert result == [x**2 for x in data]
+
+
+@pytest.mark.parametrize("num_jobs, data", [(0, [1, 2]), (2, [1, 2, 3, 4, 5])])
+def test_parallelize_initializer(num_jobs, data):
+    """The initializer prepares the state of the workers, not of the caller."""
+    result = parallelize(
+        func=add_offset,
+        data=data,
+        num_jobs=num_jobs,
+        method="processes",
+        initializer=set_offset,
+        initargs=(10,),
+    )
+    assert result == [x + 10 for x in data]
+    assert _offset == 0
+
+
+def test_parallelize_initializer_requires_processes():
+    with pytest.raises(ValueError):
+        parallelize(
+            func=add_offset,
+            data=[1, 2],
+            num_jobs=2,
+            method="threads",
+            initializer=set_offset,
+            initargs=(10,),
+        )
+    assert _offset == 0
+
+
+def _parallelize_threads_in_child():
+    assert parallelize(func=square, data=[1, 2, 3], num_jobs=2) == [1, 4, 9]
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="requires the fork start method",
+)
+def test_parallelize_threads_after_fork():
+    # Use the shared thread pool before forking
+    assert parallelize(func=square, data=[1, 2, 3], num_jobs=2) == [1, 4, 9]
+
+    child = multiprocessing.get_context("fork").Process(
+        target=_parallelize_threads_in_child
+    )
+    child.start()
+    child.join(timeout=30)
+    if child.is_alive():
+        child.kill()
+        child.join()
+        pytest.fail("parallelize hung in the forked child")
+    assert child.exitcode == 0
+
+
+def _sum_of_squares_in_threads(n):
+    return sum(parallelize(func=square, data=list(range(n)), num_jobs=2))
+
+
+def test_parallelize_nested_threads():
+    # Tasks mapping their own items in threads must not wait on each other
+    results = []
+    outer = threading.Thread(
+        target=lambda: results.extend(
+            parallelize(func=_sum_of_squares_in_threads, data=[3, 4, 5], num_jobs=2)
+        ),
+        daemon=True,
+    )
+    outer.start()
+    outer.join(timeout=30)
+    assert not outer.is_alive(), "nested parallelize calls deadlocked"
+    assert results == [5, 14, 30]